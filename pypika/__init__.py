@@ -70,9 +70,12 @@ from pypika.queries import (
     AliasedQuery,
     Column,
     Database,
+    Hint,
     Query,
+    QueryLabel,
     Schema,
     Table,
+    ValuesTable,
 )
 from pypika.queries import (
     make_columns as Columns,
@@ -109,6 +112,7 @@ from pypika.terms import (
 # noinspection PyUnresolvedReferences
 from pypika.utils import (
     CaseException,
+    DialectNotSupported,
     FunctionException,
     GroupingException,
     JoinException,
@@ -139,9 +143,12 @@ __all__ = (
     'JoinType',
     'Order',
     'AliasedQuery',
+    'Hint',
     'Query',
+    'QueryLabel',
     'Schema',
     'Table',
+    'ValuesTable',
     'Column',
     'Database',
     'Tables',
@@ -168,6 +175,7 @@ __all__ = (
     'Tuple',
     'CustomFunction',
     'CaseException',
+    'DialectNotSupported',
     'GroupingException',
     'JiraQuery',
     'JoinException',
@@ -0,0 +1,220 @@
+"""
+ClickHouse aggregate functions with support for combinators.
+
+Combinators are appended to the function name in the order they are applied, e.g. ``Sum(x).if_(cond).state()``
+renders ``sumIfState(x,cond)``. The -State and -Merge variants of a function are derived from a single definition, so
+the query populating an AggregatingMergeTree table and the rollup query reading it cannot drift apart::
+
+    users = Uniq(events.user_id)
+    insert = ClickHouseQuery.into(daily).from_(events).select(events.day, users.state())
+    rollup = ClickHouseQuery.from_(daily).select(users.merge(daily.users))
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+from pypika.terms import AggregateFunction, Field, NodeT, Term
+from pypika.utils import QueryException, builder
+
+# Combinators changing the result of the function, kept when merging states.
+RESULT_COMBINATORS = ("OrDefault", "OrNull")
+# Combinators changing the type of the state, kept before -Merge and -MergeState.
+STATE_COMBINATORS = ("Array", "Distinct")
+
+
+class ClickHouseAggregateFunction(AggregateFunction):
+    """
+    An aggregate function which can be extended with combinators.
+
+    :param name:
+        The name of the function without combinators, e.g. ``uniq``.
+    :param args:
+        The arguments of the function.
+    :param params:
+        The parameters of a parametric function, rendered in a separate parenthesis before the arguments, e.g. the
+        levels of ``quantiles(0.5,0.9)(x)``.
+    """
+
+    def __init__(self, name: str, *args: Any, params: list | None = None, alias: str | None = None) -> None:
+        super().__init__(name, *args, alias=alias)
+        self.base_name = name
+        self.params = [self.wrap_constant(param) for param in params or []]
+        self.combinators = []
+
+    def nodes_(self) -> Iterator[NodeT]:
+        yield from super().nodes_()
+        for param in self.params:
+            yield from param.nodes_()
+
+    def _combine(self, combinator: str, *args: Any) -> None:
+        self.combinators = self.combinators + [combinator]
+        self.args = self.args + [self.wrap_constant(arg) for arg in args]
+        self.name = self.base_name + "".join(self.combinators)
+
+    @builder
+    def if_(self, condition: Term) -> None:
+        """
+        Adds the -If combinator, aggregating only the rows matching the condition.
+        """
+        self._combine("If", condition)
+
+    @builder
+    def array(self) -> None:
+        """
+        Adds the -Array combinator, aggregating the elements of array arguments.
+        """
+        self._combine("Array")
+
+    @builder
+    def distinct(self) -> None:
+        """
+        Adds the -Distinct combinator, aggregating each distinct combination of arguments once.
+        """
+        self._combine("Distinct")
+
+    @builder
+    def or_default(self) -> None:
+        """
+        Adds the -OrDefault combinator, returning the default value of the result type when there is nothing to
+        aggregate.
+        """
+        self._combine("OrDefault")
+
+    @builder
+    def or_null(self) -> None:
+        """
+        Adds the -OrNull combinator, returning NULL when there is nothing to aggregate.
+        """
+        self._combine("OrNull")
+
+    @builder
+    def state(self) -> None:
+        """
+        Adds the -State combinator, returning the intermediate state of the aggregation instead of its result.
+        """
+        if "State" in self.combinators:
+            raise QueryException("Function {name} already returns a state".format(name=self.name))
+        self._combine("State")
+
+    def merge(self, state: Term | str, alias: str | None = None) -> ClickHouseAggregateFunction:
+        """
+        Returns the -Merge counterpart of this function, which finalizes the states stored in the given column.
+
+        The -If and -State combinators were applied when the states were built and are dropped. The -Array and
+        -Distinct combinators are part of the type of the states and the result combinators (-OrDefault, -OrNull)
+        change the result, so they are kept, e.g. ``sumDistinctMergeOrNull``.
+
+        :param state:
+            The column holding the states produced by `state`.
+        """
+        return self._merged(state, "Merge", alias)
+
+    def merge_state(self, state: Term | str, alias: str | None = None) -> ClickHouseAggregateFunction:
+        """
+        Returns the -MergeState counterpart of this function, which combines states into a new state. This is used
+        to roll pre-aggregated states up to a coarser granularity. The -Array and -Distinct combinators are kept, the
+        result combinators are dropped, as they only apply to the final value.
+        """
+        return self._merged(state, "MergeState", alias)
+
+    def _merged(self, state: Term | str, combinator: str, alias: str | None) -> ClickHouseAggregateFunction:
+        if isinstance(state, str):
+            state = Field(state)
+
+        merged = ClickHouseAggregateFunction(self.base_name, state, params=list(self.params), alias=alias)
+        for state_combinator in self.combinators:
+            if state_combinator in STATE_COMBINATORS:
+                merged._combine(state_combinator)
+        merged._combine(combinator)
+        if combinator == "Merge":
+            for result_combinator in self.combinators:
+                if result_combinator in RESULT_COMBINATORS:
+                    merged._combine(result_combinator)
+        return merged
+
+    def get_function_sql(self, **kwargs: Any) -> str:
+        sql = super().get_function_sql(**kwargs)
+        if not self.params:
+            return sql
+
+        return "{name}({params}){args}".format(
+            name=self.name,
+            params=",".join(param.get_sql(with_alias=False, **kwargs) for param in self.params),
+            args=sql[len(self.name) :],
+        )
+
+
+class Count(ClickHouseAggregateFunction):
+    def __init__(self, term: Term | None = None, alias: str | None = None) -> None:
+        super().__init__("count", *([] if term is None else [term]), alias=alias)
+
+
+class Sum(ClickHouseAggregateFunction):
+    def __init__(self, term: Term, alias: str | None = None) -> None:
+        super().__init__("sum", term, alias=alias)
+
+
+class Avg(ClickHouseAggregateFunction):
+    def __init__(self, term: Term, alias: str | None = None) -> None:
+        super().__init__("avg", term, alias=alias)
+
+
+class Min(ClickHouseAggregateFunction):
+    def __init__(self, term: Term, alias: str | None = None) -> None:
+        super().__init__("min", term, alias=alias)
+
+
+class Max(ClickHouseAggregateFunction):
+    def __init__(self, term: Term, alias: str | None = None) -> None:
+        super().__init__("max", term, alias=alias)
+
+
+class Uniq(ClickHouseAggregateFunction):
+    def __init__(self, *terms: Term, alias: str | None = None) -> None:
+        super().__init__("uniq", *terms, alias=alias)
+
+
+class UniqExact(ClickHouseAggregateFunction):
+    def __init__(self, *terms: Term, alias: str | None = None) -> None:
+        super().__init__("uniqExact", *terms, alias=alias)
+
+
+class ArgMin(ClickHouseAggregateFunction):
+    def __init__(self, arg: Term, value: Term, alias: str | None = None) -> None:
+        super().__init__("argMin", arg, value, alias=alias)
+
+
+class ArgMax(ClickHouseAggregateFunction):
+    def __init__(self, arg: Term, value: Term, alias: str | None = None) -> None:
+        super().__init__("argMax", arg, value, alias=alias)
+
+
+class Quantile(ClickHouseAggregateFunction):
+    def __init__(self, term: Term, level: float = 0.5, alias: str | None = None) -> None:
+        super().__init__("quantile", term, params=[level], alias=alias)
+
+
+class Quantiles(ClickHouseAggregateFunction):
+    def __init__(self, term: Term, *levels: float, alias: str | None = None) -> None:
+        if not levels:
+            raise QueryException("quantiles requires at least one level")
+        super().__init__("quantiles", term, params=list(levels), alias=alias)
+
+
+class TopK(ClickHouseAggregateFunction):
+    def __init__(self, term: Term, k: int = 10, alias: str | None = None) -> None:
+        super().__init__("topK", term, params=[k], alias=alias)
+
+
+class SumIf(Sum):
+    def __init__(self, term: Term, condition: Term, alias: str | None = None) -> None:
+        super().__init__(term, alias=alias)
+        self._combine("If", condition)
+
+
+class CountIf(Count):
+    def __init__(self, condition: Term, alias: str | None = None) -> None:
+        super().__init__(alias=alias)
+        self._combine("If", condition)
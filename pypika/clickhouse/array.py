@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import abc
+import inspect
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any
 
+from pypika.clickhouse.aggregate import ClickHouseAggregateFunction
 from pypika.terms import (
     Field,
     Function,
+    NodeT,
     Term,
 )
 from pypika.utils import format_alias_sql
@@ -19,18 +24,22 @@ class Array(Term):
         self._converter_cls = converter_cls
         self._converter_options = converter_options or dict()
 
-    def get_sql(self):
-        if self._converter_cls:
-            converted = []
-            for value in self._values:
-                converter = self._converter_cls(value, **self._converter_options)
-                converted.append(converter.get_sql())
-            sql = "".join(["[", ",".join(converted), "]"])
+    def nodes_(self) -> Iterator[NodeT]:
+        yield self
+        for value in self._values:
+            if isinstance(value, Term):
+                yield from value.nodes_()
 
+    def get_sql(self, with_alias: bool = True, **kwargs: Any) -> str:
+        if self._converter_cls:
+            values = [self._converter_cls(value, **self._converter_options) for value in self._values]
         else:
-            sql = str(self._values)
+            values = [self.wrap_constant(value) for value in self._values]
 
-        return format_alias_sql(sql, self.alias)
+        kwargs.setdefault("secondary_quote_char", "'")
+        sql = "[{values}]".format(values=",".join(value.get_sql(**kwargs) for value in values))
+
+        return format_alias_sql(sql, self.alias if with_alias else None, **kwargs)
 
 
 class HasAny(Function):
@@ -96,3 +105,73 @@ class Length(_AbstractArrayFunction):
     @classmethod
     def clickhouse_function(cls) -> str:
         return "length"
+
+
+class LambdaParameter(Term):
+    """
+    A parameter of a lambda expression, rendered by its bare name.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+
+    def get_sql(self, **kwargs: Any) -> str:
+        return self.name
+
+
+class Lambda(Term):
+    """
+    A ClickHouse lambda expression, e.g. ``x -> x * 2``, used as the first argument of the higher-order array functions.
+
+    The body can either be given as a term built from `LambdaParameter` instances, or the lambda can be created from a
+    Python callable with `Lambda.from_callable`, which calls it with one `LambdaParameter` per argument.
+    """
+
+    def __init__(self, params: str | Sequence[str], body: Any, alias: str | None = None) -> None:
+        super().__init__(alias)
+        self.params = [params] if isinstance(params, str) else list(params)
+        self.body = self.wrap_constant(body)
+
+    @classmethod
+    def from_callable(cls, function: Callable[..., Any]) -> Lambda:
+        params = list(inspect.signature(function).parameters)
+        return cls(params, function(*[LambdaParameter(param) for param in params]))
+
+    def nodes_(self) -> Iterator[NodeT]:
+        yield self
+        yield from self.body.nodes_()
+
+    def get_sql(self, **kwargs: Any) -> str:
+        params = self.params[0] if len(self.params) == 1 else "({})".format(",".join(self.params))
+        return "{params}->{body}".format(params=params, body=self.body.get_sql(**kwargs))
+
+
+def _lambda(function: Lambda | Callable[..., Any]) -> Lambda:
+    return function if isinstance(function, Lambda) else Lambda.from_callable(function)
+
+
+class ArrayMap(Function):
+    def __init__(self, function: Lambda | Callable[..., Any], *arrays: Term, alias: str | None = None) -> None:
+        super().__init__("arrayMap", _lambda(function), *arrays, alias=alias)
+
+
+class ArrayFilter(Function):
+    def __init__(self, function: Lambda | Callable[..., Any], *arrays: Term, alias: str | None = None) -> None:
+        super().__init__("arrayFilter", _lambda(function), *arrays, alias=alias)
+
+
+class ArrayExists(Function):
+    def __init__(self, function: Lambda | Callable[..., Any] | None, *arrays: Term, alias: str | None = None) -> None:
+        args = arrays if function is None else (_lambda(function), *arrays)
+        super().__init__("arrayExists", *args, alias=alias)
+
+
+class ArrayReduce(Function):
+    def __init__(self, aggregate: str, *arrays: Term, alias: str | None = None) -> None:
+        super().__init__("arrayReduce", aggregate, *arrays, alias=alias)
+
+
+class GroupArray(ClickHouseAggregateFunction):
+    def __init__(self, term: Term, max_size: int | None = None, alias: str | None = None) -> None:
+        super().__init__("groupArray", term, params=None if max_size is None else [max_size], alias=alias)
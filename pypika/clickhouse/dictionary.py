@@ -0,0 +1,119 @@
+"""
+ClickHouse dictionaries: lookup functions, the SOURCE and LAYOUT clauses of CREATE DICTIONARY, and the rewrite of a
+LEFT JOIN on a dictionary-backed table into dictionary lookups.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pypika.enums import Boolean, Equality, JoinType
+from pypika.queries import Join, JoinOn, JoinUsing, Selectable, Table
+from pypika.terms import BasicCriterion, ComplexCriterion, Field, Function, Term, Tuple, ValueWrapper
+from pypika.utils import QueryException
+
+
+def _attributes(attribute: str | list[str] | tuple[str, ...]) -> str | Tuple:
+    return attribute if isinstance(attribute, str) else Tuple(*attribute)
+
+
+class DictGet(Function):
+    """
+    Looks up one attribute, or a tuple of attributes, of a dictionary. The key is a tuple for complex key
+    dictionaries.
+    """
+
+    def __init__(
+        self, dictionary: str, attribute: str | list[str] | tuple[str, ...], key: Any, alias: str | None = None
+    ) -> None:
+        super().__init__("dictGet", dictionary, _attributes(attribute), key, alias=alias)
+
+
+class DictGetOrDefault(Function):
+    def __init__(
+        self,
+        dictionary: str,
+        attribute: str | list[str] | tuple[str, ...],
+        key: Any,
+        default: Any,
+        alias: str | None = None,
+    ) -> None:
+        super().__init__("dictGetOrDefault", dictionary, _attributes(attribute), key, default, alias=alias)
+
+
+class DictHas(Function):
+    def __init__(self, dictionary: str, key: Any, alias: str | None = None) -> None:
+        super().__init__("dictHas", dictionary, key, alias=alias)
+
+
+class _DictionaryClause:
+    def __init__(self, name: str, **parameters: Any) -> None:
+        self.name = name.upper()
+        self.parameters = parameters
+
+    def get_sql(self, **kwargs: Any) -> str:
+        return "{name}({parameters})".format(
+            name=self.name,
+            parameters=" ".join(
+                "{key} {value}".format(
+                    key=key.upper(), value=ValueWrapper.get_formatted_value(value, secondary_quote_char="'")
+                )
+                for key, value in self.parameters.items()
+            ),
+        )
+
+    def __str__(self) -> str:
+        return self.get_sql()
+
+
+class DictionarySource(_DictionaryClause):
+    """
+    The source of a dictionary, e.g. ``DictionarySource("clickhouse", table="users", db="default")`` renders
+    ``CLICKHOUSE(TABLE 'users' DB 'default')``.
+    """
+
+
+class DictionaryLayout(_DictionaryClause):
+    """
+    The layout of a dictionary in memory, e.g. ``DictionaryLayout("hashed", shards=16)`` renders
+    ``HASHED(SHARDS 16)``.
+    """
+
+    @property
+    def is_range(self) -> bool:
+        return "RANGE" in self.name
+
+
+def _equalities(criterion: Term) -> list[BasicCriterion]:
+    if isinstance(criterion, ComplexCriterion) and criterion.comparator == Boolean.and_:
+        return _equalities(criterion.left) + _equalities(criterion.right)
+    if isinstance(criterion, BasicCriterion) and criterion.comparator == Equality.eq:
+        return [criterion]
+    raise QueryException("Only joins on equalities can be rewritten as dictionary lookups, got {}".format(criterion))
+
+
+def dictionary_join_key(join: Join, table: Table, base_table: Selectable) -> tuple[list[str], Term]:
+    """
+    Returns the key columns of the dictionary-backed table and the expression giving the key of each row, from the
+    condition of a LEFT JOIN. Composite keys are returned as a tuple, in the order of the join condition.
+    """
+    if join.how not in (JoinType.left, JoinType.left_outer, JoinType.left_any):
+        raise QueryException("Only LEFT JOINs can be rewritten as dictionary lookups")
+
+    if isinstance(join, JoinUsing):
+        columns = [field.name for field in join.fields]
+        expressions = [Field(column, table=base_table) for column in columns]
+    elif isinstance(join, JoinOn):
+        columns, expressions = [], []
+        for equality in _equalities(join.criterion):
+            for key, expression in ((equality.left, equality.right), (equality.right, equality.left)):
+                if isinstance(key, Field) and key.table == table:
+                    columns.append(key.name)
+                    expressions.append(expression)
+                    break
+            else:
+                raise QueryException("The join condition {} does not use the joined table".format(equality))
+    else:
+        raise QueryException("Only joins with a condition can be rewritten as dictionary lookups")
+
+    return columns, expressions[0] if len(expressions) == 1 else Tuple(*expressions)
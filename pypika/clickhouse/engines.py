@@ -0,0 +1,122 @@
+"""
+Table engines used by `ClickHouseCreateQueryBuilder.engine`.
+
+Column arguments can be given as strings or terms, while paths, cluster and table names are rendered as string
+literals.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pypika.terms import Field, Function, Term, Tuple
+
+
+def _column(column: str | Term) -> Term:
+    return Field(column) if isinstance(column, str) else column
+
+
+class Engine(Function):
+    """
+    Base class of the table engines, rendered like a function call, e.g. ``MergeTree()``.
+    """
+
+    def __init__(self, name: str, *args: Any) -> None:
+        super().__init__(name, *args)
+
+
+class MergeTree(Engine):
+    def __init__(self, *args: Any) -> None:
+        super().__init__(self.engine_name(), *args)
+
+    @classmethod
+    def engine_name(cls) -> str:
+        return cls.__name__
+
+    def replicated(self, zookeeper_path: str, replica_name: str = "{replica}") -> Engine:
+        """
+        Returns the Replicated variant of the engine, e.g. ``ReplicatedReplacingMergeTree(path,replica,ver)``.
+
+        :param zookeeper_path:
+            The path of the table in ZooKeeper, macros like ``{shard}`` are expanded by the server.
+        :param replica_name:
+            The name of the replica in ZooKeeper.
+        """
+        return Engine("Replicated" + self.name, zookeeper_path, replica_name, *self.args)
+
+
+class ReplacingMergeTree(MergeTree):
+    def __init__(self, version: str | Term | None = None, is_deleted: str | Term | None = None) -> None:
+        args = [_column(column) for column in (version, is_deleted) if column is not None]
+        super().__init__(*args)
+
+
+class SummingMergeTree(MergeTree):
+    def __init__(self, *columns: str | Term) -> None:
+        super().__init__(*([Tuple(*[_column(column) for column in columns])] if columns else []))
+
+
+class AggregatingMergeTree(MergeTree):
+    pass
+
+
+class CollapsingMergeTree(MergeTree):
+    def __init__(self, sign: str | Term) -> None:
+        super().__init__(_column(sign))
+
+
+class VersionedCollapsingMergeTree(MergeTree):
+    def __init__(self, sign: str | Term, version: str | Term) -> None:
+        super().__init__(_column(sign), _column(version))
+
+
+class ReplicatedMergeTree(Engine):
+    def __init__(self, zookeeper_path: str, replica_name: str = "{replica}") -> None:
+        super().__init__("ReplicatedMergeTree", zookeeper_path, replica_name)
+
+
+class Distributed(Engine):
+    """
+    Engine spreading the queries over the shards of a cluster, each one holding the data in a local table.
+
+    :param sharding_key:
+        The expression used to pick the shard of inserted rows, e.g. ``Rand()`` or a hash of a column.
+    """
+
+    def __init__(
+        self,
+        cluster: str,
+        database: str,
+        table: str,
+        sharding_key: Term | None = None,
+        policy_name: str | None = None,
+    ) -> None:
+        args = [cluster, database, table]
+        if sharding_key is not None:
+            args.append(sharding_key)
+            if policy_name is not None:
+                args.append(policy_name)
+        super().__init__("Distributed", *args)
+
+
+class Buffer(Engine):
+    """
+    Engine buffering inserted rows in memory and flushing them to the destination table once any maximum or all
+    minimums are reached.
+    """
+
+    def __init__(
+        self,
+        database: str,
+        table: str,
+        num_layers: int = 16,
+        min_time: int = 10,
+        max_time: int = 100,
+        min_rows: int = 10000,
+        max_rows: int = 1000000,
+        min_bytes: int = 10000000,
+        max_bytes: int = 100000000,
+    ) -> None:
+        super().__init__(
+            "Buffer", database, table, num_layers, min_time, max_time, min_rows, max_rows, min_bytes, max_bytes
+        )
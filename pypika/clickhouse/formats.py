@@ -0,0 +1,268 @@
+"""
+Encoders turning rows into the payload of a ClickHouse ``INSERT ... FORMAT`` query.
+
+The encoders are generators yielding chunks of roughly ``chunk_size`` bytes, so large inserts can be streamed to the
+server without materializing the whole payload. Each chunk is a memoryview over a buffer owned by that chunk only.
+"""
+
+from __future__ import annotations
+
+import calendar
+import datetime
+import json
+import struct
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from pypika.clickhouse.type_conversion import (
+    ToDate,
+    ToDateTime,
+    ToFixedString,
+    ToFloat32,
+    ToFloat64,
+    ToInt8,
+    ToInt16,
+    ToInt32,
+    ToInt64,
+    ToString,
+    ToUInt8,
+    ToUInt16,
+    ToUInt32,
+    ToUInt64,
+)
+from pypika.utils import QueryException
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+# The formats for which `encode_rows` has an encoder
+ENCODED_FORMATS = ("RowBinary", "TabSeparated", "TSV", "JSONEachRow")
+
+_EPOCH = datetime.date(1970, 1, 1)
+
+_STRUCT_CODES = {
+    ToInt8: "b",
+    ToInt16: "h",
+    ToInt32: "i",
+    ToInt64: "q",
+    ToUInt8: "B",
+    ToUInt16: "H",
+    ToUInt32: "I",
+    ToUInt64: "Q",
+    ToFloat32: "f",
+    ToFloat64: "d",
+    ToDate: "H",
+    ToDateTime: "I",
+}
+
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\0": "\\0"})
+
+
+def _date_value(value: Any) -> int:
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    if isinstance(value, datetime.date):
+        return (value - _EPOCH).days
+    return value
+
+
+def _datetime_value(value: Any) -> int:
+    if isinstance(value, datetime.datetime):
+        return calendar.timegm(value.utctimetuple())
+    if isinstance(value, datetime.date):
+        return calendar.timegm(value.timetuple())
+    return value
+
+
+def _to_bytes(value: Any) -> bytes:
+    return value if isinstance(value, (bytes, bytearray, memoryview)) else str(value).encode("utf-8")
+
+
+def _varint(value: int) -> bytes:
+    # Unsigned LEB128, as used by ClickHouse for string lengths
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def format_tsv_value(value: Any) -> str:
+    """
+    Formats a value in the escaped text format of TabSeparated, which is also the format of query parameters.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, datetime.datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode("utf-8")
+    return str(value).translate(_TSV_ESCAPES)
+
+
+class RowEncoder:
+    """
+    Base class of the encoders. Subclasses implement `encode_row`, which appends a single encoded row to a buffer.
+    """
+
+    def encode_row(self, row: Sequence[Any], buffer: bytearray) -> None:
+        raise NotImplementedError
+
+    def encode(self, rows: Iterable[Sequence[Any]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[memoryview]:
+        buffer = bytearray()
+        for row in rows:
+            self.encode_row(row, buffer)
+            if len(buffer) >= chunk_size:
+                yield memoryview(buffer)
+                buffer = bytearray()
+
+        if buffer:
+            yield memoryview(buffer)
+
+
+class RowBinaryEncoder(RowEncoder):
+    """
+    Encodes rows in the RowBinary format. The column types are given with the type conversion functions of
+    `pypika.clickhouse.type_conversion`, e.g. ``[ToUInt64, ToString, ToDateTime]``. Fixed strings are given together
+    with their length, e.g. ``(ToFixedString, 16)``.
+
+    Consecutive fixed width columns are packed together with a single precompiled struct.
+    """
+
+    def __init__(self, types: Sequence[type | tuple[type, int]]) -> None:
+        self._segments = []
+        codes, indexes = [], []
+
+        for index, column_type in enumerate(types):
+            base_type = column_type[0] if isinstance(column_type, tuple) else column_type
+            if base_type in _STRUCT_CODES:
+                codes.append(_STRUCT_CODES[base_type])
+                indexes.append((index, base_type))
+                continue
+
+            if codes:
+                self._segments.append((struct.Struct("<" + "".join(codes)), indexes))
+                codes, indexes = [], []
+
+            if base_type is ToString:
+                self._segments.append((None, [(index, None)]))
+            elif base_type is ToFixedString and isinstance(column_type, tuple):
+                self._segments.append((None, [(index, column_type[1])]))
+            else:
+                raise QueryException("Unsupported RowBinary column type {}".format(column_type))
+
+        if codes:
+            self._segments.append((struct.Struct("<" + "".join(codes)), indexes))
+
+    def encode_row(self, row: Sequence[Any], buffer: bytearray) -> None:
+        for packer, indexes in self._segments:
+            if packer is not None:
+                buffer += packer.pack(*(self._fixed_value(row[index], base_type) for index, base_type in indexes))
+                continue
+
+            index, length = indexes[0]
+            if row[index] is None:
+                raise QueryException("RowBinary does not support NULL values")
+            value = _to_bytes(row[index])
+            if length is None:
+                buffer += _varint(len(value))
+                buffer += value
+            elif len(value) > length:
+                raise QueryException(
+                    "The value {value!r} is longer than FixedString({length})".format(value=row[index], length=length)
+                )
+            else:
+                buffer += value.ljust(length, b"\0")
+
+    @staticmethod
+    def _fixed_value(value: Any, base_type: type) -> Any:
+        if value is None:
+            raise QueryException("RowBinary does not support NULL values")
+        if base_type is ToDate:
+            return _date_value(value)
+        if base_type is ToDateTime:
+            return _datetime_value(value)
+        return value
+
+
+class TSVEncoder(RowEncoder):
+    """
+    Encodes rows in the TabSeparated format.
+    """
+
+    def encode_row(self, row: Sequence[Any], buffer: bytearray) -> None:
+        buffer += "\t".join(format_tsv_value(value) for value in row).encode("utf-8")
+        buffer += b"\n"
+
+
+class JSONEachRowEncoder(RowEncoder):
+    """
+    Encodes rows in the JSONEachRow format, which requires the column names.
+    """
+
+    def __init__(self, columns: Sequence[str]) -> None:
+        if not columns:
+            raise QueryException("JSONEachRow requires the column names")
+        self._columns = list(columns)
+
+    def encode_row(self, row: Sequence[Any], buffer: bytearray) -> None:
+        if len(row) != len(self._columns):
+            raise QueryException(
+                "Expected {expected} values in each row, got {count}".format(
+                    expected=len(self._columns), count=len(row)
+                )
+            )
+        buffer += json.dumps(
+            dict(zip(self._columns, row)), default=self._default, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+        buffer += b"\n"
+
+    @staticmethod
+    def _default(value: Any) -> Any:
+        if isinstance(value, datetime.datetime):
+            return value.strftime("%Y-%m-%d %H:%M:%S")
+        if isinstance(value, datetime.date):
+            return value.isoformat()
+        if isinstance(value, (bytes, bytearray)):
+            return value.decode("utf-8")
+        raise TypeError("Object of type {} is not JSON serializable".format(type(value).__name__))
+
+
+def encode_rows(
+    rows: Iterable[Sequence[Any]],
+    format: str,
+    columns: Sequence[str] | None = None,
+    types: Sequence[type | tuple[type, int]] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[memoryview]:
+    """
+    Encodes rows in the given ClickHouse format, yielding chunks of roughly `chunk_size` bytes.
+
+    :param rows:
+        An iterable of rows, each row being a sequence of values in column order.
+    :param format:
+        One of RowBinary, TabSeparated (or TSV) and JSONEachRow.
+    :param columns:
+        The column names, required for JSONEachRow.
+    :param types:
+        The column types, required for RowBinary.
+    :param chunk_size:
+        The size in bytes after which a chunk is emitted.
+    """
+    name = format.lower()
+    if name == "rowbinary":
+        if types is None:
+            raise QueryException("RowBinary requires the column types")
+        encoder = RowBinaryEncoder(types)
+    elif name in ("tsv", "tabseparated"):
+        encoder = TSVEncoder()
+    elif name == "jsoneachrow":
+        encoder = JSONEachRowEncoder(columns)
+    else:
+        raise QueryException("No encoder available for format {}".format(format))
+
+    return encoder.encode(rows, chunk_size=chunk_size)
@@ -0,0 +1,134 @@
+"""
+ClickHouse server-side query parameters, written ``{name:Type}`` in the query and sent separately, e.g. as the
+``param_<name>`` arguments of the HTTP interface. The server parses and caches the query once for all the values.
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import Any
+
+from pypika.clickhouse.formats import format_tsv_value
+from pypika.clickhouse.type_conversion import ToFixedString
+from pypika.terms import Parameter
+from pypika.utils import QueryException
+
+_NO_VALUE = object()
+
+
+def type_name(column_type: str | type | tuple[type, int]) -> str:
+    """
+    Returns the name of a ClickHouse type, given either as a name or with the type conversion functions of
+    `pypika.clickhouse.type_conversion`, e.g. ``ToUInt64`` or ``(ToFixedString, 16)``.
+    """
+    if isinstance(column_type, str):
+        return column_type
+    if isinstance(column_type, tuple) and column_type[0] is ToFixedString:
+        return "FixedString({length})".format(length=column_type[1])
+    if column_type is ToFixedString:
+        raise QueryException("FixedString parameters require a length, e.g. (ToFixedString, 16)")
+    if isinstance(column_type, type) and column_type.__name__.startswith("To"):
+        return column_type.__name__[2:]
+    raise QueryException("Unsupported parameter type {}".format(column_type))
+
+
+class ClickHouseParameter(Parameter):
+    """
+    A typed server-side parameter, rendered ``{name:Type}``.
+
+    :param name:
+        The name of the parameter.
+    :param column_type:
+        The ClickHouse type of the parameter, see `type_name`.
+    :param value:
+        The value used when none is given at render time.
+    """
+
+    def __init__(self, name: str, column_type: str | type | tuple[type, int], value: Any = _NO_VALUE) -> None:
+        super().__init__(name)
+        self.name = name
+        self.type = type_name(column_type)
+        self.value = value
+
+    @property
+    def has_value(self) -> bool:
+        return self.value is not _NO_VALUE
+
+    def get_sql(self, parameter: Parameter | None = None, **kwargs: Any) -> str:
+        if isinstance(parameter, ClickHouseParameters):
+            parameter.update_parameters(param_key=self.name, value=self)
+        return "{{{name}:{type}}}".format(name=self.name, type=self.type)
+
+
+class ClickHouseParameters(Parameter):
+    """
+    Collects the `ClickHouseParameter` placeholders of a query, including the ones nested in functions and
+    subqueries, when given as the ``parameter`` argument of ``get_sql``. The literal values are rendered as is.
+    """
+
+    replaces_values = False
+
+    def __init__(self) -> None:
+        super().__init__(placeholder="")
+        self._parameters = []
+
+    def get_parameters(self, **kwargs: Any) -> list[ClickHouseParameter]:
+        return self._parameters
+
+    def update_parameters(self, param_key: str, value: ClickHouseParameter, **kwargs: Any) -> None:
+        self._parameters.append(value)
+
+
+def _literal(value: Any) -> str:
+    if isinstance(value, str):
+        return "'{}'".format(value.replace("\\", "\\\\").replace("'", "\\'"))
+    if value is None:
+        return "NULL"
+    return format_parameter_value(value)
+
+
+def format_parameter_value(value: Any) -> str:
+    """
+    Formats a value the way the server parses parameters, i.e. in the escaped text format. Arrays and tuples are
+    given as lists and tuples.
+    """
+    if isinstance(value, list):
+        return "[{}]".format(",".join(_literal(item) for item in value))
+    if isinstance(value, tuple):
+        return "({})".format(",".join(_literal(item) for item in value))
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime.datetime) and value.microsecond:
+        return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+    return format_tsv_value(value)
+
+
+def bind_parameters(parameters: list[ClickHouseParameter], values: dict[str, Any]) -> dict[str, str]:
+    """
+    Returns the ``param_<name>`` arguments for the rendered parameters, taking the values from `values` or from the
+    parameters themselves.
+
+    :raises QueryException:
+        If a parameter has no value, is used with different types, or if a value does not match any parameter.
+    """
+    types, bound = {}, {}
+    for parameter in parameters:
+        if types.setdefault(parameter.name, parameter.type) != parameter.type:
+            raise QueryException(
+                "Parameter {name} is used with types {first} and {second}".format(
+                    name=parameter.name, first=types[parameter.name], second=parameter.type
+                )
+            )
+        if parameter.name in values:
+            value = values[parameter.name]
+        elif parameter.has_value:
+            value = parameter.value
+        else:
+            raise QueryException("No value given for parameter {}".format(parameter.name))
+        bound["param_" + parameter.name] = format_parameter_value(value)
+
+    unknown = set(values) - set(types)
+    if unknown:
+        raise QueryException("Unknown parameters {}".format(", ".join(sorted(unknown))))
+
+    return bound
@@ -2,8 +2,16 @@ from __future__ import annotations
 
 import abc
 
-from pypika.terms import Function
-from pypika.utils import format_alias_sql
+from pypika.terms import Function, Term
+from pypika.utils import FunctionException, format_alias_sql, format_quotes
+
+# Maximum number of needles accepted by the multiSearch functions
+MAX_NEEDLES = 255
+
+
+def _needle_literal(needle: str) -> str:
+    # Backslashes are escape characters in ClickHouse string literals, e.g. in the regular expression \d+
+    return format_quotes(str(needle).replace("\\", "\\\\"), "'")
 
 
 class _AbstractSearchString(Function, metaclass=abc.ABCMeta):
@@ -52,10 +60,19 @@ class NotLike(_AbstractSearchString):
 
 
 class _AbstractMultiSearchString(Function, metaclass=abc.ABCMeta):
-    def __init__(self, name, patterns: list, alias: str | None = None):
+    """
+    Searches several needles at once. When there are more needles than a single call accepts, functions returning
+    whether any needle matches are split into OR-ed calls of at most `max_needles` needles, the others raise a
+    FunctionException.
+    """
+
+    splittable = True
+
+    def __init__(self, name, patterns: list, alias: str | None = None, max_needles: int = MAX_NEEDLES):
         super().__init__(self.clickhouse_function(), name, alias=alias)
 
         self._patterns = patterns
+        self._max_needles = max_needles
 
     @classmethod
     @abc.abstractmethod
@@ -70,11 +87,22 @@ class _AbstractMultiSearchString(Function, metaclass=abc.ABCMeta):
             else:
                 args.append(str(p))
 
-        sql = "{name}({args},[{patterns}])".format(
-            name=self.name,
-            args=",".join(args),
-            patterns=",".join(["'%s'" % i for i in self._patterns]),
-        )
+        if len(self._patterns) > self._max_needles and not self.splittable:
+            raise FunctionException(
+                "{name} accepts at most {max_needles} needles, {count} given".format(
+                    name=self.name, max_needles=self._max_needles, count=len(self._patterns)
+                )
+            )
+
+        calls = [
+            "{name}({args},[{patterns}])".format(
+                name=self.name,
+                args=",".join(args),
+                patterns=",".join(_needle_literal(pattern) for pattern in self._patterns[i : i + self._max_needles]),
+            )
+            for i in range(0, max(len(self._patterns), 1), self._max_needles)
+        ]
+        sql = calls[0] if len(calls) == 1 else "({})".format(" OR ".join(calls))
         return format_alias_sql(sql, self.alias, **kwargs)
 
 
@@ -88,3 +116,43 @@ class MultiMatchAny(_AbstractMultiSearchString):
     @classmethod
     def clickhouse_function(cls) -> str:
         return "multiMatchAny"
+
+
+class MultiSearchAllPositions(_AbstractMultiSearchString):
+    splittable = False
+
+    @classmethod
+    def clickhouse_function(cls) -> str:
+        return "multiSearchAllPositions"
+
+
+class MultiSearchFirstIndex(_AbstractMultiSearchString):
+    splittable = False
+
+    @classmethod
+    def clickhouse_function(cls) -> str:
+        return "multiSearchFirstIndex"
+
+
+class HasToken(Function):
+    """
+    Checks whether a string contains a token, i.e. a maximal sequence of alphanumeric characters. Unlike
+    ``LIKE '%token%'``, this can be answered by a tokenbf_v1 skip index.
+    """
+
+    def __init__(self, haystack: Term, token: str, alias: str | None = None):
+        super().__init__("hasToken", haystack, token, alias=alias)
+
+
+class HasTokenCaseInsensitive(Function):
+    def __init__(self, haystack: Term, token: str, alias: str | None = None):
+        super().__init__("hasTokenCaseInsensitive", haystack, token, alias=alias)
+
+
+class NgramSearch(Function):
+    """
+    Returns the 4-gram distance based similarity between 0 and 1 of a string and a needle.
+    """
+
+    def __init__(self, haystack: Term, needle: str, alias: str | None = None):
+        super().__init__("ngramSearch", haystack, needle, alias=alias)
@@ -1,20 +1,44 @@
 from __future__ import annotations
 
 import itertools
+import json
+import re
 import warnings
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from copy import copy
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pypika.enums import Dialects
+from pypika.clickhouse.dictionary import (
+    DictGet,
+    DictionaryLayout,
+    DictionarySource,
+    dictionary_join_key,
+)
+from pypika.clickhouse.engines import Engine
+from pypika.clickhouse.formats import DEFAULT_CHUNK_SIZE, ENCODED_FORMATS, encode_rows
+from pypika.clickhouse.parameters import ClickHouseParameters, bind_parameters
+from pypika.enums import Dialects, JoinType
 from pypika.queries import (
+    AliasedQuery,
+    Column,
     CreateQueryBuilder,
     Database,
     DropQueryBuilder,
+    ExplainQueryBuilder,
+    ExportQueryBuilder,
+    Hint,
+    JoinOn,
+    Joiner,
+    MergeBranch,
+    MergeQueryBuilder,
     Query,
     QueryBuilder,
+    QueryLabel,
     Selectable,
     Table,
+    ValuesTable,
 )
+from pypika.functions import Cast, Sum
 from pypika.terms import (
     ArithmeticExpression,
     Criterion,
@@ -22,11 +46,48 @@ from pypika.terms import (
     Field,
     Function,
     NullCriterion,
+    Parameter,
     Star,
     Term,
     ValueWrapper,
+    replace_terms,
 )
-from pypika.utils import QueryException, builder, format_alias_sql, format_quotes
+from pypika.utils import DialectNotSupported, QueryException, builder, format_alias_sql, format_quotes
+
+if TYPE_CHECKING:
+    import sys
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+
+def _catalog_name(table: str | Table) -> tuple[str | None, str]:
+    """
+    Returns the schema, if any, and the name of a table as stored in the catalogs of the database.
+    """
+    if isinstance(table, Table):
+        return table._schema._name if table._schema is not None else None, table._table_name
+    return None, table
+
+
+def _json_output(output: Any) -> Any:
+    # The JSON output of EXPLAIN, given as the document, as text or as the rows returned by the statement
+    if isinstance(output, (list, tuple)) and output and isinstance(output[0], (list, tuple)):
+        output = output[0][0]
+    return json.loads(output) if isinstance(output, str) else output
+
+
+def _find_last(document: Any, key: str) -> Any:
+    # The last value of a key in a JSON document, depth first
+    if isinstance(document, dict):
+        values = [value if name == key else _find_last(value, key) for name, value in document.items()]
+    elif isinstance(document, list):
+        values = [_find_last(value, key) for value in document]
+    else:
+        return None
+    return next((value for value in reversed(values) if value is not None), None)
 
 
 class SnowflakeQuery(Query):
@@ -46,16 +107,66 @@ class SnowflakeQuery(Query):
     def drop_table(cls, table: str | Table) -> SnowflakeDropQueryBuilder:
         return SnowflakeDropQueryBuilder().drop_table(table)
 
+    @classmethod
+    def merge_into(cls, table: str | Table) -> SnowflakeMergeQueryBuilder:
+        return SnowflakeMergeQueryBuilder().merge_into(table)
+
+
+class SnowflakeExportQueryBuilder(ExportQueryBuilder):
+    FORMATS = ("CSV", "JSON", "PARQUET")
+
+    def get_sql(self, **kwargs: Any) -> str:
+        # Stage references are not quoted, external locations are
+        target = self._target if self._target.startswith("@") else format_quotes(self._target, "'")
+        querystring = "COPY INTO {target} FROM ({query})".format(target=target, query=self._query.get_sql(**kwargs))
+
+        if self._format is not None:
+            querystring += " FILE_FORMAT=(TYPE={format})".format(format=self._format)
+
+        for name, value in self._options.items():
+            querystring += " {name}={value}".format(name=name.upper(), value=self._option_sql(value))
+
+        return querystring
+
+    @staticmethod
+    def _option_sql(value: Any) -> str:
+        if isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        return ValueWrapper.get_formatted_value(value, secondary_quote_char="'")
+
+
+class SnowflakeExplainQueryBuilder(ExplainQueryBuilder):
+    FORMATS = {"text": "TEXT", "json": "JSON", "tabular": "TABULAR"}
+
+    def get_sql(self, **kwargs: Any) -> str:
+        using = "USING {} ".format(self._format) if self._format is not None else ""
+        return "EXPLAIN {using}{query}".format(using=using, query=self._query.get_sql(**kwargs))
+
 
 class SnowflakeQueryBuilder(QueryBuilder):
     QUOTE_CHAR = None
     ALIAS_QUOTE_CHAR = '"'
     QUERY_ALIAS_QUOTE_CHAR = ''
     QUERY_CLS = SnowflakeQuery
+    EXPORT_CLS = SnowflakeExportQueryBuilder
+    EXPLAIN_CLS = SnowflakeExplainQueryBuilder
+    # Snowflake has no optimizer hints, labels are rendered in a comment kept in the query history
+    HINT_TYPES = (QueryLabel,)
+    HINTS_BEFORE_STATEMENT = True
+    TIMEOUT_STATEMENT = "ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS={seconds}"
+    TIMEOUT_RESET_STATEMENT = "ALTER SESSION UNSET STATEMENT_TIMEOUT_IN_SECONDS"
+    HASH_FUNCTION = "HASH"
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(dialect=Dialects.SNOWFLAKE, **kwargs)
 
+    def _hints_sql(self, **kwargs: Any) -> str:
+        return "/* {labels} */".format(labels=" ".join(hint.get_sql(**kwargs) for hint in self._hints))
+
+    def get_sql(self, with_alias: bool = False, subquery: bool = False, **kwargs: Any) -> str:
+        querystring = super().get_sql(with_alias=with_alias, subquery=subquery, **kwargs)
+        return self._prepend_hints(querystring, subquery, **kwargs)
+
 
 class SnowflakeCreateQueryBuilder(CreateQueryBuilder):
     QUOTE_CHAR = None
@@ -73,6 +184,14 @@ class SnowflakeDropQueryBuilder(DropQueryBuilder):
         super().__init__(dialect=Dialects.SNOWFLAKE)
 
 
+class SnowflakeMergeQueryBuilder(MergeQueryBuilder):
+    QUOTE_CHAR = None
+    QUERY_CLS = SnowflakeQuery
+
+    def __init__(self) -> None:
+        super().__init__(dialect=Dialects.SNOWFLAKE)
+
+
 class MySQLQuery(Query):
     """
     Defines a query class for use with MySQL.
@@ -94,14 +213,107 @@ class MySQLQuery(Query):
     def drop_table(cls, table: str | Table) -> MySQLDropQueryBuilder:
         return MySQLDropQueryBuilder().drop_table(table)
 
+    @classmethod
+    def merge_into(cls, table: str | Table) -> MergeQueryBuilder:
+        raise DialectNotSupported("MySQL does not support MERGE, use `on_duplicate_key_update` instead")
+
+    @classmethod
+    def estimate_count(cls, table: str | Table) -> MySQLQueryBuilder:
+        # TABLE_ROWS is sampled by InnoDB and may be off by 40 to 50%
+        schema, name = _catalog_name(table)
+        tables = Table("TABLES", schema="information_schema")
+        return (
+            cls.from_(tables)
+            .select(tables.TABLE_ROWS.as_("estimate"))
+            .where(tables.TABLE_SCHEMA == (Function("DATABASE") if schema is None else schema))
+            .where(tables.TABLE_NAME == name)
+        )
+
+
+class MySQLExportQueryBuilder(ExportQueryBuilder):
+    FORMATS = ("csv", "tsv")
+    FIELDS_OPTIONS = {
+        "fields_terminated_by": "TERMINATED BY",
+        "optionally_enclosed_by": "OPTIONALLY ENCLOSED BY",
+        "escaped_by": "ESCAPED BY",
+    }
+    CSV_OPTIONS = {"fields_terminated_by": ",", "optionally_enclosed_by": '"', "lines_terminated_by": "\\n"}
+
+    def __init__(self, query: QueryBuilder, target: str, format: str | None = None, **options: Any) -> None:
+        unknown = set(options) - set(self.FIELDS_OPTIONS) - {"lines_terminated_by"}
+        if unknown:
+            raise QueryException("Unsupported export options: {}".format(", ".join(sorted(unknown))))
+        super().__init__(query, target, format=format, **options)
+
+    def get_sql(self, **kwargs: Any) -> str:
+        options = dict(self.CSV_OPTIONS) if self._format == "csv" else {}
+        options.update(self._options)
+
+        querystring = "{query} INTO OUTFILE {target}".format(
+            query=self._query.get_sql(**kwargs), target=format_quotes(self._target, "'")
+        )
+
+        fields = [
+            "{keyword} {value}".format(keyword=keyword, value=format_quotes(options[name], "'"))
+            for name, keyword in self.FIELDS_OPTIONS.items()
+            if name in options
+        ]
+        if fields:
+            querystring += " FIELDS " + " ".join(fields)
+
+        if "lines_terminated_by" in options:
+            querystring += " LINES TERMINATED BY " + format_quotes(options["lines_terminated_by"], "'")
+
+        return querystring
+
+
+class MySQLExplainQueryBuilder(ExplainQueryBuilder):
+    FORMATS = {"text": "TREE", "tree": "TREE", "traditional": "TRADITIONAL", "json": "JSON"}
+    DEFAULT_FORMAT = "TREE"
+    SUPPORTS_ANALYZE = True
+
+    def get_sql(self, **kwargs: Any) -> str:
+        if self._analyze:
+            # EXPLAIN ANALYZE always outputs a tree
+            if self._format != "TREE":
+                raise QueryException("MySQL only supports the tree format with EXPLAIN ANALYZE")
+            return "EXPLAIN ANALYZE " + self._query.get_sql(**kwargs)
+        return "EXPLAIN FORMAT={format} {query}".format(format=self._format, query=self._query.get_sql(**kwargs))
+
+    def estimated_rows(self, output: Any) -> int:
+        """
+        Returns the rows produced by the last step of the JSON plan, given as the document, as text or as the rows
+        returned by the statement.
+        """
+        rows = _find_last(_json_output(output), "rows_produced_per_join")
+        if rows is None:
+            raise QueryException("The plan does not give an estimated number of rows")
+        return int(rows)
+
 
 class MySQLQueryBuilder(QueryBuilder):
     QUOTE_CHAR = "`"
     QUERY_CLS = MySQLQuery
-
-    def __init__(self, **kwargs: Any) -> None:
+    EXPORT_CLS = MySQLExportQueryBuilder
+    EXPLAIN_CLS = MySQLExplainQueryBuilder
+    ESTIMATE_FORMAT = "json"
+    HINT_TYPES = (Hint,)
+    HASH_FUNCTION = "CRC32"
+    HASH_UNSIGNED = True
+    # The first version supporting row aliases in INSERT statements, VALUES() is deprecated since 8.0.20
+    ROW_ALIAS_VERSION = (8, 0, 19)
+    ROW_ALIAS = "new"
+
+    def __init__(self, server_version: tuple[int, ...] | None = None, **kwargs: Any) -> None:
+        """
+        :param server_version:
+            The version of the server, e.g. ``(5, 7)``, used to pick the syntax of features which changed between
+            versions. Defaults to the latest version.
+        """
         super().__init__(dialect=Dialects.MYSQL, **kwargs)
+        self.server_version = server_version
         self._duplicate_updates = []
+        self._duplicate_inserted = None
         self._ignore_duplicates = False
         self._modifiers = []
 
@@ -122,6 +334,22 @@ class MySQLQueryBuilder(QueryBuilder):
         self._for_update_nowait = nowait
         self._for_update_of = set(of)
 
+    def _join_update_values(self, values: ValuesTable, criterion: Criterion) -> None:
+        # MySQL has no UPDATE ... FROM, the values are joined instead
+        self._joins = self._joins + [JoinOn(values, JoinType.inner, criterion)]
+
+    def _set_sql(self, **kwargs: Any) -> str:
+        if not self._joins:
+            return super()._set_sql(**kwargs)
+
+        # The columns of a multiple-table UPDATE are qualified, as the joined tables may have columns of the same name
+        return " SET {set}".format(
+            set=",".join(
+                "{field}={value}".format(field=field.get_sql(**kwargs), value=value.get_sql(**kwargs))
+                for field, value in self._updates
+            )
+        )
+
     @builder
     def on_duplicate_key_update(self, field: Field | str, value: Any) -> None:
         if self._ignore_duplicates:
@@ -130,18 +358,59 @@ class MySQLQueryBuilder(QueryBuilder):
         field = Field(field) if not isinstance(field, Field) else field
         self._duplicate_updates.append((field, ValueWrapper(value)))
 
+    @builder
+    def on_duplicate_key_update_from_inserted(self, *columns: Field | str) -> None:
+        """
+        Updates the given columns of the existing rows to the inserted values, rendered with a row alias,
+        ``INSERT ... VALUES (...) AS new ON DUPLICATE KEY UPDATE c=new.c``, or with ``VALUES(c)`` for servers
+        older than 8.0.19.
+
+        :param columns:
+            The updated columns, defaults to all the inserted columns.
+        """
+        if self._ignore_duplicates:
+            raise QueryException("Can not have two conflict handlers")
+
+        self._duplicate_inserted = (self._duplicate_inserted or []) + [
+            Field(column.name if isinstance(column, Field) else column) for column in columns
+        ]
+
     @builder
     def on_duplicate_key_ignore(self) -> None:
-        if self._duplicate_updates:
+        if self._duplicate_updates or self._duplicate_inserted is not None:
             raise QueryException("Can not have two conflict handlers")
 
         self._ignore_duplicates = True
 
+    def _uses_row_alias(self) -> bool:
+        return self._duplicate_inserted is not None and (
+            self.server_version is None or tuple(self.server_version) >= self.ROW_ALIAS_VERSION
+        )
+
+    def _values_sql(self, **kwargs: Any) -> str:
+        querystring = super()._values_sql(**kwargs)
+        if self._uses_row_alias():
+            querystring += " AS " + format_quotes(self.ROW_ALIAS, kwargs.get("quote_char"))
+        return querystring
+
+    def _limit_rows(self, table: Selectable, key: Term, rows: int) -> MySQLQueryBuilder:
+        # MySQL does not support LIMIT in IN subqueries, but supports DELETE ... ORDER BY ... LIMIT
+        return copy(self).orderby(key).limit(rows)
+
+    def _set_timeout(self, milliseconds: int) -> None:
+        # Given as an optimizer hint, replacing any previous timeout
+        self._timeout = milliseconds
+        self._hints = [hint for hint in self._hints if getattr(hint, "name", None) != "MAX_EXECUTION_TIME"] + [
+            Hint("MAX_EXECUTION_TIME", milliseconds)
+        ]
+
     def get_sql(self, **kwargs: Any) -> str:
         self._set_kwargs_defaults(kwargs)
+        if self._timeout is not None and (self._insert_table or self._update_table or self._delete_from):
+            raise QueryException("MySQL only supports timeouts for SELECT statements")
         querystring = super().get_sql(**kwargs)
         if querystring:
-            if self._duplicate_updates:
+            if self._duplicate_updates or self._duplicate_inserted is not None:
                 querystring += self._on_duplicate_key_update_sql(**kwargs)
             elif self._ignore_duplicates:
                 querystring += self._on_duplicate_key_ignore_sql()
@@ -162,12 +431,30 @@ class MySQLQueryBuilder(QueryBuilder):
         return for_update
 
     def _on_duplicate_key_update_sql(self, **kwargs: Any) -> str:
-        return " ON DUPLICATE KEY UPDATE {updates}".format(
-            updates=",".join(
-                "{field}={value}".format(field=field.get_sql(**kwargs), value=value.get_sql(**kwargs))
-                for field, value in self._duplicate_updates
+        updates = [
+            "{field}={value}".format(field=field.get_sql(**kwargs), value=value.get_sql(**kwargs))
+            for field, value in self._duplicate_updates
+        ]
+        if self._duplicate_inserted is not None:
+            updates += [
+                "{field}={value}".format(field=field.get_sql(**kwargs), value=self._inserted_value_sql(field, **kwargs))
+                for field in self._duplicate_inserted or self._inserted_columns()
+            ]
+        return " ON DUPLICATE KEY UPDATE {updates}".format(updates=",".join(updates))
+
+    def _inserted_columns(self) -> list[Field]:
+        if not self._columns:
+            raise QueryException("The updated columns are required when the inserted columns are not given")
+        return [Field(column.name) for column in self._columns]
+
+    def _inserted_value_sql(self, field: Field, **kwargs: Any) -> str:
+        if self._uses_row_alias():
+            if self._selects:
+                raise QueryException("Row aliases can not be used with INSERT ... SELECT")
+            return "{alias}.{field}".format(
+                alias=format_quotes(self.ROW_ALIAS, kwargs.get("quote_char")), field=field.get_sql(**kwargs)
             )
-        )
+        return "VALUES({field})".format(field=field.get_sql(**kwargs))
 
     def _on_duplicate_key_ignore_sql(self) -> str:
         return " ON DUPLICATE KEY IGNORE"
@@ -187,7 +474,8 @@ class MySQLQueryBuilder(QueryBuilder):
         Overridden function to generate the SELECT part of the SQL statement,
         with the addition of the a modifier if present.
         """
-        return "SELECT {distinct}{modifier}{select}".format(
+        return "SELECT {hints}{distinct}{modifier}{select}".format(
+            hints=self._statement_hints_sql(**kwargs),
             distinct="DISTINCT " if self._distinct else "",
             modifier="{} ".format(" ".join(self._modifiers)) if self._modifiers else "",
             select=",".join(term.get_sql(with_alias=True, subquery=True, **kwargs) for term in self._selects),
@@ -257,24 +545,38 @@ class VerticaQuery(Query):
         return VerticaCreateQueryBuilder().create_table(table)
 
 
+class VerticaExportQueryBuilder(ExportQueryBuilder):
+    FORMATS = ("PARQUET", "ORC", "JSON", "DELIMITED")
+    DEFAULT_FORMAT = "PARQUET"
+
+    def get_sql(self, **kwargs: Any) -> str:
+        parameters = ["directory={}".format(format_quotes(self._target, "'"))] + [
+            "{name}={value}".format(name=name, value=ValueWrapper.get_formatted_value(value, secondary_quote_char="'"))
+            for name, value in self._options.items()
+        ]
+        return "EXPORT TO {format}({parameters}) AS {query}".format(
+            format=self._format, parameters=",".join(parameters), query=self._query.get_sql(**kwargs)
+        )
+
+
 class VerticaQueryBuilder(QueryBuilder):
     QUERY_CLS = VerticaQuery
+    EXPORT_CLS = VerticaExportQueryBuilder
+    EXPLAIN_CLS = ExplainQueryBuilder
+    HINT_TYPES = (Hint, QueryLabel)
+    TIMEOUT_STATEMENT = "SET SESSION RUNTIMECAP '{milliseconds} milliseconds'"
+    TIMEOUT_RESET_STATEMENT = "SET SESSION RUNTIMECAP DEFAULT"
+    HASH_FUNCTION = "HASH"
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(dialect=Dialects.VERTICA, **kwargs)
-        self._hint = None
 
-    @builder
-    def hint(self, label: str) -> None:
-        self._hint = label
-
-    def get_sql(self, *args: Any, **kwargs: Any) -> str:
-        sql = super().get_sql(*args, **kwargs)
+    def _validate_hint(self, hint: Hint | QueryLabel | str) -> Hint | QueryLabel:
+        # Strings are labels
+        return super()._validate_hint(QueryLabel(hint) if isinstance(hint, str) else hint)
 
-        if self._hint is not None:
-            sql = "".join([sql[:7], "/*+label({hint})*/".format(hint=self._hint), sql[6:]])
-
-        return sql
+    def _hints_sql(self, **kwargs: Any) -> str:
+        return "/*+{hints}*/".format(hints=", ".join(hint.get_sql(**kwargs) for hint in self._hints))
 
 
 class VerticaCreateQueryBuilder(CreateQueryBuilder):
@@ -380,14 +682,46 @@ class OracleQuery(Query):
     def _builder(cls, **kwargs: Any) -> OracleQueryBuilder:
         return OracleQueryBuilder(**kwargs)
 
+    @classmethod
+    def merge_into(cls, table: str | Table) -> OracleMergeQueryBuilder:
+        return OracleMergeQueryBuilder().merge_into(table)
+
+    @classmethod
+    def estimate_count(cls, table: str | Table) -> OracleQueryBuilder:
+        # NUM_ROWS is filled by DBMS_STATS.GATHER_TABLE_STATS, names are stored in upper case unless quoted
+        schema, name = _catalog_name(table)
+        tables = Table("USER_TABLES" if schema is None else "ALL_TABLES")
+        query = cls.from_(tables).select(tables.NUM_ROWS.as_("estimate"))
+        if schema is not None:
+            query = query.where(tables.OWNER == schema)
+        return query.where(tables.TABLE_NAME == name)
+
+
+class OracleExplainQueryBuilder(ExplainQueryBuilder):
+    def get_sql(self, **kwargs: Any) -> str:
+        # The plan is stored in PLAN_TABLE, it is displayed with DBMS_XPLAN.DISPLAY
+        return "EXPLAIN PLAN FOR " + self._query.get_sql(**kwargs)
+
 
 class OracleQueryBuilder(FetchNextAndOffsetRowsQueryBuilder):
     QUOTE_CHAR = None
     QUERY_CLS = OracleQuery
+    EXPLAIN_CLS = OracleExplainQueryBuilder
+    HINT_TYPES = (Hint,)
+    # Lists can only be compared for equality
+    ROW_VALUE_COMPARISON = False
+    HASH_FUNCTION = "ORA_HASH"
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(dialect=Dialects.ORACLE, **kwargs)
 
+    def _hash_bucket(self, term: Term, partitions: int) -> Term:
+        # ORA_HASH returns a bucket between 0 and its second argument
+        return Function(self.HASH_FUNCTION, term, partitions - 1)
+
+    def _join_update_values(self, values: ValuesTable, criterion: Criterion) -> None:
+        raise DialectNotSupported("Oracle does not support UPDATE ... FROM, use a MERGE statement instead")
+
     def get_sql(self, *args: Any, **kwargs: Any) -> str:
         # Oracle does not support group by a field alias
         # Note: set directly in kwargs as they are re-used down the tree in the case of subqueries!
@@ -405,6 +739,53 @@ class OracleQueryBuilder(FetchNextAndOffsetRowsQueryBuilder):
         return querystring
 
 
+class OracleMergeQueryBuilder(MergeQueryBuilder):
+    """
+    Oracle renders at most one WHEN MATCHED branch, updating the rows and then deleting the updated rows matching the
+    condition of the DELETE branch, and one WHEN NOT MATCHED branch. The conditions of the branches are rendered as
+    WHERE clauses.
+    """
+
+    QUOTE_CHAR = None
+    QUERY_CLS = OracleQuery
+
+    def __init__(self) -> None:
+        super().__init__(dialect=Dialects.ORACLE)
+
+    def _on_sql(self, **kwargs: Any) -> str:
+        return "({on})".format(on=super()._on_sql(**kwargs))
+
+    def _whens_sql(self, **kwargs: Any) -> str:
+        branches = {}
+        for branch in self._whens:
+            if branch.action in branches:
+                raise DialectNotSupported("Oracle supports a single {action} branch in a MERGE".format(**vars(branch)))
+            branches[branch.action] = branch
+
+        update, delete, insert = branches.get("UPDATE"), branches.get("DELETE"), branches.get("INSERT")
+        querystring = ""
+        if delete is not None:
+            if update is None or delete.condition is None:
+                raise DialectNotSupported("Oracle only deletes the updated rows matching a condition")
+        if update is not None:
+            querystring += " WHEN MATCHED THEN UPDATE{set}{where}".format(
+                set=self._set_sql(update, **kwargs), where=self._where_sql(update, **kwargs)
+            )
+            if delete is not None:
+                querystring += " DELETE" + self._where_sql(delete, **kwargs)
+        if insert is not None:
+            querystring += " WHEN NOT MATCHED THEN {insert}{where}".format(
+                insert=self._action_sql(insert, **kwargs), where=self._where_sql(insert, **kwargs)
+            )
+        return querystring
+
+    @staticmethod
+    def _where_sql(branch: MergeBranch, **kwargs: Any) -> str:
+        if branch.condition is None:
+            return ""
+        return " WHERE " + branch.condition.get_sql(with_namespace=True, **kwargs)
+
+
 class PostgreSQLQuery(Query):
     """
     Defines a query class for use with PostgreSQL.
@@ -414,10 +795,144 @@ class PostgreSQLQuery(Query):
     def _builder(cls, **kwargs) -> PostgreSQLQueryBuilder:
         return PostgreSQLQueryBuilder(**kwargs)
 
+    @classmethod
+    def merge_into(cls, table: str | Table) -> PostgreSQLMergeQueryBuilder:
+        """
+        MERGE statements require PostgreSQL 15 or later, `PostgreSQLQueryBuilder.on_conflict` upserts on older
+        versions.
+        """
+        return PostgreSQLMergeQueryBuilder().merge_into(table)
+
+    @classmethod
+    def estimate_count(cls, table: str | Table) -> PostgreSQLQueryBuilder:
+        # reltuples is -1 until the table is first vacuumed or analyzed
+        regclass = ".".join(format_quotes(name, '"') for name in _catalog_name(table) if name is not None)
+        pg_class = Table("pg_class")
+        return (
+            cls.from_(pg_class)
+            .select(Cast(Function("GREATEST", pg_class.reltuples, 0), "BIGINT", alias="estimate"))
+            .where(pg_class.oid == Cast(regclass, "REGCLASS"))
+        )
+
+
+class PostgreSQLExportQueryBuilder(ExportQueryBuilder):
+    FORMATS = ("text", "csv", "binary")
+
+    def get_sql(self, **kwargs: Any) -> str:
+        target = "STDOUT" if self._target.upper() == "STDOUT" else format_quotes(self._target, "'")
+        querystring = "COPY ({query}) TO {target}".format(query=self._query.get_sql(**kwargs), target=target)
+
+        options = ["FORMAT {}".format(self._format)] if self._format is not None else []
+        options += [
+            "{name} {value}".format(
+                name=name.upper(), value=ValueWrapper.get_formatted_value(value, secondary_quote_char="'")
+            )
+            for name, value in self._options.items()
+        ]
+        if options:
+            querystring += " WITH ({options})".format(options=",".join(options))
+
+        return querystring
+
+
+class PostgreSQLExplainQueryBuilder(ExplainQueryBuilder):
+    FORMATS = {"text": "TEXT", "json": "JSON", "xml": "XML", "yaml": "YAML"}
+    SUPPORTS_ANALYZE = True
+    SUPPORTS_BUFFERS = True
+
+    def get_sql(self, **kwargs: Any) -> str:
+        options = []
+        if self._analyze:
+            options.append("ANALYZE")
+        if self._buffers:
+            options.append("BUFFERS")
+        if self._format is not None:
+            options.append("FORMAT " + self._format)
+
+        querystring = self._query.get_sql(**kwargs)
+        if not options:
+            return "EXPLAIN " + querystring
+        return "EXPLAIN ({options}) {query}".format(options=", ".join(options), query=querystring)
+
+    def estimated_rows(self, output: Any) -> int:
+        """
+        Returns the rows estimated for the root of the JSON plan, given as the document, as text or as the rows
+        returned by the statement.
+        """
+        document = _json_output(output)
+        if isinstance(document, list):
+            document = document[0]
+        return int(document["Plan"]["Plan Rows"])
+
+
+class Unnest(Term):
+    """
+    The ``unnest`` table function of PostgreSQL, turning one array parameter per column into rows, e.g.
+    ``unnest(%s::int[],%s::text[])``. The statement keeps the same shape whatever the number of rows, so it is
+    parsed and planned once.
+    """
+
+    def __init__(
+        self,
+        parameters: Sequence[Term],
+        types: Sequence[str],
+        alias: str | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> None:
+        super().__init__(alias)
+        if len(parameters) != len(types):
+            raise QueryException("unnest requires one type per array")
+        self.parameters = list(parameters)
+        self.types = list(types)
+        self.columns = list(columns) if columns is not None else None
+
+    def get_sql(self, with_alias: bool = False, quote_char: str | None = None, **kwargs: Any) -> str:
+        sql = "unnest({arrays})".format(
+            arrays=",".join(
+                "{parameter}::{type}[]".format(parameter=parameter.get_sql(quote_char=quote_char, **kwargs), type=type_)
+                for parameter, type_ in zip(self.parameters, self.types)
+            )
+        )
+        if not (with_alias and self.alias):
+            return sql
+
+        sql += " AS " + format_quotes(self.alias, quote_char)
+        if self.columns:
+            sql += "({})".format(",".join(format_quotes(column, quote_char) for column in self.columns))
+        return sql
+
+
+def _column_arrays(columns: Sequence[str], data: Sequence[Sequence[Any]] | dict[str, Sequence[Any]]) -> list[list[Any]]:
+    if isinstance(data, dict):
+        if set(data) != set(columns):
+            raise QueryException("The column arrays must match the columns")
+        arrays = [list(data[column]) for column in columns]
+        if len({len(array) for array in arrays}) > 1:
+            raise QueryException("The column arrays must have the same length")
+        return arrays
+
+    for row in data:
+        if len(row) != len(columns):
+            raise QueryException("Each row must have one value per column")
+    return [list(array) for array in zip(*data)] if data else [[] for _ in columns]
+
+
+def _placeholders(placeholder: str | Callable[[int], str], count: int) -> list[Parameter]:
+    return [Parameter(placeholder(idx) if callable(placeholder) else placeholder) for idx in range(count)]
+
 
 class PostgreSQLQueryBuilder(QueryBuilder):
     ALIAS_QUOTE_CHAR = '"'
     QUERY_CLS = PostgreSQLQuery
+    EXPORT_CLS = PostgreSQLExportQueryBuilder
+    EXPLAIN_CLS = PostgreSQLExplainQueryBuilder
+    ESTIMATE_FORMAT = "json"
+    # Hints are read by the pg_hint_plan extension from the comment preceding the statement
+    HINT_TYPES = (Hint,)
+    HINTS_BEFORE_STATEMENT = True
+    # Only applies to the current transaction, which the query must run in
+    TIMEOUT_STATEMENT = "SET LOCAL statement_timeout={milliseconds}"
+    HASH_FUNCTION = "hashtext"
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(dialect=Dialects.POSTGRESQL, **kwargs)
@@ -436,6 +951,7 @@ class PostgreSQLQueryBuilder(QueryBuilder):
         self._for_update_nowait = False
         self._for_update_skip_locked = False
         self._for_update_of = set()
+        self._unnest_arrays = []
 
     def __copy__(self) -> PostgreSQLQueryBuilder:
         newone = super().__copy__()
@@ -443,6 +959,77 @@ class PostgreSQLQueryBuilder(QueryBuilder):
         newone._on_conflict_do_updates = copy(self._on_conflict_do_updates)
         return newone
 
+    @builder
+    def insert_unnest(
+        self,
+        columns: Sequence[str],
+        data: Sequence[Sequence[Any]] | dict[str, Sequence[Any]],
+        types: Sequence[str],
+        placeholder: str | Callable[[int], str] = "%s",
+    ) -> None:
+        """
+        Inserts rows with ``INSERT INTO t (a,b) SELECT * FROM unnest(%s::int[],%s::text[])``, sending one array
+        parameter per column. The arrays are returned by `unnest_parameters`. Can be combined with `on_conflict` for
+        bulk upserts.
+
+        :param columns:
+            The inserted columns.
+        :param data:
+            The rows, or a dict of the column arrays by column name.
+        :param types:
+            The PostgreSQL types of the columns, e.g. ``int`` or ``text``.
+        :param placeholder:
+            The parameter placeholder of the driver, or a function building it from the index of the array, e.g.
+            ``lambda idx: f"${idx + 1}"``.
+        """
+        if not self._insert_table:
+            raise QueryException("insert_unnest requires a table to insert into")
+        if self._values or self._selects:
+            raise QueryException("insert_unnest cannot be combined with other inserted rows")
+
+        self._unnest_arrays = _column_arrays(columns, data)
+        self._columns = [Field(column) for column in columns]
+        self._from = [Unnest(_placeholders(placeholder, len(columns)), types)]
+        self._selects = [Star()]
+
+    @builder
+    def update_unnest(
+        self,
+        columns: Sequence[str],
+        data: Sequence[Sequence[Any]] | dict[str, Sequence[Any]],
+        types: Sequence[str],
+        keys: Sequence[str],
+        alias: str = "v",
+        placeholder: str | Callable[[int], str] = "%s",
+    ) -> None:
+        """
+        Updates rows with ``UPDATE t SET b=v.b FROM unnest(%s::int[],%s::text[]) AS v(a,b) WHERE t.a=v.a``, sending
+        one array parameter per column. The arrays are returned by `unnest_parameters`.
+
+        :param keys:
+            The columns identifying the updated rows, the other columns are updated.
+        """
+        if not self._update_table:
+            raise QueryException("update_unnest requires a table to update")
+        if not set(keys) < set(columns):
+            raise QueryException("The keys must be a subset of the columns, leaving columns to update")
+
+        self._unnest_arrays = _column_arrays(columns, data)
+        self._from = [Unnest(_placeholders(placeholder, len(columns)), types, alias=alias, columns=columns)]
+        values = Table(alias)
+        self._updates = self._updates + [
+            (Field(column), Field(column, table=values)) for column in columns if column not in keys
+        ]
+        for key in keys:
+            criterion = Field(key, table=self._update_table) == Field(key, table=values)
+            self._wheres = self._wheres & criterion if self._wheres else criterion
+
+    def unnest_parameters(self) -> list[list[Any]]:
+        """
+        Returns the arrays of an `insert_unnest` or `update_unnest` query, in the order of the placeholders.
+        """
+        return self._unnest_arrays
+
     @builder
     def distinct_on(self, *fields: str | Term) -> None:
         for field in fields:
@@ -522,6 +1109,23 @@ class PostgreSQLQueryBuilder(QueryBuilder):
     def using(self, table: Selectable | str) -> None:
         self._using.append(table)
 
+    def _limit_rows(self, table: Selectable, key: Term, rows: int) -> PostgreSQLQueryBuilder:
+        # The rows are found by their physical location, without sorting nor index lookups
+        return self._limit_rows_by_subquery(table, Field("ctid", table=table), rows, ordered=False)
+
+    def _count_keeps_selects(self) -> bool:
+        return super()._count_keeps_selects() or bool(self._distinct_on)
+
+    def _limits_rows(self) -> bool:
+        return super()._limits_rows() or bool(self._distinct_on)
+
+    def _clause_terms(self) -> list[Term]:
+        return super()._clause_terms() + self._distinct_on
+
+    def _hash(self, term: Term) -> Term:
+        # hashtext hashes any value given as text
+        return Function(self.HASH_FUNCTION, Cast(term, "TEXT"))
+
     def _distinct_sql(self, **kwargs: Any) -> str:
         if self._distinct_on:
             return "DISTINCT ON({distinct_on}) ".format(
@@ -673,7 +1277,14 @@ class PostgreSQLQueryBuilder(QueryBuilder):
         if self._returns:
             kwargs['with_namespace'] = self._update_table and self.from_
             querystring += self._returning_sql(**kwargs)
-        return querystring
+        return self._prepend_hints(querystring, subquery, **kwargs)
+
+
+class PostgreSQLMergeQueryBuilder(MergeQueryBuilder):
+    QUERY_CLS = PostgreSQLQuery
+
+    def __init__(self) -> None:
+        super().__init__(dialect=Dialects.POSTGRESQL)
 
 
 class RedshiftQuery(Query):
@@ -686,8 +1297,37 @@ class RedshiftQuery(Query):
         return RedShiftQueryBuilder(dialect=Dialects.REDSHIFT, **kwargs)
 
 
+class RedshiftExportQueryBuilder(ExportQueryBuilder):
+    FORMATS = ("CSV", "PARQUET", "JSON")
+
+    def get_sql(self, **kwargs: Any) -> str:
+        # The query is passed to UNLOAD as a string literal, format_quotes doubles any quotes inside it
+        querystring = "UNLOAD ({query}) TO {target}".format(
+            query=format_quotes(self._query.get_sql(**kwargs), "'"),
+            target=format_quotes(self._target, "'"),
+        )
+
+        for name, value in self._options.items():
+            if value is True:
+                querystring += " {name}".format(name=name.upper())
+            elif value is not False:
+                querystring += " {name} {value}".format(
+                    name=name.upper(), value=ValueWrapper.get_formatted_value(value, secondary_quote_char="'")
+                )
+
+        if self._format is not None:
+            querystring += " FORMAT AS {format}".format(format=self._format)
+
+        return querystring
+
+
 class RedShiftQueryBuilder(QueryBuilder):
     QUERY_CLS = RedshiftQuery
+    EXPORT_CLS = RedshiftExportQueryBuilder
+    EXPLAIN_CLS = ExplainQueryBuilder
+    TIMEOUT_STATEMENT = "SET statement_timeout TO {milliseconds}"
+    TIMEOUT_RESET_STATEMENT = "RESET statement_timeout"
+    HASH_FUNCTION = "FNV_HASH"
 
 
 class MSSQLQuery(Query):
@@ -699,15 +1339,106 @@ class MSSQLQuery(Query):
     def _builder(cls, **kwargs: Any) -> MSSQLQueryBuilder:
         return MSSQLQueryBuilder(**kwargs)
 
+    @classmethod
+    def merge_into(cls, table: str | Table) -> MSSQLMergeQueryBuilder:
+        return MSSQLMergeQueryBuilder().merge_into(table)
+
+    @classmethod
+    def estimate_count(cls, table: str | Table) -> MSSQLQueryBuilder:
+        # Closing brackets are doubled inside bracketed identifiers
+        object_name = ".".join(
+            "[{}]".format(name.replace("]", "]]")) for name in _catalog_name(table) if name is not None
+        )
+        stats = Table("dm_db_partition_stats", schema="sys")
+        # The rows of the heap (0) or of the clustered index (1), the other indexes hold the same rows
+        return (
+            cls.from_(stats)
+            .select(Sum(stats.row_count, alias="estimate"))
+            .where(stats.object_id == Function("OBJECT_ID", object_name))
+            .where(stats.index_id.isin([0, 1]))
+        )
+
+
+class _HintedTable:
+    """
+    A table rendered with its table hints, only used while rendering a query.
+    """
+
+    def __init__(self, table: Selectable, hints: list[str]) -> None:
+        self.table = table
+        self.hints = hints
+
+    def get_sql(self, **kwargs: Any) -> str:
+        return "{table} WITH ({hints})".format(table=self.table.get_sql(**kwargs), hints=",".join(self.hints))
+
 
 class MSSQLQueryBuilder(FetchNextAndOffsetRowsQueryBuilder):
     QUERY_CLS = MSSQLQuery
+    # The maximum number of rows of a table value constructor
+    VALUES_MAX_ROWS = 1000
+    ROW_VALUE_COMPARISON = False
+    HASH_FUNCTION = "CHECKSUM"
+
+    # https://learn.microsoft.com/en-us/sql/t-sql/queries/hints-transact-sql-query
+    QUERY_HINTS = (
+        r"(HASH|ORDER) GROUP",
+        r"(CONCAT|HASH|MERGE) UNION",
+        r"(LOOP|MERGE|HASH) JOIN",
+        r"EXPAND VIEWS",
+        r"FAST \d+",
+        r"FORCE ORDER",
+        r"(FORCE|DISABLE) (EXTERNALPUSHDOWN|SCALEOUTEXECUTION)",
+        r"IGNORE_NONCLUSTERED_COLUMNSTORE_INDEX",
+        r"KEEP PLAN",
+        r"KEEPFIXED PLAN",
+        r"(MAX|MIN)_GRANT_PERCENT = \d+(\.\d+)?",
+        r"MAXDOP \d+",
+        r"MAXRECURSION \d+",
+        r"NO_PERFORMANCE_SPOOL",
+        r"OPTIMIZE FOR UNKNOWN",
+        r"OPTIMIZE FOR \(@\w+ (UNKNOWN|= .+)(, @\w+ (UNKNOWN|= .+))*\)",
+        r"PARAMETERIZATION (SIMPLE|FORCED)",
+        r"QUERYTRACEON \d+",
+        r"RECOMPILE",
+        r"ROBUST PLAN",
+        r"USE HINT \('\w+'(, '\w+')*\)",
+        r"LABEL = '[^']*'",
+    )
+    # https://learn.microsoft.com/en-us/sql/t-sql/queries/hints-transact-sql-table
+    TABLE_HINTS = (
+        r"NOEXPAND",
+        r"INDEX ?\((\w+|\d+)(, ?(\w+|\d+))*\)",
+        r"INDEX ?= ?(\w+|\d+)",
+        r"FORCESEEK( ?\((\w+|\d+) ?\(\w+(, ?\w+)*\)\))?",
+        r"FORCESCAN",
+        r"HOLDLOCK",
+        r"NOLOCK",
+        r"NOWAIT",
+        r"PAGLOCK",
+        r"READCOMMITTED",
+        r"READCOMMITTEDLOCK",
+        r"READPAST",
+        r"READUNCOMMITTED",
+        r"REPEATABLEREAD",
+        r"ROWLOCK",
+        r"SERIALIZABLE",
+        r"SNAPSHOT",
+        r"SPATIAL_WINDOW_MAX_CELLS = \d+",
+        r"TABLOCK",
+        r"TABLOCKX",
+        r"UPDLOCK",
+        r"XLOCK",
+    )
+    # Table hints which can not be given to the target of an UPDATE or DELETE
+    READ_ONLY_TABLE_HINTS = ("NOLOCK", "READUNCOMMITTED")
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(dialect=Dialects.MSSQL, **kwargs)
         self._top: int | None = None
         self._top_with_ties: bool = False
         self._top_percent: bool = False
+        self._query_hints: list[str] = []
+        self._table_hints: list[tuple[Selectable, list[str]]] = []
 
     @builder
     def top(self, value: str | int, percent: bool = False, with_ties: bool = False) -> None:
@@ -725,6 +1456,48 @@ class MSSQLQueryBuilder(FetchNextAndOffsetRowsQueryBuilder):
         self._top_percent: bool = percent
         self._top_with_ties: bool = with_ties
 
+    @builder
+    def option(self, *hints: str) -> None:
+        """
+        Adds query hints, rendered in the OPTION clause at the end of the statement, e.g.
+        ``option("RECOMPILE", "MAXDOP 4")``. Only the outermost statement can have query hints, rendering a query
+        with hints as a subquery, a CTE or a part of a set operation raises a QueryException.
+        https://learn.microsoft.com/en-us/sql/t-sql/queries/option-clause-transact-sql
+
+        :raises QueryException:
+            If a hint is not a valid query hint.
+        """
+        self._query_hints = self._query_hints + [self._validate_hint(hint, self.QUERY_HINTS, "query") for hint in hints]
+
+    @builder
+    def table_hint(self, table: Selectable, *hints: str) -> None:
+        """
+        Adds table hints, rendered ``WITH (NOLOCK,INDEX(ix))`` after the table in the FROM clause, in a join or as
+        the target of an UPDATE or DELETE.
+
+        :param table:
+            A table of the query.
+        :raises QueryException:
+            If the table is not used by the query or a hint is not a valid table hint.
+        """
+        tables = self._from + [join.item for join in self._joins] + [self._update_table]
+        if table not in tables:
+            raise QueryException("Table hints can only be given to the tables of the query, got {}".format(table))
+
+        hints = [self._validate_hint(hint, self.TABLE_HINTS, "table") for hint in hints]
+        is_target = table == self._update_table or (self._delete_from and table == self._from[0])
+        if is_target and any(hint.upper() in self.READ_ONLY_TABLE_HINTS for hint in hints):
+            raise QueryException("{} can not be given to the target of an UPDATE or DELETE".format(", ".join(hints)))
+
+        self._table_hints = self._table_hints + [(table, hints)]
+
+    @staticmethod
+    def _validate_hint(hint: str, patterns: tuple[str, ...], kind: str) -> str:
+        hint = " ".join(hint.split())
+        if not any(re.fullmatch(pattern, hint, re.IGNORECASE) for pattern in patterns):
+            raise QueryException("Invalid {kind} hint {hint}".format(kind=kind, hint=hint))
+        return hint
+
     def _apply_pagination(self, querystring: str, **kwargs) -> str:
         # Note: Overridden as MSSQL specifies offset before the fetch next limit
         if self._limit is not None or self._offset:
@@ -736,11 +1509,45 @@ class MSSQLQueryBuilder(FetchNextAndOffsetRowsQueryBuilder):
 
         return querystring
 
-    def get_sql(self, *args: Any, **kwargs: Any) -> str:
+    def get_sql(self, with_alias: bool = False, subquery: bool = False, **kwargs: Any) -> str:
         # MSSQL does not support group by a field alias.
         # Note: set directly in kwargs as they are re-used down the tree in the case of subqueries!
         kwargs['groupby_alias'] = False
-        return super().get_sql(*args, **kwargs)
+        query = self._with_table_hints() if self._table_hints else self
+        querystring = super(MSSQLQueryBuilder, query).get_sql(with_alias=with_alias, subquery=subquery, **kwargs)
+
+        if querystring and self._query_hints:
+            if subquery:
+                raise QueryException("Query hints can only be given to the outermost statement")
+            querystring += self._option_sql()
+        return querystring
+
+    def _with_sql(self, **kwargs: Any) -> str:
+        # The bodies of the CTEs are not rendered as subqueries
+        if any(getattr(clause.query, "_query_hints", None) for clause in self._with):
+            raise QueryException("Query hints can only be given to the outermost statement")
+        return super()._with_sql(**kwargs)
+
+    def _with_table_hints(self) -> MSSQLQueryBuilder:
+        # Renders a copy of the query where the hinted tables are wrapped with their hints
+        def hinted(table: Selectable | None) -> Selectable | _HintedTable | None:
+            hints = [
+                hint for hinted_table, table_hints in self._table_hints if hinted_table == table for hint in table_hints
+            ]
+            return _HintedTable(table, hints) if hints else table
+
+        query = copy(self)
+        query._from = [hinted(table) for table in self._from]
+        query._update_table = hinted(self._update_table)
+        query._joins = []
+        for join in self._joins:
+            join = copy(join)
+            join.item = hinted(join.item)
+            query._joins.append(join)
+        return query
+
+    def _option_sql(self) -> str:
+        return " OPTION ({hints})".format(hints=",".join(self._query_hints))
 
     def _top_sql(self) -> str:
         _top_statement: str = ""
@@ -753,6 +1560,20 @@ class MSSQLQueryBuilder(FetchNextAndOffsetRowsQueryBuilder):
 
         return _top_statement
 
+    def _limit_rows(self, table: Selectable, key: Term, rows: int) -> MSSQLQueryBuilder:
+        return copy(self).top(rows)
+
+    def _without_pagination(self) -> MSSQLQueryBuilder:
+        newone = super()._without_pagination()
+        newone._top = None
+        return newone
+
+    def _limits_rows(self) -> bool:
+        return super()._limits_rows() or self._top is not None
+
+    def _delete_sql(self, **kwargs: Any) -> str:
+        return "DELETE {top}".format(top=self._top_sql()).rstrip()
+
     def _select_sql(self, **kwargs: Any) -> str:
         return "SELECT {distinct}{top}{select}".format(
             top=self._top_sql(),
@@ -761,6 +1582,18 @@ class MSSQLQueryBuilder(FetchNextAndOffsetRowsQueryBuilder):
         )
 
 
+class MSSQLMergeQueryBuilder(MergeQueryBuilder):
+    QUERY_CLS = MSSQLQuery
+    SUPPORTS_NOT_MATCHED_BY_SOURCE = True
+
+    def __init__(self) -> None:
+        super().__init__(dialect=Dialects.MSSQL)
+
+    def get_sql(self, **kwargs: Any) -> str:
+        # MERGE statements must be terminated by a semicolon
+        return super().get_sql(**kwargs) + ";"
+
+
 class ClickHouseQuery(Query):
     """
     Defines a query class for use with Yandex ClickHouse.
@@ -772,6 +1605,14 @@ class ClickHouseQuery(Query):
             dialect=Dialects.CLICKHOUSE, wrap_set_operation_queries=False, as_keyword=True, **kwargs
         )
 
+    @classmethod
+    def create_table(cls, table: str | Table) -> ClickHouseCreateQueryBuilder:
+        return ClickHouseCreateQueryBuilder().create_table(table)
+
+    @classmethod
+    def create_dictionary(cls, dictionary: str | Table) -> ClickHouseCreateDictionaryBuilder:
+        return ClickHouseCreateDictionaryBuilder().create_dictionary(dictionary)
+
     @classmethod
     def drop_database(self, database: Database | str) -> ClickHouseDropQueryBuilder:
         return ClickHouseDropQueryBuilder().drop_database(database)
@@ -796,9 +1637,135 @@ class ClickHouseQuery(Query):
     def drop_view(self, view: str) -> ClickHouseDropQueryBuilder:
         return ClickHouseDropQueryBuilder().drop_view(view)
 
+    @classmethod
+    def merge_into(cls, table: str | Table) -> MergeQueryBuilder:
+        raise DialectNotSupported("ClickHouse does not support MERGE")
+
+    @classmethod
+    def estimate_count(cls, table: str | Table) -> ClickHouseQueryBuilder:
+        # The rows of the active parts, rows replaced or collapsed by a pending merge are still counted
+        database, name = _catalog_name(table)
+        parts = Table("parts", schema="system")
+        return (
+            cls.from_(parts)
+            .select(Sum(parts.rows, alias="estimate"))
+            .where(parts.active == 1)
+            .where(parts.database == (Function("currentDatabase") if database is None else database))
+            .where(parts.table == name)
+        )
+
+
+# Expected value types of the most commonly tuned settings, used to catch mistakes before sending the query
+CLICKHOUSE_SETTING_TYPES = {
+    "max_threads": int,
+    "max_memory_usage": int,
+    "max_execution_time": (int, float),
+    "optimize_read_in_order": bool,
+    "max_block_size": int,
+    "index_granularity": int,
+    "index_granularity_bytes": int,
+}
+
+
+def _validate_clickhouse_settings(settings: dict[str, Any]) -> dict[str, Any]:
+    for name, value in settings.items():
+        expected = CLICKHOUSE_SETTING_TYPES.get(name)
+        if expected is None:
+            continue
+        if not isinstance(value, expected) or (expected is not bool and isinstance(value, bool)):
+            raise QueryException(
+                "Invalid value {value!r} for setting {name}, expected {expected}".format(
+                    value=value,
+                    name=name,
+                    expected=" or ".join(
+                        t.__name__ for t in (expected if isinstance(expected, tuple) else (expected,))
+                    ),
+                )
+            )
+    return settings
+
+
+def _clickhouse_settings_sql(settings: dict[str, Any]) -> str:
+    return " SETTINGS {settings}".format(
+        settings=",".join(
+            "{name}={value}".format(
+                name=name,
+                value=(
+                    int(value)
+                    if isinstance(value, bool)
+                    else ValueWrapper.get_formatted_value(value, secondary_quote_char="'")
+                ),
+            )
+            for name, value in settings.items()
+        )
+    )
+
+
+class ClickHouseExportQueryBuilder(ExportQueryBuilder):
+    FORMATS = (
+        "TabSeparated",
+        "TabSeparatedWithNames",
+        "TSV",
+        "CSV",
+        "CSVWithNames",
+        "JSONEachRow",
+        "Parquet",
+        "ORC",
+        "Arrow",
+        "Native",
+        "RowBinary",
+    )
+
+    def __init__(self, query: QueryBuilder, target: str, format: str | None = None, **options: Any) -> None:
+        unknown = set(options) - {"compression"}
+        if unknown:
+            raise QueryException("Unsupported export options: {}".format(", ".join(sorted(unknown))))
+        super().__init__(query, target, format=format, **options)
+
+    def get_sql(self, **kwargs: Any) -> str:
+        querystring = self._query.get_sql(**kwargs)
+
+        # Exporting to STDOUT only needs the FORMAT clause, the client takes care of the output
+        if self._target.upper() != "STDOUT":
+            querystring += " INTO OUTFILE {target}".format(target=format_quotes(self._target, "'"))
+            if "compression" in self._options:
+                querystring += " COMPRESSION {}".format(format_quotes(self._options["compression"], "'"))
+
+        if self._format is not None:
+            querystring += " FORMAT {format}".format(format=self._format)
+
+        return querystring
+
+
+class ClickHouseExplainQueryBuilder(ExplainQueryBuilder):
+    # The kinds of EXPLAIN, the JSON output is only available for the plan
+    FORMATS = {
+        "text": "PIPELINE",
+        "pipeline": "PIPELINE",
+        "plan": "PLAN",
+        "json": "PLAN json = 1",
+        "estimate": "ESTIMATE",
+    }
+    DEFAULT_FORMAT = "PIPELINE"
+
+    def estimated_rows(self, output: Any) -> int:
+        """
+        Returns the rows to read from the parts selected by the primary key, summing the rows returned by
+        ``EXPLAIN ESTIMATE``, given as tuples or as mappings.
+        """
+        return sum(int(row["rows"] if isinstance(row, Mapping) else row[3]) for row in output)
+
+    def get_sql(self, **kwargs: Any) -> str:
+        return "EXPLAIN {kind} {query}".format(kind=self._format, query=self._query.get_sql(**kwargs))
+
 
 class ClickHouseQueryBuilder(QueryBuilder):
     QUERY_CLS = ClickHouseQuery
+    EXPORT_CLS = ClickHouseExportQueryBuilder
+    EXPLAIN_CLS = ClickHouseExplainQueryBuilder
+    ESTIMATE_FORMAT = "estimate"
+    HASH_FUNCTION = "cityHash64"
+    HASH_UNSIGNED = True
 
     _distinct_on: list[Term]
     _limit_by: tuple[int, int, list[Term]] | None
@@ -810,12 +1777,27 @@ class ClickHouseQueryBuilder(QueryBuilder):
         self._sample_offset = None
         self._distinct_on = []
         self._limit_by = None
+        self._insert_format = None
+        self._settings = {}
+        self._array_join = None
+        self._left_array_join = False
 
     def __copy__(self) -> ClickHouseQueryBuilder:
         newone = super().__copy__()
         newone._limit_by = copy(self._limit_by)
+        newone._array_join = copy(self._array_join)
         return newone
 
+    def _count_keeps_selects(self) -> bool:
+        return super()._count_keeps_selects() or bool(self._distinct_on) or self._limit_by is not None
+
+    def _limits_rows(self) -> bool:
+        return super()._limits_rows() or bool(self._distinct_on) or self._limit_by is not None
+
+    def _clause_terms(self) -> list[Term]:
+        terms = super()._clause_terms() + self._distinct_on + (self._array_join or [])
+        return terms + self._limit_by[2] if self._limit_by is not None else terms
+
     @builder
     def final(self) -> None:
         self._final = True
@@ -825,6 +1807,192 @@ class ClickHouseQueryBuilder(QueryBuilder):
         self._sample = sample
         self._sample_offset = offset
 
+    @builder
+    def array_join(self, *terms: str | Term) -> None:
+        """
+        Adds an ARRAY JOIN clause, unfolding the given array columns or expressions into one row per element. Terms
+        can be aliased to refer to the unfolded values, e.g. ``array_join(table.tags.as_("tag"))``.
+        """
+        self._set_array_join(terms, left=False)
+
+    @builder
+    def left_array_join(self, *terms: str | Term) -> None:
+        """
+        Adds a LEFT ARRAY JOIN clause, which unlike ARRAY JOIN keeps the rows with empty arrays.
+        """
+        self._set_array_join(terms, left=True)
+
+    def _set_array_join(self, terms: Sequence[str | Term], left: bool) -> None:
+        if self._array_join:
+            raise AttributeError("'Query' object already has attribute array_join")
+        self._array_join = [Field(term) if isinstance(term, str) else term for term in terms]
+        self._left_array_join = left
+
+    def _array_join_sql(self, **kwargs: Any) -> str:
+        return " {left}ARRAY JOIN {terms}".format(
+            left="LEFT " if self._left_array_join else "",
+            terms=",".join(term.get_sql(with_alias=True, **kwargs) for term in self._array_join),
+        )
+
+    @builder
+    def use_dictionary(self, table: Table, dictionary: str) -> None:
+        """
+        Rewrites a LEFT JOIN on a table backed by a dictionary into dictGet lookups, which avoids building the hash
+        table of the join for every query.
+
+        Every column of the joined table is replaced by ``dictGet(dictionary,column,key)``, the key being taken from
+        the join condition. Rows without a match get the default values of the dictionary attributes, as with the
+        default ``join_use_nulls=0`` setting.
+
+        :param table:
+            The joined table.
+        :param dictionary:
+            The name of the dictionary, possibly qualified with its database.
+        :raises QueryException:
+            If the join is not a LEFT JOIN on equalities, or if the key columns or all columns of the joined table are
+            selected.
+        """
+        join = next((join for join in self._joins if join.item == table), None)
+        if join is None:
+            raise QueryException("Table {} is not joined".format(table))
+
+        key_columns, key = dictionary_join_key(join, table, self._from[0])
+
+        def replace(term: Term) -> Term | None:
+            if not isinstance(term, Field) or term.table != table:
+                return None
+            if isinstance(term, Star) or term.name in key_columns:
+                raise QueryException(
+                    "Column {} of a dictionary-backed table cannot be replaced by a lookup".format(term.name)
+                )
+            return DictGet(dictionary, term.name, key, alias=term.alias or term.name)
+
+        self._joins = [
+            copy(other) if isinstance(other, JoinOn) else other for other in self._joins if other is not join
+        ]
+        for other in self._joins:
+            if isinstance(other, JoinOn):
+                other.criterion = replace_terms(other.criterion, replace)
+
+        self._selects = replace_terms(self._selects, replace)
+        self._wheres = replace_terms(self._wheres, replace)
+        self._prewheres = replace_terms(self._prewheres, replace)
+        self._groupbys = replace_terms(self._groupbys, replace)
+        self._havings = replace_terms(self._havings, replace)
+        self._orderbys = replace_terms(self._orderbys, replace)
+        if self._array_join:
+            self._array_join = replace_terms(self._array_join, replace)
+
+    def any_join(self, item: Table | QueryBuilder | AliasedQuery) -> Joiner[Self]:
+        return self.join(item, JoinType.any)
+
+    def asof_join(self, item: Table | QueryBuilder | AliasedQuery) -> Joiner[Self]:
+        return self.join(item, JoinType.asof)
+
+    def left_asof_join(self, item: Table | QueryBuilder | AliasedQuery) -> Joiner[Self]:
+        return self.join(item, JoinType.left_asof)
+
+    def global_join(self, item: Table | QueryBuilder | AliasedQuery) -> Joiner[Self]:
+        return self.join(item, JoinType.global_inner)
+
+    def global_any_join(self, item: Table | QueryBuilder | AliasedQuery) -> Joiner[Self]:
+        return self.join(item, JoinType.global_any)
+
+    @builder
+    def format(self, format: str) -> None:
+        """
+        Sets the format of the data sent with an INSERT query, e.g. RowBinary, TSV or JSONEachRow. The rows are then
+        sent after the query instead of being rendered as VALUES, see `encode_rows`. Only the RowBinary, TabSeparated
+        (or TSV) and JSONEachRow formats can be encoded by `encode_rows`, the data of other formats such as CSV,
+        Parquet, ORC, Arrow or Native must be encoded by the caller.
+        """
+        formats = {name.upper(): name for name in ClickHouseExportQueryBuilder.FORMATS}
+        if format.upper() not in formats:
+            raise QueryException("Unsupported insert format '{format}'".format(format=format))
+        self._insert_format = formats[format.upper()]
+
+    @builder
+    def settings(self, **settings: Any) -> None:
+        """
+        Adds query level settings, e.g. ``settings(max_threads=4, max_execution_time=10)``, rendered in a SETTINGS
+        clause. The value types of the common settings listed in CLICKHOUSE_SETTING_TYPES are checked.
+        """
+        self._settings = {**self._settings, **_validate_clickhouse_settings(settings)}
+
+    def _set_timeout(self, milliseconds: int) -> None:
+        # The max_execution_time setting is given in seconds
+        self._timeout = milliseconds
+        seconds = milliseconds // 1000 if milliseconds % 1000 == 0 else milliseconds / 1000
+        self._settings = {**self._settings, "max_execution_time": seconds}
+
+    def encode_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        types: Sequence[type | tuple[type, int]] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[memoryview]:
+        """
+        Encodes rows in the format set with `format`, yielding the payload of the INSERT query in chunks.
+
+        :param rows:
+            An iterable of rows, each row being a sequence of values in the order of the inserted columns.
+        :param types:
+            The column types as type conversion functions of `pypika.clickhouse.type_conversion`, required for
+            RowBinary.
+        :param chunk_size:
+            The size in bytes after which a chunk is emitted.
+        """
+        if self._insert_format is None:
+            raise QueryException("An insert format must be set with format() before encoding rows")
+        if self._insert_format.upper() not in {name.upper() for name in ENCODED_FORMATS}:
+            raise QueryException(
+                "Rows cannot be encoded in format {format}, the supported formats are {formats}".format(
+                    format=self._insert_format, formats=", ".join(ENCODED_FORMATS)
+                )
+            )
+
+        columns = [column.name for column in self._columns]
+        return encode_rows(rows, self._insert_format, columns=columns, types=types, chunk_size=chunk_size)
+
+    def get_parameterized_sql(self, **values: Any) -> tuple[str, dict[str, str]]:
+        """
+        Renders the query with its `ClickHouseParameter` placeholders, and returns it with the values of the
+        parameters as the ``param_<name>`` arguments of the HTTP interface.
+
+        :param values:
+            The values of the parameters by name, overriding the values given to the parameters themselves.
+        :raises QueryException:
+            If a parameter has no value, or if a value does not match any parameter.
+        """
+        parameters = ClickHouseParameters()
+        sql = self.get_sql(parameter=parameters)
+        return sql, bind_parameters(parameters.get_parameters(), values)
+
+    def get_sql(self, *args: Any, **kwargs: Any) -> str:
+        if self._insert_format is None or self._insert_table is None:
+            querystring = super().get_sql(*args, **kwargs)
+            # UPDATE queries are rendered without going through the pagination
+            if self._update_table and self._settings and querystring:
+                querystring += _clickhouse_settings_sql(self._settings)
+            return querystring
+
+        if self._values or self._selects:
+            raise QueryException("An insert format cannot be combined with VALUES or SELECT")
+
+        self._set_kwargs_defaults(kwargs)
+        querystring = self._insert_sql(**kwargs)
+        if self._columns:
+            querystring += self._columns_sql(**kwargs)
+        if self._settings:
+            querystring += _clickhouse_settings_sql(self._settings)
+
+        return querystring + " FORMAT {format}".format(format=self._insert_format)
+
+    def _values_sql(self, **kwargs: Any) -> str:
+        # The SETTINGS of an INSERT query go before the inserted values
+        settings = _clickhouse_settings_sql(self._settings) if self._settings else ""
+        return settings + super()._values_sql(**kwargs)
+
     @staticmethod
     def _delete_sql(**kwargs: Any) -> str:
         return 'ALTER TABLE'
@@ -832,6 +2000,13 @@ class ClickHouseQueryBuilder(QueryBuilder):
     def _update_sql(self, **kwargs: Any) -> str:
         return "ALTER TABLE {table}".format(table=self._update_table.get_sql(**kwargs))
 
+    def _limit_rows(self, table: Selectable, key: Term, rows: int) -> ClickHouseQueryBuilder:
+        # Mutations are asynchronous and report no affected rows, so the chunks of ChunkedQuery.run never end
+        raise DialectNotSupported("Chunks of a limited number of rows are not supported by ClickHouse mutations")
+
+    def _join_update_values(self, values: ValuesTable, criterion: Criterion) -> None:
+        raise DialectNotSupported("ClickHouse mutations cannot read from other tables, use a dictionary instead")
+
     def _from_sql(self, with_namespace: bool = False, **kwargs: Any) -> str:
         selectable = ",".join(clause.get_sql(subquery=True, with_alias=True, **kwargs) for clause in self._from)
         if self._delete_from:
@@ -843,7 +2018,12 @@ class ClickHouseQueryBuilder(QueryBuilder):
             clauses.append(f"SAMPLE {self._sample}")
         if self._sample_offset is not None:
             clauses.append(f"OFFSET {self._sample_offset}")
-        return " FROM {clauses}".format(clauses=" ".join(clauses))
+        sql = " FROM {clauses}".format(clauses=" ".join(clauses))
+
+        # ARRAY JOIN follows the FROM clause, before any regular JOIN
+        if self._array_join:
+            sql += self._array_join_sql(with_namespace=with_namespace, **kwargs)
+        return sql
 
     def _set_sql(self, **kwargs: Any) -> str:
         return " UPDATE {set}".format(
@@ -884,10 +2064,15 @@ class ClickHouseQueryBuilder(QueryBuilder):
         # this is good enough.
         if self._limit_by:
             querystring += self._limit_by_sql(**kwargs)
-        return super()._apply_pagination(querystring, **kwargs)
+        querystring = super()._apply_pagination(querystring, **kwargs)
+
+        # SETTINGS always come last, after any LIMIT BY and LIMIT clauses
+        if self._settings:
+            querystring += _clickhouse_settings_sql(self._settings)
+        return querystring
 
     def _limit_by_sql(self, **kwargs: Any) -> str:
-        (n, offset, by) = self._limit_by
+        n, offset, by = self._limit_by
         by = ",".join(term.get_sql(with_alias=True, **kwargs) for term in by)
         if offset != 0:
             return f" LIMIT {n} OFFSET {offset} BY ({by})"
@@ -902,15 +2087,300 @@ class ClickHouseQueryBuilder(QueryBuilder):
                 self._limit_by[1],
                 [column.replace_table(current_table, new_table) for column in self._limit_by[2]],
             )
+        if self._array_join:
+            newone._array_join = [term.replace_table(current_table, new_table) for term in self._array_join]
         return newone
 
 
+class ClickHouseCreateQueryBuilder(CreateQueryBuilder):
+    """
+    Query builder used to build ClickHouse CREATE TABLE queries, with the engine and the storage clauses of the
+    MergeTree family.
+    """
+
+    QUERY_CLS = ClickHouseQuery
+
+    def __init__(self) -> None:
+        super().__init__(dialect=Dialects.CLICKHOUSE)
+        self._cluster_name = None
+        self._as_table = None
+        self._engine = None
+        self._order_by = []
+        self._partition_by = []
+        self._sample_by = None
+        self._ttls = []
+        self._indexes = []
+        self._projections = []
+        self._settings = {}
+
+    @builder
+    def on_cluster(self, cluster: str) -> None:
+        if self._cluster_name:
+            raise AttributeError("'Query' object already has attribute cluster_name")
+        self._cluster_name = cluster
+
+    @builder
+    def as_table(self, table: str | Table) -> None:
+        """
+        Creates the table with the structure of another table, typically a Distributed table over local tables.
+        """
+        if self._columns:
+            raise QueryException("A table created as another table cannot have columns")
+        self._as_table = table if isinstance(table, Table) else Table(table)
+
+    def columns(self, *columns: str | tuple[str, str] | Column) -> ClickHouseCreateQueryBuilder:
+        if self._as_table is not None:
+            raise QueryException("The columns of a table created as another table cannot be given")
+        return super().columns(*columns)
+
+    @builder
+    def engine(self, engine: Engine | str) -> None:
+        """
+        Sets the table engine.
+
+        :param engine:
+            An engine of `pypika.clickhouse.engines` or the name of an engine without arguments.
+        """
+        if self._engine is not None:
+            raise AttributeError("'Query' object already has attribute engine")
+        self._engine = Engine(engine) if isinstance(engine, str) else engine
+
+    @builder
+    def order_by(self, *terms: str | Term) -> None:
+        self._order_by = self._order_by + self._prepare_terms(terms)
+
+    @builder
+    def partition_by(self, *terms: str | Term) -> None:
+        self._partition_by = self._partition_by + self._prepare_terms(terms)
+
+    @builder
+    def sample_by(self, term: str | Term) -> None:
+        self._sample_by = self._prepare_terms([term])[0]
+
+    @builder
+    def ttl(self, expression: Term, action: str | None = None) -> None:
+        """
+        Adds a TTL rule.
+
+        :param expression:
+            The expression giving the expiration time of a row, e.g. ``table.ts + Interval(months=1)``.
+        :param action:
+            What to do with expired rows, e.g. ``DELETE`` or ``TO VOLUME 'cold'``. Rows are deleted by default.
+        """
+        self._ttls = self._ttls + [(expression, action)]
+
+    @builder
+    def index(self, name: str, expression: str | Term, index_type: str, granularity: int = 1) -> None:
+        """
+        Adds a data skipping index.
+
+        :param index_type:
+            The type of the index with its parameters, e.g. ``minmax``, ``set(100)`` or ``bloom_filter(0.01)``.
+        :param granularity:
+            The number of granules covered by each block of the index.
+        """
+        self._indexes = self._indexes + [(name, self._prepare_terms([expression])[0], index_type, granularity)]
+
+    @builder
+    def projection(self, name: str, query: QueryBuilder) -> None:
+        """
+        Adds a projection, storing the data of the table sorted or pre-aggregated differently.
+
+        :param query:
+            The query of the projection, without a FROM clause.
+        """
+        if not isinstance(query, QueryBuilder):
+            raise TypeError("Expected 'query' to be instance of QueryBuilder")
+        self._projections = self._projections + [(name, query)]
+
+    @builder
+    def settings(self, **settings: Any) -> None:
+        self._settings = {**self._settings, **_validate_clickhouse_settings(settings)}
+
+    @staticmethod
+    def _prepare_terms(terms: Sequence[str | Term]) -> list[Term]:
+        return [Field(term) if isinstance(term, str) else term for term in terms]
+
+    def get_sql(self, **kwargs: Any) -> str:
+        self._set_kwargs_defaults(kwargs)
+        if self._uniques or self._foreign_key or self._period_fors or self._with_system_versioning:
+            raise DialectNotSupported(
+                "Unique keys, foreign keys, periods and system versioning are not supported by ClickHouse tables"
+            )
+
+        if self._create_table and self._as_table and not self._as_select:
+            return "{create_table} AS {table}{table_options}".format(
+                create_table=self._create_table_sql(**kwargs),
+                table=self._as_table.get_sql(**kwargs),
+                table_options=self._table_options_sql(**kwargs),
+            )
+
+        return super().get_sql(**kwargs)
+
+    def _create_table_sql(self, **kwargs: Any) -> str:
+        sql = super()._create_table_sql(**kwargs)
+        if self._cluster_name is not None:
+            sql += " ON CLUSTER " + format_quotes(self._cluster_name, kwargs.get("quote_char"))
+        return sql
+
+    def _body_sql(self, **kwargs: Any) -> str:
+        clauses = self._column_clauses(**kwargs)
+        clauses += [
+            "INDEX {name} {expression} TYPE {index_type} GRANULARITY {granularity}".format(
+                name=format_quotes(name, kwargs.get("quote_char")),
+                expression=expression.get_sql(**kwargs),
+                index_type=index_type,
+                granularity=granularity,
+            )
+            for name, expression, index_type, granularity in self._indexes
+        ]
+        clauses += [
+            "PROJECTION {name} ({query})".format(
+                name=format_quotes(name, kwargs.get("quote_char")), query=query.get_sql(**kwargs)
+            )
+            for name, query in self._projections
+        ]
+        return ",".join(clauses)
+
+    def _table_options_sql(self, **kwargs: Any) -> str:
+        sql = ""
+        if self._engine is not None:
+            sql += " ENGINE = " + self._engine.get_sql(**kwargs)
+        if self._order_by:
+            sql += " ORDER BY " + self._key_sql(self._order_by, **kwargs)
+        if self._partition_by:
+            sql += " PARTITION BY " + self._key_sql(self._partition_by, **kwargs)
+        if self._primary_key:
+            sql += " PRIMARY KEY " + self._key_sql([Field(column.name) for column in self._primary_key], **kwargs)
+        if self._sample_by is not None:
+            sql += " SAMPLE BY " + self._sample_by.get_sql(**kwargs)
+        if self._ttls:
+            sql += " TTL " + ",".join(
+                expression.get_sql(**kwargs) + (" " + action if action else "") for expression, action in self._ttls
+            )
+        if self._settings:
+            sql += _clickhouse_settings_sql(self._settings)
+        return sql
+
+    @staticmethod
+    def _key_sql(terms: list[Term], **kwargs: Any) -> str:
+        if len(terms) == 1:
+            return terms[0].get_sql(**kwargs)
+        return "({})".format(",".join(term.get_sql(**kwargs) for term in terms))
+
+    def _as_select_sql(self, **kwargs: Any) -> str:
+        return "{table_options} AS {query}".format(
+            table_options=self._table_options_sql(**kwargs),
+            query=self._as_select.get_sql(**kwargs),
+        )
+
+
+class ClickHouseCreateDictionaryBuilder(CreateQueryBuilder):
+    """
+    Query builder used to build ClickHouse CREATE DICTIONARY queries.
+    """
+
+    QUERY_CLS = ClickHouseQuery
+
+    def __init__(self) -> None:
+        super().__init__(dialect=Dialects.CLICKHOUSE)
+        self._cluster_name = None
+        self._source = None
+        self._layout = None
+        self._lifetime = None
+        self._range = None
+
+    @builder
+    def create_dictionary(self, dictionary: str | Table) -> None:
+        if self._create_table:
+            raise AttributeError("'Query' object already has attribute create_dictionary")
+        self._create_table = dictionary if isinstance(dictionary, Table) else Table(dictionary)
+
+    @builder
+    def on_cluster(self, cluster: str) -> None:
+        if self._cluster_name:
+            raise AttributeError("'Query' object already has attribute cluster_name")
+        self._cluster_name = cluster
+
+    @builder
+    def source(self, source: DictionarySource | str, **parameters: Any) -> None:
+        """
+        Sets the source of the dictionary.
+
+        :param source:
+            A `DictionarySource`, or the type of the source with its parameters given as keyword arguments, e.g.
+            ``source("clickhouse", table="users")``.
+        """
+        self._source = DictionarySource(source, **parameters) if isinstance(source, str) else source
+
+    @builder
+    def layout(self, layout: DictionaryLayout | str, **parameters: Any) -> None:
+        """
+        Sets how the dictionary is stored in memory, e.g. ``flat``, ``hashed`` or ``range_hashed``.
+        """
+        self._layout = DictionaryLayout(layout, **parameters) if isinstance(layout, str) else layout
+
+    @builder
+    def lifetime(self, min_seconds: int, max_seconds: int | None = None) -> None:
+        """
+        Sets how often the dictionary is reloaded. The server picks a random time in the range, if given, so that the
+        replicas do not all reload at once.
+        """
+        self._lifetime = (min_seconds, max_seconds)
+
+    @builder
+    def range(self, min_column: str | Column, max_column: str | Column) -> None:
+        """
+        Sets the columns bounding the validity of each row of a RANGE_HASHED dictionary.
+        """
+        self._range = self._prepare_columns_input([min_column, max_column])
+
+    def get_sql(self, **kwargs: Any) -> str:
+        if self._create_table and self._columns:
+            if self._source is None or self._layout is None:
+                raise QueryException("A dictionary requires a source and a layout")
+            if not self._primary_key:
+                raise QueryException("A dictionary requires a primary key")
+            if self._layout.is_range != (self._range is not None):
+                raise QueryException("A range is required by, and only allowed with, range layouts")
+
+        return super().get_sql(**kwargs)
+
+    def _create_table_sql(self, **kwargs: Any) -> str:
+        sql = "CREATE DICTIONARY {if_not_exists}{dictionary}".format(
+            if_not_exists="IF NOT EXISTS " if self._if_not_exists else "",
+            dictionary=self._create_table.get_sql(**kwargs),
+        )
+        if self._cluster_name is not None:
+            sql += " ON CLUSTER " + format_quotes(self._cluster_name, kwargs.get("quote_char"))
+        return sql
+
+    def _body_sql(self, **kwargs: Any) -> str:
+        return ",".join(self._column_clauses(**kwargs))
+
+    def _table_options_sql(self, **kwargs: Any) -> str:
+        sql = " PRIMARY KEY " + ",".join(column.get_name_sql(**kwargs) for column in self._primary_key)
+        sql += " SOURCE({source}) LAYOUT({layout})".format(
+            source=self._source.get_sql(**kwargs), layout=self._layout.get_sql(**kwargs)
+        )
+        if self._lifetime is not None:
+            min_seconds, max_seconds = self._lifetime
+            if max_seconds is None:
+                sql += " LIFETIME({})".format(min_seconds)
+            else:
+                sql += " LIFETIME(MIN {} MAX {})".format(min_seconds, max_seconds)
+        if self._range is not None:
+            sql += " RANGE(MIN {} MAX {})".format(*(column.get_name_sql(**kwargs) for column in self._range))
+        return sql
+
+
 class ClickHouseDropQueryBuilder(DropQueryBuilder):
     QUERY_CLS = ClickHouseQuery
 
     def __init__(self):
         super().__init__(dialect=Dialects.CLICKHOUSE)
         self._cluster_name = None
+        self._settings = {}
 
     @builder
     def drop_dictionary(self, dictionary: str) -> None:
@@ -926,12 +2396,19 @@ class ClickHouseDropQueryBuilder(DropQueryBuilder):
             raise AttributeError("'DropQuery' object already has attribute cluster_name")
         self._cluster_name = cluster
 
+    @builder
+    def settings(self, **settings: Any) -> None:
+        self._settings = {**self._settings, **_validate_clickhouse_settings(settings)}
+
     def get_sql(self, **kwargs: Any) -> str:
         query = super().get_sql(**kwargs)
 
         if self._drop_target_kind != "DICTIONARY" and self._cluster_name is not None:
             query += " ON CLUSTER " + format_quotes(self._cluster_name, super().QUOTE_CHAR)
 
+        if self._settings:
+            query += _clickhouse_settings_sql(self._settings)
+
         return query
 
 
@@ -951,9 +2428,27 @@ class SQLLiteQuery(Query):
     def _builder(cls, **kwargs: Any) -> SQLLiteQueryBuilder:
         return SQLLiteQueryBuilder(**kwargs)
 
+    @classmethod
+    def merge_into(cls, table: str | Table) -> MergeQueryBuilder:
+        raise DialectNotSupported("SQLite does not support MERGE, use `insert_or_replace` instead")
+
+
+class SQLLiteExplainQueryBuilder(ExplainQueryBuilder):
+    """
+    Renders ``EXPLAIN QUERY PLAN``, whose rows can be parsed with `pypika.plans.parse_sqlite_plan`. The bare EXPLAIN
+    of SQLite lists the bytecode of the statement rather than its plan.
+    """
+
+    FORMATS = {"text": "QUERY PLAN"}
+    DEFAULT_FORMAT = "QUERY PLAN"
+
+    def get_sql(self, **kwargs: Any) -> str:
+        return "EXPLAIN QUERY PLAN " + self._query.get_sql(**kwargs)
+
 
 class SQLLiteQueryBuilder(QueryBuilder):
     QUERY_CLS = SQLLiteQuery
+    EXPLAIN_CLS = SQLLiteExplainQueryBuilder
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(dialect=Dialects.SQLLITE, wrapper_cls=SQLLiteValueWrapper, **kwargs)
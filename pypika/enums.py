@@ -66,6 +66,22 @@ class JoinType(Enum):
     cross = "CROSS"
     hash = "HASH"
 
+    # ClickHouse join strictness and distribution modifiers
+    any = "ANY"
+    all = "ALL"
+    asof = "ASOF"
+    left_any = "LEFT ANY"
+    left_all = "LEFT ALL"
+    left_asof = "LEFT ASOF"
+    left_semi = "LEFT SEMI"
+    left_anti = "LEFT ANTI"
+    global_inner = "GLOBAL INNER"
+    global_left = "GLOBAL LEFT"
+    global_any = "GLOBAL ANY"
+    global_all = "GLOBAL ALL"
+    global_left_any = "GLOBAL LEFT ANY"
+    global_left_all = "GLOBAL LEFT ALL"
+
 
 class ReferenceOption(Enum):
     cascade = "CASCADE"
@@ -4,9 +4,8 @@ Package for SQL functions wrappers
 
 from __future__ import annotations
 
-from pypika import Field
 from pypika.enums import SqlTypes
-from pypika.terms import AggregateFunction, Function, LiteralValue, Star, Term
+from pypika.terms import AggregateFunction, Field, Function, LiteralValue, Star, Term
 from pypika.utils import builder
 
 __author__ = "Timothy Heys"
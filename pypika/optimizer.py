@@ -0,0 +1,384 @@
+"""
+Rewrites of queries returning the same rows with less work for the database, applied by `QueryBuilder.optimize`.
+They are useful for the queries built by wrapping other queries, as not every database optimizes across subqueries
+and CTEs, e.g. PostgreSQL before version 12 materializes every CTE.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from copy import deepcopy
+
+from pypika.enums import Boolean, JoinType, SetOperation
+from pypika.queries import AliasedQuery, QueryBuilder, Selectable, Table, _SetOperation
+from pypika.terms import (
+    AnalyticFunction,
+    ComplexCriterion,
+    Criterion,
+    Field,
+    Function,
+    Rollup,
+    Star,
+    Term,
+    ValueWrapper,
+    replace_terms,
+)
+
+# The joins keeping every row of the FROM clause, and the joins keeping only the rows matching the joined item
+_PRESERVING_JOINS = (JoinType.inner, JoinType.left, JoinType.left_outer, JoinType.cross)
+_FILTERING_JOINS = (JoinType.inner, JoinType.cross)
+# Functions returning several rows for each row, selecting them changes the number of rows
+_ROW_FUNCTIONS = {"ARRAYJOIN", "UNNEST", "GENERATE_SERIES", "JSON_ARRAY_ELEMENTS", "JSONB_ARRAY_ELEMENTS"}
+
+
+def push_down_predicates(query: QueryBuilder) -> QueryBuilder:
+    """
+    Returns a copy of the query where the conditions of the WHERE clauses using the columns of a single subquery or
+    CTE are moved into the WHERE clause of that subquery or CTE, so that its rows are filtered before they are
+    materialized. A condition is only moved when it gives the same results, i.e. when:
+
+    - the columns are selected as is by the subquery, not computed
+    - the subquery has no LIMIT or OFFSET, and is either not grouped or grouped by the columns
+    - the window functions of the subquery are partitioned by the columns
+    - the subquery is not on the outer side of an outer join, and a CTE is only used once
+    """
+    query = deepcopy(query)
+    _push_down(query, query, {})
+    return query
+
+
+def _queries(selectable: Selectable, seen: set[int] | None = None) -> Iterator[QueryBuilder]:
+    # The query and every query nested in it
+    seen = set() if seen is None else seen
+    if id(selectable) in seen:
+        return
+    seen.add(id(selectable))
+
+    if isinstance(selectable, _SetOperation):
+        yield from _queries(selectable.base_query, seen)
+        for _, query in selectable._set_operation:
+            yield from _queries(query, seen)
+        return
+    if not isinstance(selectable, QueryBuilder):
+        return
+
+    yield selectable
+    for cte in selectable._with:
+        yield from _queries(cte.query, seen)
+    for item in _sources(selectable):
+        yield from _queries(item, seen)
+    for term in _terms(selectable):
+        for node in term.nodes_():
+            yield from _queries(node, seen)
+
+
+def _sources(query: QueryBuilder) -> list[Selectable]:
+    return query._from + [join.item for join in query._joins]
+
+
+def _terms(query: QueryBuilder) -> list[Term]:
+    # The values set by UPDATE and upserts and the RETURNING terms use the columns of the sources too. The dialect
+    # attributes are read from vars, as the missing attributes of a query are fields.
+    attributes = vars(query)
+    updates = [
+        *query._updates,
+        *attributes.get("_duplicate_updates", []),
+        *attributes.get("_on_conflict_do_updates", []),
+    ]
+    terms = [*query._selects, *query._clause_terms(), *attributes.get("_returns", [])]
+    terms += [value for _, value in updates]
+    terms += [attributes.get("_on_conflict_wheres"), attributes.get("_on_conflict_do_update_wheres")]
+    return [term for term in terms if isinstance(term, Term)]
+
+
+def _conjuncts(criterion: Term) -> list[Term]:
+    if isinstance(criterion, ComplexCriterion) and criterion.comparator == Boolean.and_:
+        return _conjuncts(criterion.left) + _conjuncts(criterion.right)
+    return [criterion]
+
+
+def _same_source(first: Selectable | None, second: Selectable | None) -> bool:
+    # Queries compare to criteria, the other selectables compare by name
+    if isinstance(first, (QueryBuilder, _SetOperation)) or isinstance(second, (QueryBuilder, _SetOperation)):
+        return first is second
+    return first == second
+
+
+def _selected_column(query: QueryBuilder, name: str) -> Field | None:
+    """
+    Returns the column selected as is by the query under a name, if any.
+    """
+    matches = [
+        select
+        for select in query._selects
+        if not isinstance(select, Star) and (select.alias or getattr(select, "name", None)) == name
+    ]
+    if len(matches) == 1:
+        return matches[0] if isinstance(matches[0], Field) else None
+    if matches:
+        return None
+
+    # The columns of the single table of the query selected with a star
+    if len(query._from) == 1 and not query._joins and any(isinstance(select, Star) for select in query._selects):
+        return Field(name, table=query._from[0])
+    return None
+
+
+def _partitions_by(function: AnalyticFunction, column: Field) -> bool:
+    return any(
+        term == column.name if isinstance(term, str) else isinstance(term, Field) and term.name == column.name
+        for term in function._partition
+    )
+
+
+def _can_filter(query: QueryBuilder, columns: list[Field]) -> bool:
+    """
+    Returns whether filtering the rows of the query on the columns gives the same rows as filtering its results.
+    """
+    if query._limits_rows() or query._unions or query._update_table or query._delete_from or query._insert_table:
+        return False
+
+    if query._groupbys:
+        if query._mysql_rollup or query._with_totals or any(isinstance(term, Rollup) for term in query._groupbys):
+            return False
+        keys = [term for term in query._groupbys if isinstance(term, Field)]
+        if not all(
+            any(key.name == column.name and _same_source(key.table, column.table) for key in keys) for column in columns
+        ):
+            return False
+    elif query._havings is not None or any(select.is_aggregate for select in query._selects):
+        # An ungrouped HAVING filters the single group of all the rows
+        return False
+
+    terms = [*query._selects, query._qualifys] if query._qualifys is not None else query._selects
+    windows = [function for term in terms for function in term.find_(AnalyticFunction)]
+    return all(_partitions_by(function, column) for function in windows if function._include_over for column in columns)
+
+
+def _push_down(root: QueryBuilder, query: QueryBuilder, ctes: dict[str, AliasedQuery]) -> None:
+    ctes = {**ctes, **{cte.name: cte for cte in query._with}}
+
+    if query._wheres is not None and all(join.how in _PRESERVING_JOINS for join in query._joins):
+        targets = query._from + [join.item for join in query._joins if join.how in _FILTERING_JOINS]
+        remaining = []
+        for criterion in _conjuncts(query._wheres):
+            if not _push_down_criterion(root, query, criterion, targets, ctes):
+                remaining.append(criterion)
+        query._wheres = Criterion.all(remaining) if remaining else None
+
+    # The later CTEs first, as they may use the earlier ones
+    for cte in reversed(query._with):
+        if isinstance(cte.query, QueryBuilder):
+            _push_down(root, cte.query, ctes)
+    for item in _sources(query):
+        if isinstance(item, QueryBuilder):
+            _push_down(root, item, ctes)
+
+
+def _push_down_criterion(
+    root: QueryBuilder,
+    query: QueryBuilder,
+    criterion: Term,
+    targets: list[Selectable],
+    ctes: dict[str, AliasedQuery],
+) -> bool:
+    fields = criterion.find_(Field)
+    tables = {id(field.table) for field in fields}
+    if not fields or any(
+        isinstance(node, (QueryBuilder, _SetOperation)) and id(node) not in tables for node in criterion.nodes_()
+    ):
+        return False
+
+    sources = []
+    for field in fields:
+        source = field.table
+        if source is None:
+            # Unqualified fields belong to the only table of the query
+            if len(query._from) != 1 or query._joins:
+                return False
+            source = query._from[0]
+        if not any(_same_source(source, other) for other in sources):
+            sources.append(source)
+    if len(sources) != 1:
+        return False
+
+    source = sources[0]
+    target = next((item for item in targets if _same_source(item, source)), None)
+    if isinstance(target, AliasedQuery):
+        cte = ctes.get(target.name)
+        references = [
+            item
+            for nested in _queries(root)
+            for item in _sources(nested)
+            if (isinstance(item, AliasedQuery) and item.name == target.name) or _reads_cte_as_table(item, target)
+        ]
+        if cte is None or len(references) != 1:
+            return False
+        target = cte.query
+    if not isinstance(target, QueryBuilder):
+        return False
+
+    columns = {id(field): _selected_column(target, field.name) for field in fields}
+    if any(column is None for column in columns.values()) or not _can_filter(target, list(columns.values())):
+        return False
+
+    pushed = replace_terms(
+        criterion,
+        lambda term: Field(columns[id(term)].name, table=columns[id(term)].table) if id(term) in columns else None,
+    )
+    target._wheres = pushed if target._wheres is None else target._wheres & pushed
+    return True
+
+
+def prune_columns(query: QueryBuilder) -> QueryBuilder:
+    """
+    Returns a copy of the query where the columns selected by subqueries and CTEs but not used by the queries reading
+    them are removed, so that the database does not read them, which matters most for column stores. The columns of
+    a subquery are kept when:
+
+    - they are read with a star, e.g. ``SELECT *`` or ``SELECT "sq0".*``
+    - the subquery selects DISTINCT rows, or is a UNION, INTERSECT or EXCEPT other than UNION ALL
+    - they are used by the subquery itself, e.g. by alias in its ORDER BY or GROUP BY clause
+    - they change the number of rows, e.g. ``arrayJoin`` or ``unnest``, or the only aggregate without a GROUP BY
+    """
+    query = deepcopy(query)
+    pruned = True
+    while pruned:
+        pruned = False
+        for source, target in list(_prunable_sources(query)):
+            pruned = _prune(query, source, target) or pruned
+    return query
+
+
+def _prunable_sources(root: QueryBuilder) -> Iterator[tuple[Selectable, Selectable]]:
+    # The subqueries and CTEs, with the query selecting their columns
+    for query in _queries(root):
+        for cte in query._with:
+            yield cte, cte.query
+        for item in _sources(query):
+            if isinstance(item, (QueryBuilder, _SetOperation)):
+                yield item, item
+
+
+def _used_columns(root: QueryBuilder, source: Selectable) -> set[str] | None:
+    """
+    Returns the names of the columns of a subquery or CTE used anywhere in the query, or None when all its columns
+    are used.
+    """
+    names, referenced = set(), False
+    for query in _queries(root):
+        if any(_reads_cte_as_table(item, source) for item in _sources(query)):
+            return None
+        uses_source = any(_same_source(item, source) for item in _sources(query))
+        referenced = referenced or uses_source
+        for term in _terms(query):
+            for field in term.find_(Field):
+                if _reads_cte_as_table(field.table, source):
+                    return None
+                # Unqualified fields may belong to any table of the query
+                if (field.table is None and uses_source) or (
+                    field.table is not None and _same_source(field.table, source)
+                ):
+                    if not isinstance(field, Star):
+                        names.add(field.name)
+                    # COUNT(*) reads no column, COUNT("sq0".*) tests whether they are all null
+                    elif field is term or field.table is not None:
+                        return None
+
+    # The columns of a CTE read in an unknown way, e.g. by name in a raw string, are kept
+    if isinstance(source, AliasedQuery) and not referenced:
+        return None
+    return names
+
+
+def _reads_cte_as_table(table: Selectable | None, source: Selectable) -> bool:
+    # A CTE read as a table, e.g. Table("cte"), rather than as an AliasedQuery
+    return (
+        isinstance(source, AliasedQuery)
+        and isinstance(table, Table)
+        and table._schema is None
+        and table._table_name == source.name
+    )
+
+
+def _output_name(select: Term) -> str | None:
+    return select.alias or getattr(select, "name", None)
+
+
+def _generates_rows(select: Term) -> bool:
+    return any(function.name.upper() in _ROW_FUNCTIONS for function in select.find_(Function))
+
+
+def _is_positional(query: QueryBuilder) -> bool:
+    # GROUP BY 1 or ORDER BY 1 refer to the selects by position
+    terms = [*query._groupbys, *(term for term, _ in query._orderbys)]
+    return any(isinstance(term, ValueWrapper) and isinstance(term.value, int) for term in terms)
+
+
+def _can_prune(query: Selectable) -> bool:
+    return (
+        isinstance(query, QueryBuilder)
+        and not query._distinct
+        and not query._unions
+        and not (query._update_table or query._delete_from or query._insert_table)
+        and not _is_positional(query)
+    )
+
+
+def _needed_positions(query: QueryBuilder, names: set[str]) -> set[int]:
+    """
+    Returns the positions of the selects of the query to keep for the used names.
+    """
+    # The names used by the other clauses may refer to aliases, as may the kept selects in some dialects
+    aliases = {field.name for term in query._clause_terms() for field in term.find_(Field)}
+    while True:
+        positions = {
+            position
+            for position, select in enumerate(query._selects)
+            if isinstance(select, Star)
+            or _output_name(select) in names
+            or select.alias in aliases
+            or _generates_rows(select)
+        }
+        referenced = {field.name for position in positions for field in query._selects[position].find_(Field)}
+        if referenced <= aliases:
+            break
+        aliases |= referenced
+
+    # An aggregate without a GROUP BY returns a single row
+    aggregates = [position for position, select in enumerate(query._selects) if select.is_aggregate]
+    if not query._groupbys and aggregates and not positions & set(aggregates):
+        positions.add(aggregates[0])
+    return positions
+
+
+def _prune(root: QueryBuilder, source: Selectable, target: Selectable) -> bool:
+    names = _used_columns(root, source)
+    if names is None:
+        return False
+
+    if isinstance(target, _SetOperation):
+        arms = [target.base_query] + [query for _, query in target._set_operation]
+        if any(operation != SetOperation.union_all for operation, _ in target._set_operation) or not all(
+            _can_prune(arm)
+            and len(arm._selects) == len(arms[0]._selects)
+            and not any(isinstance(select, Star) for select in arm._selects)
+            for arm in arms
+        ):
+            return False
+        # The columns of a UNION are named by its first query and ordered by name
+        names |= {field.name for term, _ in target._orderbys for field in term.find_(Field)}
+        positions = set().union(*(_needed_positions(arm, names if arm is arms[0] else set()) for arm in arms))
+    elif _can_prune(target):
+        arms = [target]
+        positions = _needed_positions(target, names)
+    else:
+        return False
+
+    # A query selects at least one column
+    positions = positions or {0}
+    if len(positions) == len(arms[0]._selects):
+        return False
+    for arm in arms:
+        arm._selects = [select for position, select in enumerate(arm._selects) if position in positions]
+    return True
@@ -0,0 +1,45 @@
+"""
+Runs the partitions of a query concurrently, e.g. to export a large table over several connections::
+
+    def execute(query):
+        with pool.connection() as connection:
+            return connection.execute(str(query)).fetchall()
+
+    results = run_partitions(query.partition_by_hash(orders.id, 8), execute)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def run_partitions(
+    queries: Sequence[Any],
+    execute: Callable[[Any], T],
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> list[T]:
+    """
+    Runs `execute` on every query concurrently and returns the results in the order of the queries. An exception
+    raised by `execute` is raised again in the calling thread.
+
+    :param queries:
+        The queries returned by `QueryBuilder.partition_by_range` or `QueryBuilder.partition_by_hash`.
+    :param execute:
+        Runs a query and returns its result. It is called from the threads of the pool, so each call should use its
+        own connection.
+    :param max_workers:
+        The number of threads, defaults to one per query.
+    :param executor:
+        The executor running the queries instead of a new thread pool, e.g. a shared pool or a
+        ``ProcessPoolExecutor`` when the results are processed by `execute`.
+    """
+    if executor is not None:
+        return list(executor.map(execute, queries))
+
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(queries), 1)) as pool:
+        return list(pool.map(execute, queries))
@@ -0,0 +1,136 @@
+"""
+Query plans returned by the EXPLAIN statements of `QueryBuilder.explain`, e.g. to check the plans of the queries in a
+test suite::
+
+    rows = connection.execute(str(query.explain())).fetchall()
+    plan = parse_sqlite_plan(rows)
+    assert not plan.full_scans(), plan
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+# e.g. "SCAN t", "SCAN TABLE t AS a USING INDEX ix" or "SEARCH t USING COVERING INDEX ix (a=?)"
+_SQLITE_ACCESS = re.compile(
+    r"^(?P<operation>SCAN|SEARCH) (?:TABLE )?(?P<table>\S+)(?: AS (?P<alias>\S+))?"
+    r"(?: USING (?:(?:COVERING )?INDEX (?P<index>\S+)|INTEGER PRIMARY KEY|ROWID))?"
+)
+# Nodes defining the subqueries and views scanned by other nodes
+_SQLITE_SUBQUERY = re.compile(r"^(?:MATERIALIZE|CO-ROUTINE) (?P<name>\S+)")
+
+
+class PlanNode:
+    """
+    A step of a query plan.
+
+    :param detail:
+        The description of the step given by the database.
+    :param operation:
+        The kind of step, e.g. ``SCAN`` or ``SEARCH``.
+    :param table:
+        The table read by the step, if any.
+    :param index:
+        The index used to read the table, if any.
+    :param full_scan:
+        Whether the step reads every row of a table.
+    """
+
+    def __init__(
+        self,
+        detail: str,
+        operation: str | None = None,
+        table: str | None = None,
+        index: str | None = None,
+        full_scan: bool = False,
+    ) -> None:
+        self.detail = detail
+        self.operation = operation
+        self.table = table
+        self.index = index
+        self.full_scan = full_scan
+        self.children = []
+
+    def walk(self) -> Iterator[PlanNode]:
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def _lines(self, depth: int) -> Iterator[str]:
+        yield "  " * depth + self.detail
+        for child in self.children:
+            yield from child._lines(depth + 1)
+
+    def __str__(self) -> str:
+        return "\n".join(self._lines(0))
+
+    def __repr__(self) -> str:
+        return "PlanNode({detail!r})".format(detail=self.detail)
+
+
+class QueryPlan:
+    """
+    The plan of a query, as a forest of steps.
+    """
+
+    def __init__(self, roots: Sequence[PlanNode]) -> None:
+        self.roots = list(roots)
+
+    def walk(self) -> Iterator[PlanNode]:
+        """
+        Iterates over the steps of the plan, depth first.
+        """
+        for root in self.roots:
+            yield from root.walk()
+
+    def full_scans(self) -> list[PlanNode]:
+        """
+        Returns the steps reading every row of a table.
+        """
+        return [node for node in self.walk() if node.full_scan]
+
+    def tables(self) -> set[str]:
+        return {node.table for node in self.walk() if node.table is not None}
+
+    def __str__(self) -> str:
+        return "\n".join(str(root) for root in self.roots)
+
+    def __repr__(self) -> str:
+        return "QueryPlan({roots!r})".format(roots=self.roots)
+
+
+def _sqlite_node(detail: str, subqueries: set[str]) -> PlanNode:
+    match = _SQLITE_ACCESS.match(detail)
+    if match is None or match.group("table") in ("CONSTANT", "SUBQUERY") or match.group("table").startswith("("):
+        return PlanNode(detail, operation=detail.split(" ", 1)[0])
+
+    operation, table = match.group("operation"), match.group("table")
+    # Scans through an index still read every row. Scans of subqueries only read the rows of the subquery, whose own
+    # steps are listed separately.
+    full_scan = operation == "SCAN" and table not in subqueries
+    return PlanNode(detail, operation=operation, table=table, index=match.group("index"), full_scan=full_scan)
+
+
+def parse_sqlite_plan(rows: Iterable[Sequence[Any]]) -> QueryPlan:
+    """
+    Parses the rows returned by ``EXPLAIN QUERY PLAN``, i.e. the ``(id, parent, notused, detail)`` tuples of
+    `sqlite3`, into a `QueryPlan`.
+    """
+    rows = list(rows)
+    subqueries = set()
+    for row in rows:
+        match = _SQLITE_SUBQUERY.match(row[3])
+        if match is not None:
+            subqueries.add(match.group("name"))
+
+    nodes, roots = {}, []
+    for node_id, parent, _, detail in rows:
+        node = nodes[node_id] = _sqlite_node(detail, subqueries)
+        if parent in nodes:
+            nodes[parent].children.append(node)
+        else:
+            roots.append(node)
+
+    return QueryPlan(roots)
@@ -1,19 +1,21 @@
 from __future__ import annotations
 
 import sys
-from collections.abc import Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from copy import copy
 from functools import reduce
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
-from pypika.enums import Dialects, JoinType, ReferenceOption, SetOperation
+from pypika.enums import Dialects, Equality, JoinType, Order, ReferenceOption, SetOperation
 from pypika.terms import (
     ArithmeticExpression,
+    BasicCriterion,
     Criterion,
     EmptyCriterion,
     Field,
     Function,
     Index,
+    Mod,
     Node,
     PeriodCriterion,
     Rollup,
@@ -23,6 +25,7 @@ from pypika.terms import (
     ValueWrapper,
 )
 from pypika.utils import (
+    DialectNotSupported,
     JoinException,
     QueryException,
     RollupException,
@@ -91,6 +94,83 @@ class AliasedQuery(Selectable):
         return hash(str(self.name))
 
 
+class ValuesTable(Selectable):
+    """
+    An inline table of constant rows, rendered ``(VALUES (1,'a'),(2,'b')) AS v(id,name)``. The dialects without
+    table value constructors with column names get a UNION ALL of SELECTs instead.
+    """
+
+    # Dialects rendering the rows as SELECT ... UNION ALL SELECT ...
+    UNION_DIALECTS = (Dialects.MYSQL, Dialects.SQLLITE, Dialects.ORACLE, Dialects.REDSHIFT, Dialects.VERTICA)
+
+    def __init__(self, rows: Sequence[Sequence[Any]], columns: Sequence[str], alias: str = "v") -> None:
+        super().__init__(alias)
+        if not rows:
+            raise QueryException("An inline VALUES table requires at least one row")
+        if any(len(row) != len(columns) for row in rows):
+            raise QueryException("Each row must have one value per column")
+        self.rows = [[Term.wrap_constant(value) for value in row] for row in rows]
+        self.columns = list(columns)
+
+    def get_sql(self, quote_char: str | None = None, dialect: Dialects | None = None, **kwargs: Any) -> str:
+        kwargs.pop("with_alias", None)
+        kwargs.pop("subquery", None)
+        alias = format_quotes(self.alias, quote_char)
+
+        if dialect in self.UNION_DIALECTS:
+            return "({rows}) {alias}".format(
+                rows=" UNION ALL ".join(
+                    self._select_row_sql(row, index == 0, quote_char, dialect, **kwargs)
+                    for index, row in enumerate(self.rows)
+                ),
+                alias=alias,
+            )
+
+        return "(VALUES {rows}) AS {alias}({columns})".format(
+            rows=",".join(
+                "({})".format(
+                    ",".join(value.get_sql(quote_char=quote_char, dialect=dialect, **kwargs) for value in row)
+                )
+                for row in self.rows
+            ),
+            alias=alias,
+            columns=",".join(format_quotes(column, quote_char) for column in self.columns),
+        )
+
+    def _select_row_sql(
+        self, row: list[Term], named: bool, quote_char: str | None, dialect: Dialects, **kwargs: Any
+    ) -> str:
+        values = [value.get_sql(quote_char=quote_char, dialect=dialect, **kwargs) for value in row]
+        if named:
+            # Only the first SELECT names the columns
+            values = [
+                "{value} {as_}{column}".format(
+                    value=value,
+                    as_="" if dialect == Dialects.ORACLE else "AS ",
+                    column=format_quotes(column, quote_char),
+                )
+                for value, column in zip(values, self.columns)
+            ]
+        return "SELECT {values}{dual}".format(
+            values=",".join(values), dual=" FROM DUAL" if dialect == Dialects.ORACLE else ""
+        )
+
+
+def _chunk_rows(rows: Sequence[Sequence[Any]], max_rows: int | None, max_size: int) -> list[list[Sequence[Any]]]:
+    chunks, chunk, size = [], [], 0
+    for row in rows:
+        row_size = sum(len(ValueWrapper.get_formatted_value(value, secondary_quote_char="'")) + 1 for value in row) + 2
+        if chunk and ((max_rows is not None and len(chunk) >= max_rows) or size + row_size > max_size):
+            chunks.append(chunk)
+            chunk, size = [], 0
+        chunk.append(row)
+        size += row_size
+
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
 class Schema:
     def __init__(self, name: str, parent: Schema | None = None) -> None:
         self._name = name
@@ -354,6 +434,64 @@ class PeriodFor:
 _TableClass = Table
 
 
+class Hint:
+    """
+    An optimizer hint given to `QueryBuilder.hint`, e.g. ``Hint("PARALLEL", orders, 8)`` renders
+    ``PARALLEL(o 8)`` for Oracle. Tables and subqueries are referenced by their alias when they have one, as the
+    databases resolve the tables of the hints by alias. Other arguments such as index names are rendered as is.
+    """
+
+    def __init__(self, name: str, *args: Any) -> None:
+        self.name = name
+        self.args = args
+
+    def _arg_sql(self, arg: Any, quote_char: str | None = None, **kwargs: Any) -> str:
+        if isinstance(arg, Selectable):
+            name = arg.get_table_name()
+            if name is None:
+                raise QueryException("A subquery referenced by a hint requires an alias")
+            return format_quotes(name, quote_char)
+        if isinstance(arg, Index):
+            return arg.get_sql(quote_char=quote_char, **kwargs)
+        return str(arg)
+
+    def get_sql(self, dialect: Dialects | None = None, **kwargs: Any) -> str:
+        args = [self._arg_sql(arg, **kwargs) for arg in self.args]
+        if not args:
+            # MySQL and pg_hint_plan require the parentheses
+            return self.name + ("()" if dialect in (Dialects.MYSQL, Dialects.POSTGRESQL) else "")
+
+        if dialect == Dialects.MYSQL:
+            # MySQL separates the arguments with commas, except the index names following their table
+            if (
+                len(args) > 1
+                and isinstance(self.args[0], Selectable)
+                and not any(isinstance(arg, Selectable) for arg in self.args[1:])
+            ):
+                return "{name}({table} {indexes})".format(name=self.name, table=args[0], indexes=", ".join(args[1:]))
+            return "{name}({args})".format(name=self.name, args=", ".join(args))
+
+        return "{name}({args})".format(name=self.name, args=" ".join(args))
+
+    def __str__(self) -> str:
+        return self.get_sql()
+
+
+class QueryLabel:
+    """
+    A label identifying the query in the monitoring tables of the database, given to `QueryBuilder.hint`.
+    """
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+
+    def get_sql(self, **kwargs: Any) -> str:
+        return "label({label})".format(label=self.label)
+
+    def __str__(self) -> str:
+        return self.get_sql()
+
+
 class Query:
     """
     Query is the primary class and entry point in pypika. It is used to build queries iteratively using the builder
@@ -517,6 +655,73 @@ class Query:
         """
         return cls._builder(**kwargs).update(table)
 
+    @classmethod
+    def update_from_values(
+        cls,
+        table: str | Table,
+        key_columns: Sequence[str],
+        value_columns: Sequence[str],
+        rows: Sequence[Sequence[Any]],
+        max_rows: int | None = None,
+        max_size: int | None = None,
+        **kwargs: Any,
+    ) -> list[QueryBuilder]:
+        """
+        Query builder entry point. Updates many rows with different values, each UPDATE statement joining the table
+        with an inline VALUES table. The rows are split in several statements to stay within the statement size
+        limits of the dialect.
+
+        :param table:
+            The updated table.
+        :param key_columns:
+            The columns identifying the updated rows.
+        :param value_columns:
+            The updated columns.
+        :param rows:
+            The rows, each row holding the values of the key columns followed by the values of the updated columns.
+        :param max_rows:
+            The maximum number of rows per statement, defaults to the limit of the dialect.
+        :param max_size:
+            The approximate maximum size of the inline rows of a statement, in characters.
+
+        :return: A list of UPDATE queries.
+        """
+        query = cls.update(table, **kwargs)
+        max_rows = max_rows or query.VALUES_MAX_ROWS
+        max_size = max_size or query.VALUES_MAX_SIZE
+        return [
+            query.set_from_values(key_columns, value_columns, chunk) for chunk in _chunk_rows(rows, max_rows, max_size)
+        ]
+
+    @classmethod
+    def merge_into(cls, table: str | Table) -> MergeQueryBuilder:
+        """
+        Query builder entry point. Initializes query building and sets the target table of a MERGE statement, which
+        inserts, updates or deletes rows of the table depending on whether they match the rows of a source.
+
+        :param table: An instance of a Table object or a string table name.
+
+        :return: MergeQueryBuilder
+        """
+        return MergeQueryBuilder().merge_into(table)
+
+    @classmethod
+    def estimate_count(cls, table: str | Table) -> QueryBuilder:
+        """
+        Query builder entry point. Returns a query reading the approximate number of rows of a table from the
+        statistics of the database, selected as ``estimate``. It is much cheaper than a ``COUNT(*)`` on large tables
+        but only as accurate as the statistics, e.g. after the last ``ANALYZE``. Use `QueryBuilder.estimate` for the
+        number of rows matching a filter.
+
+        :param table: An instance of a Table object or a string table name.
+
+        :return: QueryBuilder
+
+        :raises DialectNotSupported:
+            If the dialect does not expose the number of rows of a table.
+        """
+        raise DialectNotSupported("Row count estimates are not supported for dialect {}".format(cls._builder().dialect))
+
     @classmethod
     def Table(cls, table_name: str, **kwargs) -> _TableClass:
         """
@@ -714,6 +919,27 @@ class QueryBuilder(Selectable, Term):
     ALIAS_QUOTE_CHAR = None
     QUERY_ALIAS_QUOTE_CHAR = None
     QUERY_CLS = Query
+    EXPORT_CLS: type[ExportQueryBuilder] | None = None
+    EXPLAIN_CLS: type[ExplainQueryBuilder] | None = None
+    # The format of EXPLAIN reporting the estimated number of rows of the query, see `estimate`
+    ESTIMATE_FORMAT: str | None = None
+    # Limits of the statements generated by Query.update_from_values, the size being counted in characters
+    VALUES_MAX_ROWS: int | None = None
+    VALUES_MAX_SIZE: int = 1 << 20
+    # The kinds of hints supported by the dialect, see `hint`
+    HINT_TYPES: tuple[type, ...] = ()
+    # Whether the hints are rendered in a comment preceding the statement rather than after its first keyword
+    HINTS_BEFORE_STATEMENT = False
+    # The statement setting the timeout of the following statements, formatted with `milliseconds` and `seconds`, for
+    # the dialects which cannot give the timeout in the query itself, see `timeout`
+    TIMEOUT_STATEMENT: str | None = None
+    # The statement restoring the default timeout after the query, for the dialects setting it for the whole session
+    TIMEOUT_RESET_STATEMENT: str | None = None
+    # Whether rows can be compared, e.g. ``(a,b)>(1,2)``, see `keyset_paginate`
+    ROW_VALUE_COMPARISON = True
+    # The function hashing values to integers and whether it returns unsigned integers, see `partition_by_hash`
+    HASH_FUNCTION: str | None = None
+    HASH_UNSIGNED = False
 
     def __init__(
         self,
@@ -758,6 +984,9 @@ class QueryBuilder(Selectable, Term):
 
         self._updates = []
 
+        self._hints = []
+        self._timeout = None
+
         self._select_star = False
         self._select_star_tables = set()
         self._mysql_rollup = False
@@ -921,6 +1150,24 @@ class QueryBuilder(Selectable, Term):
         self._apply_terms(*terms)
         self._replace = True
 
+    def insert_chunks(
+        self, rows: Sequence[Sequence[Any]], max_rows: int | None = None, max_size: int | None = None
+    ) -> list[QueryBuilder]:
+        """
+        Inserts many rows, split in several multi-row INSERT statements to stay within the statement size limits of
+        the dialect. Conflict handlers such as ``on_duplicate_key_update`` are applied to every statement.
+
+        :param max_rows:
+            The maximum number of rows per statement, defaults to the limit of the dialect.
+        :param max_size:
+            The approximate maximum size of the inserted values of a statement, in characters.
+
+        :return: A list of INSERT queries.
+        """
+        max_rows = max_rows or self.VALUES_MAX_ROWS
+        max_size = max_size or self.VALUES_MAX_SIZE
+        return [self.insert(*chunk) for chunk in _chunk_rows(rows, max_rows, max_size)]
+
     @builder
     def force_index(self, term: str | Index, *terms: str | Index) -> None:
         for t in (term, *terms):
@@ -937,6 +1184,68 @@ class QueryBuilder(Selectable, Term):
             elif isinstance(t, str):
                 self._use_indexes.append(Index(t))
 
+    @builder
+    def hint(self, *hints: Hint | QueryLabel) -> None:
+        """
+        Adds optimizer hints or labels, rendered where the dialect expects them, e.g. ``SELECT /*+ ... */`` for
+        Oracle and MySQL or in a comment preceding the statement for PostgreSQL with pg_hint_plan.
+
+        :raises DialectNotSupported:
+            If the dialect does not support this kind of hint.
+        """
+        self._hints = self._hints + [self._validate_hint(hint) for hint in hints]
+
+    def _validate_hint(self, hint: Hint | QueryLabel) -> Hint | QueryLabel:
+        if not isinstance(hint, self.HINT_TYPES):
+            raise DialectNotSupported(
+                "{type} hints are not supported for dialect {dialect}".format(
+                    type=type(hint).__name__, dialect=self.dialect
+                )
+            )
+        return hint
+
+    @builder
+    def timeout(self, milliseconds: int) -> None:
+        """
+        Limits the execution time of the query. Depending on the dialect the timeout is rendered in the query, e.g. as
+        a hint or a setting, or given by a statement to run before the query, see `get_statements`. When that
+        statement sets the timeout of the whole session, e.g. for Snowflake, Redshift and Vertica, it is followed by a
+        statement resetting the timeout after the query.
+
+        :param milliseconds:
+            The maximum execution time of the query, in milliseconds.
+
+        :raises DialectNotSupported:
+            If the dialect has no statement timeout.
+        """
+        if isinstance(milliseconds, bool) or not isinstance(milliseconds, int) or milliseconds <= 0:
+            raise QueryException("The timeout must be a positive number of milliseconds, got {}".format(milliseconds))
+        self._set_timeout(milliseconds)
+
+    def _set_timeout(self, milliseconds: int) -> None:
+        if self.TIMEOUT_STATEMENT is None:
+            raise DialectNotSupported("Statement timeouts are not supported for dialect {}".format(self.dialect))
+        self._timeout = milliseconds
+
+    def _timeout_statements(self) -> list[str]:
+        if self._timeout is None or self.TIMEOUT_STATEMENT is None:
+            return []
+        return [
+            self.TIMEOUT_STATEMENT.format(milliseconds=self._timeout, seconds=-(-self._timeout // 1000)),
+        ]
+
+    def _timeout_reset_statements(self) -> list[str]:
+        if self._timeout is None or self.TIMEOUT_STATEMENT is None or self.TIMEOUT_RESET_STATEMENT is None:
+            return []
+        return [self.TIMEOUT_RESET_STATEMENT]
+
+    def get_statements(self, **kwargs: Any) -> list[str]:
+        """
+        Returns the statements to run in order to execute the query, i.e. the statements setting the timeout of the
+        query, the query itself and the statements resetting the timeout of the session.
+        """
+        return self._timeout_statements() + [self.get_sql(**kwargs)] + self._timeout_reset_statements()
+
     @builder
     def distinct(self) -> None:
         self._distinct = True
@@ -1121,6 +1430,37 @@ class QueryBuilder(Selectable, Term):
             value = self.wrap_constant(value, wrapper_cls=self._wrapper_cls)
         self._updates.append((field, value))
 
+    @builder
+    def set_from_values(
+        self,
+        key_columns: Sequence[str],
+        value_columns: Sequence[str],
+        rows: Sequence[Sequence[Any]],
+        alias: str = "v",
+    ) -> None:
+        """
+        Sets the updated columns from an inline VALUES table matched on the key columns, e.g.
+        ``UPDATE t SET b=v.b FROM (VALUES (1,'x')) AS v(a,b) WHERE t.a=v.a``.
+
+        :param rows:
+            The rows, each row holding the values of the key columns followed by the values of the updated columns.
+        """
+        if not self._update_table:
+            raise QueryException("Values can only be set in an UPDATE query")
+
+        values = ValuesTable(rows, [*key_columns, *value_columns], alias=alias)
+        criterion = Criterion.all(
+            [Field(column, table=self._update_table) == Field(column, table=values) for column in key_columns]
+        )
+        self._join_update_values(values, criterion)
+        self._updates = self._updates + [
+            (Field(column, table=self._update_table), Field(column, table=values)) for column in value_columns
+        ]
+
+    def _join_update_values(self, values: ValuesTable, criterion: Criterion) -> None:
+        self._from = self._from + [values]
+        self._wheres = self._wheres & criterion if self._wheres else criterion
+
     def __add__(self, other: QueryBuilder) -> _SetOperation:
         return self.union(other)
 
@@ -1414,29 +1754,52 @@ class QueryBuilder(Selectable, Term):
 
         return for_update
 
+    def _hints_sql(self, **kwargs: Any) -> str:
+        return "/*+ {hints} */".format(hints=" ".join(hint.get_sql(**kwargs) for hint in self._hints))
+
+    def _prepend_hints(self, querystring: str, subquery: bool = False, **kwargs: Any) -> str:
+        # Used by the dialects rendering the hints before the statement
+        if not self._hints or not querystring:
+            return querystring
+        if subquery:
+            raise QueryException(
+                "Hints of dialect {} can only be given to the outermost statement".format(self.dialect)
+            )
+        return "{hints} {query}".format(hints=self._hints_sql(**kwargs), query=querystring)
+
+    def _statement_hints_sql(self, **kwargs: Any) -> str:
+        # The hints following the first keyword of the statement
+        if not self._hints or self.HINTS_BEFORE_STATEMENT:
+            return ""
+        return self._hints_sql(**kwargs) + " "
+
     def _select_sql(self, **kwargs: Any) -> str:
-        return "SELECT {distinct}{select}".format(
+        return "SELECT {hints}{distinct}{select}".format(
+            hints=self._statement_hints_sql(**kwargs),
             distinct=self._distinct_sql(**kwargs),
             select=",".join(term.get_sql(with_alias=True, subquery=True, **kwargs) for term in self._selects),
         )
 
     def _insert_sql(self, **kwargs: Any) -> str:
-        return "INSERT {ignore}INTO {table}".format(
+        return "INSERT {hints}{ignore}INTO {table}".format(
+            hints=self._statement_hints_sql(**kwargs),
             table=self._insert_table.get_sql(**kwargs),
             ignore="IGNORE " if self._ignore else "",
         )
 
     def _replace_sql(self, **kwargs: Any) -> str:
-        return "REPLACE INTO {table}".format(
+        return "REPLACE {hints}INTO {table}".format(
+            hints=self._statement_hints_sql(**kwargs),
             table=self._insert_table.get_sql(**kwargs),
         )
 
-    @staticmethod
-    def _delete_sql(**kwargs: Any) -> str:
-        return "DELETE"
+    def _delete_sql(self, **kwargs: Any) -> str:
+        return "DELETE {hints}".format(hints=self._statement_hints_sql(**kwargs)).rstrip()
 
     def _update_sql(self, **kwargs: Any) -> str:
-        return "UPDATE {table}".format(table=self._update_table.get_sql(**kwargs))
+        return "UPDATE {hints}{table}".format(
+            hints=self._statement_hints_sql(**kwargs), table=self._update_table.get_sql(**kwargs)
+        )
 
     def _columns_sql(self, with_namespace: bool = False, **kwargs: Any) -> str:
         """
@@ -1576,6 +1939,315 @@ class QueryBuilder(Selectable, Term):
             )
         )
 
+    def export_to(self, target: str, format: str | None = None, **options: Any) -> ExportQueryBuilder:
+        """
+        Wraps this SELECT query in the native bulk export statement of the dialect, e.g. COPY ... TO for PostgreSQL
+        or UNLOAD for Redshift.
+
+        :param target:
+            The destination of the export, such as a file path, a stage or a bucket url, depending on the dialect.
+        :param format:
+            The output format. The supported formats depend on the dialect.
+        :param options:
+            Additional dialect specific export options.
+        :return: ExportQueryBuilder
+        """
+        if self.EXPORT_CLS is None:
+            raise DialectNotSupported("Bulk export is not supported for dialect {}".format(self.dialect))
+
+        if not self._selects or self._insert_table or self._update_table or self._delete_from:
+            raise QueryException("Only SELECT queries can be exported")
+
+        return self.EXPORT_CLS(self, target, format=format, **options)
+
+    def explain(self, analyze: bool = False, format: str | None = None, buffers: bool = False) -> ExplainQueryBuilder:
+        """
+        Wraps this query in the EXPLAIN statement of the dialect, returning the plan of the query instead of its
+        results, e.g. ``EXPLAIN (FORMAT JSON) ...`` for PostgreSQL or ``EXPLAIN QUERY PLAN ...`` for SQLite.
+
+        :param analyze:
+            Runs the query and reports the actual row counts and timings along with the plan.
+        :param format:
+            The output format, ``text`` or ``json``. Dialects may support other formats, e.g. ``tree`` for MySQL.
+            Defaults to the format of the dialect.
+        :param buffers:
+            Reports the buffer usage, for PostgreSQL.
+        :return: ExplainQueryBuilder
+
+        :raises DialectNotSupported:
+            If the dialect has no EXPLAIN statement or does not support one of the options.
+        """
+        if self.EXPLAIN_CLS is None:
+            raise DialectNotSupported("EXPLAIN is not supported for dialect {}".format(self.dialect))
+
+        return self.EXPLAIN_CLS(self, analyze=analyze, format=format, buffers=buffers)
+
+    def estimate(self) -> ExplainQueryBuilder:
+        """
+        Wraps this query in the EXPLAIN statement giving the number of rows estimated by the planner, without running
+        the query. The estimate is read from the output of the statement with ``estimated_rows``, e.g.::
+
+            explain = query.estimate()
+            total = explain.estimated_rows(connection.execute(str(explain)).fetchall())
+
+        :return: ExplainQueryBuilder
+
+        :raises DialectNotSupported:
+            If the EXPLAIN statement of the dialect does not report the estimated number of rows.
+        """
+        if self.ESTIMATE_FORMAT is None:
+            raise DialectNotSupported("Row count estimates are not supported for dialect {}".format(self.dialect))
+
+        return self.explain(format=self.ESTIMATE_FORMAT)
+
+    def partition_by_range(self, field: Term | str, bounds: Sequence[Any]) -> list[QueryBuilder]:
+        """
+        Splits the query in independent queries, each selecting the rows whose field is in one of the ranges between
+        consecutive bounds, e.g. ``partition_by_range("id", [None, 1000, 2000, None])`` adds ``"id"<1000``,
+        ``"id">=1000 AND "id"<2000`` and ``"id">=2000``. Rows with a null field are not selected.
+
+        :param field:
+            The partitioning field.
+        :param bounds:
+            The sorted bounds of the ranges, the lower bound being included and the upper bound excluded. The first and
+            last bounds can be None for ranges without lower or upper bound.
+        :return: One query per range.
+        """
+        if len(bounds) < 2:
+            raise QueryException("At least two bounds are required to partition by range")
+
+        field = self._partition_field(field)
+        return [
+            copy(self).where(
+                Criterion.all(
+                    [
+                        *([field >= lower] if lower is not None else []),
+                        *([field < upper] if upper is not None else []),
+                    ]
+                )
+            )
+            for lower, upper in zip(bounds, bounds[1:])
+        ]
+
+    def partition_by_hash(self, field: Term | str, partitions: int) -> list[QueryBuilder]:
+        """
+        Splits the query in independent queries, each selecting the rows whose hashed field falls in one of
+        `partitions` buckets, e.g. ``MOD(CRC32(`id`),4)=0`` for MySQL. Unlike ranges, the partitions have about the
+        same size whatever the distribution of the values.
+
+        :param field:
+            The partitioning field.
+        :param partitions:
+            The number of queries.
+        :return: One query per bucket.
+
+        :raises DialectNotSupported:
+            If the dialect has no hash function.
+        """
+        if partitions <= 0:
+            raise QueryException("The number of partitions must be positive, got {}".format(partitions))
+
+        bucket = self._hash_bucket(self._partition_field(field), partitions)
+        return [copy(self).where(bucket == i) for i in range(partitions)]
+
+    def _partition_field(self, field: Term | str) -> Term:
+        return Field(field, table=self._from[0]) if isinstance(field, str) else self.wrap_constant(field)
+
+    def _hash_bucket(self, term: Term, partitions: int) -> Term:
+        bucket = Mod(self._hash(term), partitions)
+        # MOD before ABS, hashes may be the smallest integer whose absolute value overflows
+        return bucket if self.HASH_UNSIGNED else Function("ABS", bucket)
+
+    def _hash(self, term: Term) -> Term:
+        if self.HASH_FUNCTION is None:
+            raise DialectNotSupported("Partitioning by hash is not supported for dialect {}".format(self.dialect))
+        return Function(self.HASH_FUNCTION, term)
+
+    def iter_chunks(self, key_field: Term | str, chunk_size: int) -> ChunkedQuery:
+        """
+        Splits this DELETE or UPDATE query in statements affecting at most `chunk_size` rows, so that each one holds
+        its locks briefly and replicas can keep up between the statements. See `ChunkedQuery.run`.
+
+        :param key_field:
+            A unique and indexed field of the table, e.g. its primary key.
+        :param chunk_size:
+            The maximum number of rows affected by a statement.
+        :return: ChunkedQuery
+        """
+        if not self._delete_from and self._update_table is None:
+            raise QueryException("Only DELETE and UPDATE queries can be run in chunks")
+        if self._joins or (self._update_table is not None and self._from) or self._limit is not None:
+            raise QueryException("Queries with joins or a limit can not be run in chunks")
+        if chunk_size <= 0:
+            raise QueryException("The chunk size must be positive, got {}".format(chunk_size))
+
+        table = self._update_table if self._update_table is not None else self._from[0]
+        key = Field(key_field, table=table) if isinstance(key_field, str) else key_field
+        return ChunkedQuery(self, table, key, chunk_size)
+
+    def _limit_rows(self, table: Selectable, key: Term, rows: int) -> QueryBuilder:
+        # The rows are picked in a subquery, as DELETE ... LIMIT is not standard
+        return self._limit_rows_by_subquery(table, key, rows, ordered=True)
+
+    def _limit_rows_by_subquery(self, table: Selectable, key: Term, rows: int, ordered: bool) -> QueryBuilder:
+        subquery = self.QUERY_CLS.from_(table).select(key)
+        if self._wheres is not None:
+            subquery = subquery.where(self._wheres)
+        if ordered:
+            subquery = subquery.orderby(key)
+
+        newone = copy(self)
+        newone._wheres = key.isin(subquery.limit(rows))
+        return newone
+
+    def optimize(self, push_down_predicates: bool = True, prune_columns: bool = True) -> QueryBuilder:
+        """
+        Returns a copy of the query rewritten to return the same rows with less work for the database, which is
+        useful for queries wrapping other queries in subqueries and CTEs. The rewrites are described in
+        `pypika.optimizer`.
+
+        :param push_down_predicates:
+            Moves the conditions on the columns of a subquery or CTE into its WHERE clause.
+        :param prune_columns:
+            Removes the columns of subqueries and CTEs which are not used.
+        :return: QueryBuilder
+        """
+        from pypika import optimizer
+
+        query = copy(self)
+        if push_down_predicates:
+            query = optimizer.push_down_predicates(query)
+        if prune_columns:
+            query = optimizer.prune_columns(query)
+        return query
+
+    def count_query(self, unique_left_joins: bool = False) -> QueryBuilder:
+        """
+        Returns a query counting the rows of this SELECT query, e.g. the total of a paginated listing. The ordering
+        and pagination are dropped. The select list is replaced with ``COUNT(*)``, unless it defines the rows through
+        DISTINCT, GROUP BY or aggregates, in which case the query is counted in a subquery. LEFT JOINs whose tables
+        are not used by the rest of the query are dropped when they cannot change the number of rows.
+
+        :param unique_left_joins:
+            Whether the LEFT JOINs match at most one row, e.g. lookups by primary key. LEFT JOINs never remove rows
+            but may repeat them, so they are only dropped from queries without DISTINCT or GROUP BY when they are
+            unique.
+        :return: QueryBuilder
+        """
+        from pypika.functions import Count
+
+        if not (self._selects or self._select_star) or self._insert_table or self._update_table or self._delete_from:
+            raise QueryException("Only SELECT queries can be counted")
+
+        query = self._without_pagination()
+        keep_selects = query._count_keeps_selects()
+        # Repeated rows do not change the distinct rows nor the groups, unless they are aggregated by HAVING
+        deduplicated = (query._distinct or bool(query._groupbys)) and query._havings is None
+
+        for join in reversed(query._joins):
+            if query._is_removable_join(join, keep_selects, unique_left_joins or deduplicated):
+                query._joins = [other for other in query._joins if other is not join]
+
+        if not keep_selects and not query._groupbys and query._havings is None:
+            query._selects, query._select_star, query._select_star_tables = [Count(Star())], False, set()
+            return query
+
+        if not keep_selects and not query._unqualified_fields(query._groupbys, query._havings):
+            # Named, as SQL Server requires the columns of derived tables to have names
+            query._selects, query._select_star, query._select_star_tables = [ValueWrapper(1, alias="one")], False, set()
+
+        # The CTEs go to the outer query, not all the dialects support them in subqueries
+        count = self.QUERY_CLS.from_(query).select(Count(Star()))
+        count._with, query._with = query._with, []
+        return count
+
+    def _without_pagination(self) -> QueryBuilder:
+        newone = copy(self)
+        newone._orderbys = []
+        newone._limit = newone._offset = None
+        newone._for_update = False
+        return newone
+
+    def _limits_rows(self) -> bool:
+        # Whether the query only returns some of its rows, so that filtering its input changes which rows are returned
+        return self._limit is not None or self._offset is not None
+
+    def _clause_terms(self) -> list[Term]:
+        # The terms of the clauses other than the selects, using the columns of the tables or the aliases of the selects
+        terms = [self._wheres, self._prewheres, self._havings, self._qualifys, *self._groupbys]
+        terms += [term for term, _ in self._orderbys]
+        for join in self._joins:
+            terms += [join.criterion] if isinstance(join, JoinOn) else getattr(join, "fields", [])
+        return [term for term in terms if isinstance(term, Term)]
+
+    def _count_keeps_selects(self) -> bool:
+        # Whether the select list defines the rows of the query
+        return (
+            self._distinct
+            or self._qualifys is not None
+            or (not self._groupbys and any(getattr(select, "is_aggregate", False) for select in self._selects))
+        )
+
+    def _is_removable_join(self, join: Join, keep_selects: bool, unique: bool) -> bool:
+        if join.how not in (JoinType.left, JoinType.left_outer) or not unique:
+            return False
+
+        terms = [self._wheres, self._prewheres, self._havings, self._qualifys, *self._groupbys]
+        if keep_selects:
+            if self._select_star:
+                return False
+            terms += self._selects
+        for other in self._joins:
+            if other is not join:
+                terms += [getattr(other, "criterion", None), *getattr(other, "fields", [])]
+
+        nodes = [node for term in terms if term is not None for node in term.nodes_()]
+        fields = [node for node in nodes if isinstance(node, Field)]
+        # The fields of subqueries are not visited, they may be correlated to the joined table
+        tables = {id(field.table) for field in fields}
+        if any(isinstance(node, (QueryBuilder, _SetOperation)) and id(node) not in tables for node in nodes):
+            return False
+
+        # Fields without table may belong to the joined table
+        return not any(
+            (field.table is None and not isinstance(field, Star))
+            or field.table is join.item
+            or (isinstance(field.table, Table) and isinstance(join.item, Table) and field.table == join.item)
+            for field in fields
+        )
+
+    @staticmethod
+    def _unqualified_fields(*terms: Term | list[Term] | None) -> bool:
+        # e.g. references to the aliases of the select list
+        for term in terms:
+            for item in term if isinstance(term, list) else [term]:
+                if item is not None and any(
+                    field.table is None and not isinstance(field, Star) for field in item.find_(Field)
+                ):
+                    return True
+        return False
+
+    def keyset_paginate(
+        self, order_fields: Sequence[Term | str | tuple[Term | str, Order]], page_size: int
+    ) -> KeysetPaginator:
+        """
+        Pages through the results of this query by key rather than by offset: each page is selected with a condition
+        on the key of the last row of the previous page, so the database seeks to the page with an index instead of
+        reading and skipping all the previous rows.
+
+        :param order_fields:
+            The fields ordering the rows, with an optional direction, e.g. ``[(orders.created, Order.desc), orders.id]``.
+            They must identify the rows uniquely and must not be null. A name is either a select alias or a column of
+            the only table of the query.
+        :param page_size:
+            The number of rows per page.
+        :return: KeysetPaginator
+        """
+        if self._orderbys or self._limit is not None or self._offset:
+            raise QueryException("The query is already ordered or paginated")
+
+        return KeysetPaginator(self, order_fields, page_size)
+
     def pipe(self, func, *args, **kwargs):
         """Call a function on the current object and return the result.
 
@@ -1670,6 +2342,216 @@ class Joiner(Generic[QB]):
         return self.query
 
 
+class KeysetPaginator:
+    """
+    Renders the pages of a query ordered by a unique key, see `QueryBuilder.keyset_paginate`.
+    """
+
+    def __init__(
+        self, query: QueryBuilder, order_fields: Sequence[Term | str | tuple[Term | str, Order]], page_size: int
+    ) -> None:
+        if not order_fields:
+            raise QueryException("Keyset pagination requires at least one order field")
+        if page_size <= 0:
+            raise QueryException("The page size must be positive, got {}".format(page_size))
+
+        self.query = query
+        self.page_size = page_size
+        self.order_fields = []
+        for order_field in order_fields:
+            field, order = order_field if isinstance(order_field, tuple) else (order_field, Order.asc)
+            field = self._resolve(field) if isinstance(field, str) else query.wrap_constant(field)
+            self.order_fields.append((field, order))
+
+    def _resolve(self, name: str) -> Term:
+        # A select alias is ordered by its alias and compared through the aliased term in the seek predicate
+        for select in self.query._selects:
+            if select.alias == name:
+                return select
+        if len(self.query._from) != 1 or self.query._joins:
+            raise QueryException(
+                "The order field {} is neither a select alias nor a column of the only table, give a field".format(name)
+            )
+        return Field(name, table=self.query._from[0])
+
+    def first_page(self) -> QueryBuilder:
+        return self._page(None)
+
+    def next_page(self, last_key: Sequence[Any]) -> QueryBuilder:
+        """
+        Returns the query of the page following the row with the given key.
+
+        :param last_key:
+            The values of the order fields in the last row of the previous page, or parameters.
+        """
+        if len(last_key) != len(self.order_fields):
+            raise QueryException(
+                "Expected {expected} key values, got {count}".format(
+                    expected=len(self.order_fields), count=len(last_key)
+                )
+            )
+        return self._page(self._after(last_key))
+
+    def _page(self, criterion: Criterion | None) -> QueryBuilder:
+        query = self.query if criterion is None else self.query.where(criterion)
+        for field, order in self.order_fields:
+            query = query.orderby(field, order=order)
+        return query.limit(self.page_size)
+
+    def _after(self, last_key: Sequence[Any]) -> Criterion:
+        fields = [field for field, _ in self.order_fields]
+        values = [self.query.wrap_constant(value) for value in last_key]
+        orders = {order for _, order in self.order_fields}
+
+        if len(fields) > 1 and len(orders) == 1 and self.query.ROW_VALUE_COMPARISON:
+            comparator = Equality.gt if orders == {Order.asc} else Equality.lt
+            return BasicCriterion(comparator, Tuple(*fields), Tuple(*values))
+
+        # (a>1) OR (a=1 AND b>2) OR ...
+        criteria = []
+        for i, (field, order) in enumerate(self.order_fields):
+            comparator = Equality.gt if order == Order.asc else Equality.lt
+            criteria.append(
+                Criterion.all(
+                    [*(fields[j] == values[j] for j in range(i)), BasicCriterion(comparator, field, values[i])]
+                )
+            )
+        return Criterion.any(criteria)
+
+    def key(self, row: Sequence[Any] | Mapping[str, Any]) -> tuple:
+        """
+        Returns the key of a row, taking the values of the order fields from the selected columns with the same name
+        or alias.
+        """
+        names = [field.alias or getattr(field, "name", None) for field, _ in self.order_fields]
+        if isinstance(row, Mapping):
+            return tuple(row[name] for name in names)
+
+        selected = [select.alias or getattr(select, "name", None) for select in self.query._selects]
+        missing = [name for name in names if name not in selected]
+        if missing:
+            raise QueryException(
+                "The order fields {} are not selected, a key function is required".format(", ".join(map(str, missing)))
+            )
+        return tuple(row[selected.index(name)] for name in names)
+
+    def pages(
+        self,
+        fetch: Callable[[QueryBuilder], Sequence[Any]],
+        key: Callable[[Any], Sequence[Any]] | None = None,
+    ) -> Iterator[Sequence[Any]]:
+        """
+        Fetches the pages one after the other, until a page is not full.
+
+        :param fetch:
+            Runs the query of a page and returns its rows, e.g. ``lambda query: cursor.execute(str(query)).fetchall()``.
+        :param key:
+            Returns the key of a row, defaults to `key`.
+        """
+        key = key or self.key
+        query = self.first_page()
+        while True:
+            rows = fetch(query)
+            if rows:
+                yield rows
+            if len(rows) < self.page_size:
+                return
+            query = self.next_page(key(rows[-1]))
+
+
+class ChunkedQuery:
+    """
+    A DELETE or UPDATE query run in chunks, see `QueryBuilder.iter_chunks`.
+
+    Deletions are run by repeating a statement deleting at most `chunk_size` matching rows until fewer rows are
+    deleted, e.g. with ``DELETE ... LIMIT`` for MySQL or ``DELETE TOP (n)`` for SQL Server. Updates would match the
+    same rows again, they are run over consecutive ranges of keys instead, each range ending at the key found by
+    `boundary`.
+    """
+
+    def __init__(self, query: QueryBuilder, table: Selectable, key: Term, chunk_size: int) -> None:
+        self.query = query
+        self.table = table
+        self.key = key
+        self.chunk_size = chunk_size
+
+    def statement(self) -> QueryBuilder:
+        """
+        Returns the statement deleting the next chunk of rows.
+        """
+        if not self.query._delete_from:
+            raise QueryException("Only DELETE queries can be repeated, updates are run over ranges of keys")
+        return self.query._limit_rows(self.table, self.key, self.chunk_size)
+
+    def boundary(self, after: Any = None) -> QueryBuilder:
+        """
+        Returns the query selecting the last key of the chunk of rows following the key `after`, no row being returned
+        for the last chunk.
+        """
+        query = self.query.QUERY_CLS.from_(self.table).select(self.key)
+        if self.query._wheres is not None:
+            query = query.where(self.query._wheres)
+        if after is not None:
+            query = query.where(self.key > after)
+        return query.orderby(self.key).limit(1).offset(self.chunk_size - 1)
+
+    def chunk(self, after: Any = None, upto: Any = None) -> QueryBuilder:
+        """
+        Returns the query restricted to the keys greater than `after` and up to `upto`, both included when None.
+        """
+        return copy(self.query).where(
+            Criterion.all(
+                [
+                    *([self.key > after] if after is not None else []),
+                    *([self.key <= upto] if upto is not None else []),
+                ]
+            )
+        )
+
+    def run(
+        self,
+        execute: Callable[[QueryBuilder], int],
+        fetch: Callable[[QueryBuilder], Sequence[Sequence[Any]]] | None = None,
+        throttle: Callable[[int], None] | None = None,
+    ) -> int:
+        """
+        Runs the chunks one after the other.
+
+        :param execute:
+            Runs a statement and returns the number of affected rows, e.g. ``cursor.rowcount``.
+        :param fetch:
+            Runs a query and returns its rows, used to find the ranges of keys of updates.
+        :param throttle:
+            Called between the chunks with the number of rows affected by the previous chunk, e.g. to sleep or to
+            wait for the replicas to catch up.
+        :return: The total number of affected rows.
+        """
+        total = 0
+        if self.query._delete_from:
+            while True:
+                rows = execute(self.statement())
+                total += rows
+                if rows < self.chunk_size:
+                    return total
+                if throttle is not None:
+                    throttle(rows)
+
+        if fetch is None:
+            raise QueryException("Updates in chunks require a fetch function to find the ranges of keys")
+
+        after = None
+        while True:
+            boundary = fetch(self.boundary(after))
+            upto = boundary[0][0] if boundary else None
+            rows = execute(self.chunk(after, upto))
+            total += rows
+            if upto is None:
+                return total
+            if throttle is not None:
+                throttle(rows)
+            after = upto
+
+
 class Join:
     def __init__(self, item: Term, how: JoinType) -> None:
         self.item = item
@@ -2261,3 +3143,358 @@ class DropQueryBuilder:
 
     def __repr__(self) -> str:
         return self.__str__()
+
+
+class MergeBranch:
+    """
+    A WHEN branch of a MERGE statement.
+
+    :param match:
+        One of ``MATCHED``, ``NOT MATCHED`` or ``NOT MATCHED BY SOURCE``.
+    :param action:
+        One of ``UPDATE``, ``DELETE`` or ``INSERT``.
+    :param assignments:
+        The updated columns and their values, or the inserted columns and their values.
+    """
+
+    def __init__(
+        self, match: str, condition: Criterion | None, action: str, assignments: Sequence[tuple[Field, Term]] = ()
+    ) -> None:
+        self.match = match
+        self.condition = condition
+        self.action = action
+        self.assignments = list(assignments)
+
+
+class MergeWhen:
+    def __init__(self, query: MergeQueryBuilder, match: str, condition: Criterion | None) -> None:
+        self.query = query
+        self.match = match
+        self.condition = condition
+
+    def update(self, values: Sequence[str | Field] | Mapping[str | Field, Any] | None = None) -> MergeQueryBuilder:
+        """
+        Updates the matched rows.
+
+        :param values:
+            Either the updated columns, set to the columns of the source with the same names, or a mapping of the
+            updated columns to their values. Defaults to all the columns of an inline VALUES source except the keys
+            given to `MergeQueryBuilder.on_field`.
+        """
+        if self.match == MergeQueryBuilder.NOT_MATCHED:
+            raise QueryException("Rows missing from the target can only be inserted")
+
+        assignments = self.query._assignments(values, exclude_keys=True)
+        self.query.do_when(MergeBranch(self.match, self.condition, "UPDATE", assignments))
+        return self.query
+
+    def delete(self) -> MergeQueryBuilder:
+        if self.match == MergeQueryBuilder.NOT_MATCHED:
+            raise QueryException("Rows missing from the target can only be inserted")
+
+        self.query.do_when(MergeBranch(self.match, self.condition, "DELETE"))
+        return self.query
+
+    def insert(self, values: Sequence[str | Field] | Mapping[str | Field, Any] | None = None) -> MergeQueryBuilder:
+        """
+        Inserts the source rows missing from the target.
+
+        :param values:
+            Either the inserted columns, taken from the columns of the source with the same names, or a mapping of the
+            inserted columns to their values. Defaults to all the columns of an inline VALUES source.
+        """
+        if self.match != MergeQueryBuilder.NOT_MATCHED:
+            raise QueryException("Only the source rows missing from the target can be inserted")
+
+        assignments = self.query._assignments(values, exclude_keys=False)
+        self.query.do_when(MergeBranch(self.match, self.condition, "INSERT", assignments))
+        return self.query
+
+
+class MergeQueryBuilder:
+    """
+    Query builder used to build MERGE statements, e.g. an upsert of many rows in a single statement::
+
+        Query.merge_into(users).using_values(rows, ["id", "name"]).on_field("id")
+            .when_matched().update().when_not_matched().insert()
+
+    The branches are evaluated in order and the first one whose condition holds applies to the row.
+    """
+
+    QUOTE_CHAR = '"'
+    SECONDARY_QUOTE_CHAR = "'"
+    ALIAS_QUOTE_CHAR = None
+    QUERY_CLS = Query
+
+    MATCHED = "MATCHED"
+    NOT_MATCHED = "NOT MATCHED"
+    NOT_MATCHED_BY_SOURCE = "NOT MATCHED BY SOURCE"
+    # Whether the dialect supports branches for the target rows missing from the source
+    SUPPORTS_NOT_MATCHED_BY_SOURCE = False
+
+    def __init__(self, dialect: Dialects | None = None) -> None:
+        self._target = None
+        self._source = None
+        self._on = None
+        self._key_columns = []
+        self._whens = []
+        self.dialect = dialect
+
+    def _set_kwargs_defaults(self, kwargs: dict) -> None:
+        kwargs.setdefault("quote_char", self.QUOTE_CHAR)
+        kwargs.setdefault("secondary_quote_char", self.SECONDARY_QUOTE_CHAR)
+        kwargs.setdefault("alias_quote_char", self.ALIAS_QUOTE_CHAR)
+        kwargs.setdefault("dialect", self.dialect)
+
+    @builder
+    def merge_into(self, table: Table | str) -> None:
+        if self._target is not None:
+            raise AttributeError("'MergeQuery' object already has attribute merge_into")
+        self._target = table if isinstance(table, Table) else Table(table)
+
+    @builder
+    def using(self, source: Selectable | str, alias: str | None = None) -> None:
+        """
+        Sets the source of the rows merged into the target.
+
+        :param source:
+            A table, a subquery or an inline VALUES table.
+        :param alias:
+            The alias of the source, required for subqueries.
+        """
+        if isinstance(source, str):
+            source = Table(source)
+        if alias is not None:
+            source = source.as_(alias)
+        if isinstance(source, QueryBuilder) and source.alias is None:
+            raise QueryException("A subquery used as the source of a MERGE requires an alias")
+        self._set_source(source)
+
+    @builder
+    def using_values(self, rows: Sequence[Sequence[Any]], columns: Sequence[str], alias: str = "s") -> None:
+        """
+        Uses inline rows as the source, see `ValuesTable`.
+        """
+        self._set_source(ValuesTable(rows, columns, alias=alias))
+
+    def _set_source(self, source: Selectable) -> None:
+        if self._source is not None:
+            raise AttributeError("'MergeQuery' object already has attribute using")
+        self._source = source
+
+    @builder
+    def on(self, criterion: Criterion) -> None:
+        self._on = criterion
+
+    @builder
+    def on_field(self, *columns: str) -> None:
+        """
+        Matches the rows of the target and of the source with equal values in the given columns.
+        """
+        if self._target is None or self._source is None:
+            raise QueryException("The target and the source must be set before the key columns")
+
+        self._on = Criterion.all(
+            [Field(column, table=self._target) == Field(column, table=self._source) for column in columns]
+        )
+        self._key_columns = list(columns)
+
+    @builder
+    def when_matched(self, condition: Criterion | None = None) -> MergeWhen:
+        """
+        Adds a branch for the target rows matching a source row, which are updated or deleted.
+        """
+        return MergeWhen(self, self.MATCHED, condition)
+
+    @builder
+    def when_not_matched(self, condition: Criterion | None = None) -> MergeWhen:
+        """
+        Adds a branch for the source rows missing from the target, which are inserted.
+        """
+        return MergeWhen(self, self.NOT_MATCHED, condition)
+
+    @builder
+    def when_not_matched_by_source(self, condition: Criterion | None = None) -> MergeWhen:
+        """
+        Adds a branch for the target rows missing from the source, which are updated or deleted.
+        """
+        if not self.SUPPORTS_NOT_MATCHED_BY_SOURCE:
+            raise DialectNotSupported("WHEN NOT MATCHED BY SOURCE is not supported for dialect {}".format(self.dialect))
+        return MergeWhen(self, self.NOT_MATCHED_BY_SOURCE, condition)
+
+    def do_when(self, branch: MergeBranch) -> None:
+        self._whens = self._whens + [branch]
+
+    def _assignments(
+        self, values: Sequence[str | Field] | Mapping[str | Field, Any] | None, exclude_keys: bool
+    ) -> list[tuple[Field, Term]]:
+        if isinstance(values, Mapping):
+            return [(self._column(column), Term.wrap_constant(value)) for column, value in values.items()]
+
+        if values is None:
+            if not isinstance(self._source, ValuesTable):
+                raise QueryException("The columns are required unless the source is an inline VALUES table")
+            values = [column for column in self._source.columns if not (exclude_keys and column in self._key_columns)]
+
+        return [(self._column(column), Field(self._column(column).name, table=self._source)) for column in values]
+
+    @staticmethod
+    def _column(column: str | Field) -> Field:
+        return Field(column.name if isinstance(column, Field) else column)
+
+    def _validate(self) -> None:
+        if self._target is None or self._source is None or self._on is None:
+            raise QueryException("A MERGE requires a target, a source and a match condition")
+        if not self._whens:
+            raise QueryException("A MERGE requires at least one WHEN branch")
+
+        unconditional = set()
+        for branch in self._whens:
+            if branch.match in unconditional:
+                raise QueryException(
+                    "Unreachable WHEN {match} branch after an unconditional one".format(match=branch.match)
+                )
+            if branch.condition is None:
+                unconditional.add(branch.match)
+
+    def get_sql(self, **kwargs: Any) -> str:
+        self._set_kwargs_defaults(kwargs)
+        self._validate()
+
+        querystring = "MERGE INTO {target} USING {source} ON {on}".format(
+            target=self._target.get_sql(**kwargs),
+            source=self._source.get_sql(subquery=True, with_alias=True, **kwargs),
+            on=self._on_sql(**kwargs),
+        )
+        return querystring + self._whens_sql(**kwargs)
+
+    def _on_sql(self, **kwargs: Any) -> str:
+        return self._on.get_sql(with_namespace=True, **kwargs)
+
+    def _whens_sql(self, **kwargs: Any) -> str:
+        return "".join(
+            " WHEN {match}{condition} THEN {action}".format(
+                match=branch.match,
+                condition=(
+                    " AND " + branch.condition.get_sql(with_namespace=True, **kwargs)
+                    if branch.condition is not None
+                    else ""
+                ),
+                action=self._action_sql(branch, **kwargs),
+            )
+            for branch in self._whens
+        )
+
+    def _action_sql(self, branch: MergeBranch, **kwargs: Any) -> str:
+        if branch.action == "UPDATE":
+            return "UPDATE" + self._set_sql(branch, **kwargs)
+        if branch.action == "INSERT":
+            return "INSERT ({columns}) VALUES ({values})".format(
+                columns=",".join(column.get_sql(**kwargs) for column, _ in branch.assignments),
+                values=",".join(value.get_sql(with_namespace=True, **kwargs) for _, value in branch.assignments),
+            )
+        return branch.action
+
+    def _set_sql(self, branch: MergeBranch, **kwargs: Any) -> str:
+        return " SET {set}".format(
+            set=",".join(
+                "{column}={value}".format(
+                    column=column.get_sql(**kwargs), value=value.get_sql(with_namespace=True, **kwargs)
+                )
+                for column, value in branch.assignments
+            )
+        )
+
+    def __str__(self) -> str:
+        return self.get_sql()
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class ExplainQueryBuilder:
+    """
+    Query builder used to wrap a query in a dialect specific EXPLAIN statement. Instances are created with
+    QueryBuilder.explain, dialects with a different syntax provide their own subclass.
+    """
+
+    # The supported formats, mapped to their name in the statement
+    FORMATS: dict[str, str] = {}
+    DEFAULT_FORMAT: str | None = None
+    SUPPORTS_ANALYZE = False
+    SUPPORTS_BUFFERS = False
+
+    def __init__(
+        self, query: QueryBuilder, analyze: bool = False, format: str | None = None, buffers: bool = False
+    ) -> None:
+        if analyze and not self.SUPPORTS_ANALYZE:
+            raise DialectNotSupported("EXPLAIN ANALYZE is not supported for dialect {}".format(query.dialect))
+        if buffers and not self.SUPPORTS_BUFFERS:
+            raise DialectNotSupported("EXPLAIN BUFFERS is not supported for dialect {}".format(query.dialect))
+        if format is not None and not self.FORMATS:
+            raise DialectNotSupported("EXPLAIN formats are not supported for dialect {}".format(query.dialect))
+
+        self._query = query
+        self._analyze = analyze
+        self._buffers = buffers
+        self._format = self._validate_format(format) if format is not None else self.DEFAULT_FORMAT
+
+    def _validate_format(self, format: str) -> str:
+        if format.lower() not in self.FORMATS:
+            raise QueryException(
+                "Unsupported explain format '{format}', expected one of: {formats}".format(
+                    format=format, formats=", ".join(self.FORMATS)
+                )
+            )
+        return self.FORMATS[format.lower()]
+
+    def estimated_rows(self, output: Any) -> int:
+        """
+        Returns the number of rows estimated by the planner, read from the output of the statement returned by
+        `QueryBuilder.estimate`.
+        """
+        raise DialectNotSupported("Row count estimates are not supported for dialect {}".format(self._query.dialect))
+
+    def get_sql(self, **kwargs: Any) -> str:
+        return "EXPLAIN " + self._query.get_sql(**kwargs)
+
+    def __str__(self) -> str:
+        return self.get_sql()
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class ExportQueryBuilder:
+    """
+    Query builder used to wrap a SELECT query in a dialect specific bulk export statement. Instances are created with
+    QueryBuilder.export_to and each dialect supporting exports provides its own subclass.
+    """
+
+    FORMATS: tuple[str, ...] = ()
+    DEFAULT_FORMAT: str | None = None
+
+    def __init__(self, query: QueryBuilder, target: str, format: str | None = None, **options: Any) -> None:
+        self._query = query
+        self._target = target
+        self._format = self._validate_format(format) if format is not None else self.DEFAULT_FORMAT
+        self._options = options
+
+    def _validate_format(self, format: str) -> str:
+        formats = {name.upper(): name for name in self.FORMATS}
+        if format.upper() not in formats:
+            raise QueryException(
+                "Unsupported export format '{format}', expected one of: {formats}".format(
+                    format=format, formats=", ".join(self.FORMATS)
+                )
+            )
+        return formats[format.upper()]
+
+    def get_sql(self, **kwargs: Any) -> str:
+        raise NotImplementedError
+
+    def __str__(self) -> str:
+        return self.get_sql()
+
+    def __repr__(self) -> str:
+        return self.__str__()
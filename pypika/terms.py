@@ -5,6 +5,7 @@ import re
 import sys
 import uuid
 from collections.abc import Callable, Iterable, Iterator, Sequence
+from copy import copy
 from datetime import date, datetime, time
 from enum import Enum
 from typing import TYPE_CHECKING, Any, TypeVar, overload
@@ -195,13 +196,15 @@ class Term(Node):
     def all_(self) -> All:
         return All(self)
 
-    def isin(self, arg: list | tuple | set | frozenset | Term) -> ContainsCriterion:
+    def isin(self, arg: list | tuple | set | frozenset | Term, global_: bool = False) -> ContainsCriterion:
         if isinstance(arg, (list, tuple, set, frozenset)):
-            return ContainsCriterion(self, Tuple(*[self.wrap_constant(value) for value in arg]))
-        return ContainsCriterion(self, arg)
+            criterion = ContainsCriterion(self, Tuple(*[self.wrap_constant(value) for value in arg]))
+        else:
+            criterion = ContainsCriterion(self, arg)
+        return criterion.global_() if global_ else criterion
 
-    def notin(self, arg: list | tuple | set | frozenset | Term) -> ContainsCriterion:
-        return self.isin(arg).negate()
+    def notin(self, arg: list | tuple | set | frozenset | Term, global_: bool = False) -> ContainsCriterion:
+        return self.isin(arg, global_=global_).negate()
 
     def bin_regex(self, pattern: str) -> BasicCriterion:
         return BasicCriterion(Matching.bin_regex, self, self.wrap_constant(pattern))
@@ -299,6 +302,30 @@ class Term(Node):
         raise NotImplementedError()
 
 
+def replace_terms(value: Any, replace: Callable[[Term], Term | None]) -> Any:
+    """
+    Returns a copy of a term tree where every term for which `replace` returns a value is substituted. Subqueries are
+    left untouched.
+    """
+    from pypika.queries import Selectable
+
+    if isinstance(value, list):
+        return [replace_terms(item, replace) for item in value]
+    if isinstance(value, tuple):
+        return tuple(replace_terms(item, replace) for item in value)
+    if not isinstance(value, Term) or isinstance(value, Selectable):
+        return value
+
+    replaced = replace(value)
+    if replaced is not None:
+        return replaced
+
+    newone = copy(value)
+    for name, attribute in vars(value).items():
+        setattr(newone, name, replace_terms(attribute, replace))
+    return newone
+
+
 def idx_placeholder_gen(idx: int) -> str:
     return str(idx + 1)
 
@@ -309,6 +336,8 @@ def named_placeholder_gen(idx: int) -> str:
 
 class Parameter(Term):
     is_aggregate = None
+    # Whether the literal values are rendered as placeholders when given as the `parameter` argument of get_sql
+    replaces_values = True
 
     def __init__(self, placeholder: str | int) -> None:
         super().__init__()
@@ -461,7 +490,7 @@ class ValueWrapper(Term):
         parameter: Parameter = None,
         **kwargs: Any,
     ) -> str:
-        if parameter is None:
+        if parameter is None or not parameter.replaces_values:
             sql = self.get_value_sql(quote_char=quote_char, secondary_quote_char=secondary_quote_char, **kwargs)
             return format_alias_sql(sql, self.alias, quote_char=quote_char, **kwargs)
 
@@ -900,6 +929,7 @@ class ContainsCriterion(Criterion):
         self.term = term
         self.container = container
         self._is_negated = False
+        self._is_global = False
 
     def nodes_(self) -> Iterator[NodeT]:
         yield self
@@ -925,9 +955,12 @@ class ContainsCriterion(Criterion):
         self.term = self.term.replace_table(current_table, new_table)
 
     def get_sql(self, subquery: Any = None, **kwargs: Any) -> str:
-        sql = "{term} {not_}IN {container}".format(
+        # GLOBAL only changes how ClickHouse distributes the query, other dialects render a plain IN
+        is_global = self._is_global and kwargs.get("dialect") == Dialects.CLICKHOUSE
+        sql = "{term} {global_}{not_}IN {container}".format(
             term=self.term.get_sql(**kwargs),
             container=self.container.get_sql(subquery=True, **kwargs),
+            global_="GLOBAL " if is_global else "",
             not_="NOT " if self._is_negated else "",
         )
         return format_alias_sql(sql, self.alias, **kwargs)
@@ -936,6 +969,14 @@ class ContainsCriterion(Criterion):
     def negate(self) -> ContainsCriterion:
         self._is_negated = True
 
+    @builder
+    def global_(self) -> ContainsCriterion:
+        """
+        Marks the criterion as GLOBAL IN for ClickHouse, so the container subquery is run once on the initiator and
+        sent to the shards instead of being run by every shard of a Distributed table.
+        """
+        self._is_global = True
+
 
 class ExistsCriterion(Criterion):
     def __init__(self, container, alias=None):
@@ -1755,6 +1796,17 @@ class Mod(Function):
     def __init__(self, term: Term, modulus: float, alias: str | None = None) -> None:
         super().__init__("MOD", term, modulus, alias=alias)
 
+    def get_function_sql(self, **kwargs: Any) -> str:
+        if kwargs.get("dialect") != Dialects.MSSQL:
+            return super().get_function_sql(**kwargs)
+
+        # SQL Server only has the % operator
+        term, modulus = (
+            arg.get_sql(with_alias=False, subquery=True, **kwargs) if hasattr(arg, "get_sql") else str(arg)
+            for arg in self.args
+        )
+        return "({term}%{modulus})".format(term=term, modulus=modulus)
+
 
 class Rollup(Function):
     def __init__(self, *terms: Any) -> None:
@@ -0,0 +1,90 @@
+import unittest
+
+from parameterized import parameterized
+
+from pypika import Field, QueryException, Table
+from pypika.clickhouse.aggregate import (
+    ArgMax,
+    ClickHouseAggregateFunction,
+    Count,
+    CountIf,
+    Quantiles,
+    Sum,
+    SumIf,
+    TopK,
+    Uniq,
+)
+from pypika.dialects import ClickHouseQuery
+
+
+class TestCombinators(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("sumIf(amount,status='paid')", SumIf(Field("amount"), Field("status") == "paid")),
+            ("countIf(ok=1)", CountIf(Field("ok") == 1)),
+            ("count()", Count()),
+            ("uniqState(user_id)", Uniq(Field("user_id")).state()),
+            ("uniqIfState(user_id,active)", Uniq(Field("user_id")).if_(Field("active")).state()),
+            ("sumArray(amounts)", Sum(Field("amounts")).array()),
+            ("sumOrDefault(amount)", Sum(Field("amount")).or_default()),
+            ("argMax(name,ts)", ArgMax(Field("name"), Field("ts"))),
+            ("quantilesState(0.5,0.9)(latency)", Quantiles(Field("latency"), 0.5, 0.9).state()),
+            ("topKDistinct(5)(tag)", TopK(Field("tag"), 5).distinct()),
+            ("anyLast(x)", ClickHouseAggregateFunction("anyLast", Field("x"))),
+        ]
+    )
+    def test_get_sql(self, expected: str, func: ClickHouseAggregateFunction):
+        self.assertEqual(expected, func.get_sql())
+
+    def test_builders_do_not_mutate_definition(self):
+        users = Uniq(Field("user_id"))
+        users.if_(Field("active")).state()
+
+        self.assertEqual("uniq(user_id)", users.get_sql())
+
+    def test_state_twice_raises_exception(self):
+        with self.assertRaises(QueryException):
+            Uniq(Field("user_id")).state().state()
+
+    def test_quantiles_requires_levels(self):
+        with self.assertRaises(QueryException):
+            Quantiles(Field("latency"))
+
+
+class TestStateMerge(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("uniqMerge(users)", Uniq(Field("user_id")).if_(Field("active")).state().merge(Field("users"))),
+            ("quantilesMerge(0.5,0.9)(q)", Quantiles(Field("latency"), 0.5, 0.9).state().merge("q")),
+            ("sumMergeOrNull(total)", Sum(Field("amount")).or_null().state().merge("total")),
+            ("sumMergeState(total)", Sum(Field("amount")).or_null().state().merge_state("total")),
+            ("sumDistinctMerge(total)", Sum(Field("amount")).distinct().state().merge("total")),
+            ("sumArrayMerge(total)", Sum(Field("amounts")).array().state().merge("total")),
+            (
+                "uniqArrayDistinctMergeOrNull(users)",
+                Uniq(Field("user_ids")).array().if_(Field("active")).distinct().or_null().state().merge("users"),
+            ),
+            ("sumDistinctMergeState(total)", Sum(Field("amount")).distinct().state().merge_state("total")),
+        ]
+    )
+    def test_get_sql(self, expected: str, func: ClickHouseAggregateFunction):
+        self.assertEqual(expected, func.get_sql())
+
+    def test_is_aggregate(self):
+        users = Uniq(Field("user_id"))
+
+        self.assertTrue(users.state().is_aggregate)
+        self.assertTrue(users.merge("users").is_aggregate)
+
+    def test_rollup_from_one_definition(self):
+        events, daily = Table("events"), Table("daily")
+        users = Uniq(events.user_id)
+
+        insert = ClickHouseQuery.from_(events).select(events.day, users.state().as_("users")).groupby(events.day)
+        rollup = ClickHouseQuery.from_(daily).select(users.merge(daily.users).as_("users"))
+
+        self.assertEqual(
+            'SELECT "day",uniqState("user_id") AS "users" FROM "events" GROUP BY "day"',
+            str(insert),
+        )
+        self.assertEqual('SELECT uniqMerge("users") AS "users" FROM "daily"', str(rollup))
@@ -5,8 +5,15 @@ from parameterized import parameterized
 from pypika import Field
 from pypika.clickhouse.array import (
     Array,
+    ArrayExists,
+    ArrayFilter,
+    ArrayMap,
+    ArrayReduce,
     Empty,
+    GroupArray,
     HasAny,
+    Lambda,
+    LambdaParameter,
     Length,
     NotEmpty,
 )
@@ -20,11 +27,11 @@ class TestArray(unittest.TestCase):
     @parameterized.expand(
         [
             (
-                "['ridley', 'scott', 'jimi', 'hendrix']",
+                "['ridley','scott','jimi','hendrix']",
                 Array(["ridley", "scott", "jimi", "hendrix"]),
             ),
             (
-                "[1, 2, 3, 4]",
+                "[1,2,3,4]",
                 Array([1, 2, 3, 4]),
             ),
             (
@@ -40,6 +47,12 @@ class TestArray(unittest.TestCase):
     def test_get_sql(self, expected: str, array: Array):
         self.assertEqual(expected, array.get_sql())
 
+    def test_quotes_are_escaped(self):
+        self.assertEqual("['it''s',true,null]", Array(["it's", True, None]).get_sql())
+
+    def test_nested_arrays(self):
+        self.assertEqual("[[1,2],['a']]", Array([[1, 2], ["a"]]).get_sql())
+
 
 class TestHasAny(unittest.TestCase):
     @parameterized.expand(
@@ -48,7 +61,7 @@ class TestHasAny(unittest.TestCase):
                 'hasAny("mental_abilities","physical_abilities")',
                 HasAny(Field("mental_abilities"), Field("physical_abilities")),
             ),
-            ("hasAny([1, 2, 3, 4],[3])", HasAny(Array([1, 2, 3, 4]), Array([3]))),
+            ("hasAny([1,2,3,4],[3])", HasAny(Array([1, 2, 3, 4]), Array([3]))),
             (
                 "hasAny(\"bands\",[toFixedString('port-royal',20),toFixedString('hammock',20)])",
                 HasAny(
@@ -69,7 +82,7 @@ class TestLength(unittest.TestCase):
                 'length("tags")',
                 Length(Field("tags")),
             ),
-            ("length([1, 2, 3])", Length(Array([1, 2, 3]))),
+            ("length([1,2,3])", Length(Array([1, 2, 3]))),
         ]
     )
     def test_get_sql(self, expected: str, func: Length):
@@ -83,7 +96,7 @@ class TestEmpty(unittest.TestCase):
                 'empty("tags")',
                 Empty(Field("tags")),
             ),
-            ("empty([1, 2, 3])", Empty(Array([1, 2, 3]))),
+            ("empty([1,2,3])", Empty(Array([1, 2, 3]))),
         ]
     )
     def test_get_sql(self, expected: str, func: Empty):
@@ -97,8 +110,39 @@ class TestNotEmpty(unittest.TestCase):
                 'notEmpty("tags")',
                 NotEmpty(Field("tags")),
             ),
-            ("notEmpty([1, 2, 3])", NotEmpty(Array([1, 2, 3]))),
+            ("notEmpty([1,2,3])", NotEmpty(Array([1, 2, 3]))),
         ]
     )
     def test_get_sql(self, expected: str, func: NotEmpty):
         self.assertEqual(expected, func.get_sql())
+
+
+class TestLambda(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("x->x*2", Lambda.from_callable(lambda x: x * 2)),
+            ("(x,y)->x>y", Lambda.from_callable(lambda x, y: x > y)),
+            ("x->x='a'", Lambda("x", LambdaParameter("x") == "a")),
+        ]
+    )
+    def test_get_sql(self, expected: str, func: Lambda):
+        self.assertEqual(expected, func.get_sql())
+
+
+class TestHigherOrderFunctions(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("arrayMap(x->x*2,nums)", ArrayMap(lambda x: x * 2, Field("nums"))),
+            ("arrayFilter((x,y)->x>y,a,b)", ArrayFilter(lambda x, y: x > y, Field("a"), Field("b"))),
+            ("arrayExists(x->x>2,[1,2,3])", ArrayExists(lambda x: x > 2, Array([1, 2, 3]))),
+            ("arrayExists(flags)", ArrayExists(None, Field("flags"))),
+            ("arrayReduce('max',nums)", ArrayReduce("max", Field("nums"))),
+            ("groupArray(id)", GroupArray(Field("id"))),
+            ("groupArray(10)(id)", GroupArray(Field("id"), 10)),
+        ]
+    )
+    def test_get_sql(self, expected: str, func):
+        self.assertEqual(expected, func.get_sql())
+
+    def test_group_array_is_aggregate(self):
+        self.assertTrue(GroupArray(Field("id")).is_aggregate)
@@ -0,0 +1,53 @@
+import unittest
+
+from parameterized import parameterized
+
+from pypika import Field
+from pypika.clickhouse.dictionary import (
+    DictGet,
+    DictGetOrDefault,
+    DictHas,
+    DictionaryLayout,
+    DictionarySource,
+)
+from pypika.terms import Tuple
+
+
+class TestDictionaryFunctions(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("dictGet('users','name',user_id)", DictGet("users", "name", Field("user_id"))),
+            ("dictGet('users',('name','email'),user_id)", DictGet("users", ["name", "email"], Field("user_id"))),
+            (
+                "dictGet('rates','rate',(currency,day))",
+                DictGet("rates", "rate", Tuple(Field("currency"), Field("day"))),
+            ),
+            (
+                "dictGetOrDefault('users','name',user_id,'unknown')",
+                DictGetOrDefault("users", "name", Field("user_id"), "unknown"),
+            ),
+            ("dictHas('users',42)", DictHas("users", 42)),
+        ]
+    )
+    def test_get_sql(self, expected: str, func):
+        self.assertEqual(expected, func.get_sql())
+
+
+class TestDictionaryClauses(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("CLICKHOUSE(TABLE 'users' DB 'default')", DictionarySource("clickhouse", table="users", db="default")),
+            (
+                "HTTP(URL 'http://host/users.csv' FORMAT 'CSV')",
+                DictionarySource("http", url="http://host/users.csv", format="CSV"),
+            ),
+            ("HASHED()", DictionaryLayout("hashed")),
+            ("HASHED(SHARDS 16)", DictionaryLayout("hashed", shards=16)),
+        ]
+    )
+    def test_get_sql(self, expected: str, clause):
+        self.assertEqual(expected, clause.get_sql())
+
+    def test_range_layout(self):
+        self.assertTrue(DictionaryLayout("range_hashed").is_range)
+        self.assertFalse(DictionaryLayout("flat").is_range)
@@ -0,0 +1,96 @@
+import datetime
+import struct
+import unittest
+
+from parameterized import parameterized
+
+from pypika import QueryException
+from pypika.clickhouse.formats import (
+    JSONEachRowEncoder,
+    RowBinaryEncoder,
+    TSVEncoder,
+    encode_rows,
+)
+from pypika.clickhouse.type_conversion import (
+    ToDate,
+    ToDateTime,
+    ToFixedString,
+    ToFloat64,
+    ToInt8,
+    ToString,
+    ToUInt32,
+    ToUInt64,
+)
+
+
+class TestRowBinaryEncoder(unittest.TestCase):
+    @parameterized.expand(
+        [
+            (ToInt8, -1, b"\xff"),
+            (ToUInt32, 1, b"\x01\x00\x00\x00"),
+            (ToFloat64, 1.5, struct.pack("<d", 1.5)),
+            (ToDate, datetime.date(1970, 1, 3), b"\x02\x00"),
+            (ToDateTime, datetime.datetime(1970, 1, 1, 0, 0, 1), b"\x01\x00\x00\x00"),
+            (ToString, "ab", b"\x02ab"),
+            (ToString, "x" * 200, b"\xc8\x01" + b"x" * 200),
+            ((ToFixedString, 3), "ab", b"ab\x00"),
+        ]
+    )
+    def test_encode_value(self, column_type, value, expected):
+        self.assertEqual(expected, b"".join(RowBinaryEncoder([column_type]).encode([(value,)])))
+
+    def test_encode_mixed_row(self):
+        chunks = RowBinaryEncoder([ToUInt64, ToString, ToInt8]).encode([(1, "a", 2)])
+
+        self.assertEqual(b"\x01\x00\x00\x00\x00\x00\x00\x00\x01a\x02", b"".join(chunks))
+
+    @parameterized.expand([(ToUInt64,), (ToString,), ((ToFixedString, 3),)])
+    def test_null_raises_exception(self, column_type):
+        with self.assertRaises(QueryException):
+            list(RowBinaryEncoder([column_type]).encode([(None,)]))
+
+    def test_too_long_fixed_string_raises_exception(self):
+        with self.assertRaises(QueryException):
+            list(RowBinaryEncoder([(ToFixedString, 3)]).encode([("abcd",)]))
+
+    def test_unsupported_type_raises_exception(self):
+        with self.assertRaises(QueryException):
+            RowBinaryEncoder([ToFixedString])
+
+
+class TestTextEncoders(unittest.TestCase):
+    def test_tsv_escapes_values(self):
+        chunks = TSVEncoder().encode([("a\tb\\c\nd", None, True, datetime.datetime(2020, 1, 2, 3, 4, 5))])
+
+        self.assertEqual(b"a\\tb\\\\c\\nd\t\\N\t1\t2020-01-02 03:04:05\n", b"".join(chunks))
+
+    def test_json_each_row(self):
+        chunks = JSONEachRowEncoder(["a", "b"]).encode([(1, datetime.date(2020, 1, 2)), (2, None)])
+
+        self.assertEqual(b'{"a":1,"b":"2020-01-02"}\n{"a":2,"b":null}\n', b"".join(chunks))
+
+    def test_json_each_row_with_wrong_row_length_raises_exception(self):
+        for row in ((1,), (1, 2, 3)):
+            with self.subTest(row):
+                with self.assertRaises(QueryException):
+                    list(JSONEachRowEncoder(["a", "b"]).encode([row]))
+
+    def test_json_each_row_requires_columns(self):
+        with self.assertRaises(QueryException):
+            JSONEachRowEncoder([])
+
+
+class TestEncodeRows(unittest.TestCase):
+    def test_rows_are_split_in_chunks(self):
+        chunks = list(encode_rows([(1,), (2,), (3,)], "RowBinary", types=[ToUInt32], chunk_size=8))
+
+        self.assertEqual([8, 4], [len(chunk) for chunk in chunks])
+        self.assertTrue(all(isinstance(chunk, memoryview) for chunk in chunks))
+
+    def test_row_binary_requires_types(self):
+        with self.assertRaises(QueryException):
+            encode_rows([(1,)], "RowBinary")
+
+    def test_unsupported_format_raises_exception(self):
+        with self.assertRaises(QueryException):
+            encode_rows([(1,)], "Parquet")
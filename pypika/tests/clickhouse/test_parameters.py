@@ -0,0 +1,80 @@
+import datetime
+import unittest
+
+from parameterized import parameterized
+
+from pypika import Field, QueryException
+from pypika.clickhouse.parameters import (
+    ClickHouseParameter,
+    ClickHouseParameters,
+    bind_parameters,
+    format_parameter_value,
+)
+from pypika.clickhouse.type_conversion import (
+    ToDateTime,
+    ToFixedString,
+    ToUInt64,
+)
+
+
+class TestClickHouseParameter(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("{id:UInt64}", ClickHouseParameter("id", ToUInt64)),
+            ("{ts:DateTime}", ClickHouseParameter("ts", ToDateTime)),
+            ("{code:FixedString(3)}", ClickHouseParameter("code", (ToFixedString, 3))),
+            ("{tags:Array(String)}", ClickHouseParameter("tags", "Array(String)")),
+        ]
+    )
+    def test_get_sql(self, expected: str, parameter: ClickHouseParameter):
+        self.assertEqual(expected, parameter.get_sql())
+
+    def test_unsupported_type_raises_exception(self):
+        with self.assertRaises(QueryException):
+            ClickHouseParameter("id", int)
+
+    def test_fixed_string_without_length_raises_exception(self):
+        with self.assertRaises(QueryException):
+            ClickHouseParameter("code", ToFixedString)
+
+    def test_collect_parameters(self):
+        parameters = ClickHouseParameters()
+        id_parameter = ClickHouseParameter("id", ToUInt64)
+        criterion = (Field("id") == id_parameter) & (Field("name") == "x")
+
+        self.assertEqual("\"id\"={id:UInt64} AND \"name\"='x'", criterion.get_sql(quote_char='"', parameter=parameters))
+        self.assertEqual([id_parameter], parameters.get_parameters())
+
+
+class TestParameterValues(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("42", 42),
+            ("a\\tb", "a\tb"),
+            ("true", True),
+            ("\\N", None),
+            ("2020-01-02", datetime.date(2020, 1, 2)),
+            ("2020-01-02 03:04:05", datetime.datetime(2020, 1, 2, 3, 4, 5)),
+            ("2020-01-02 03:04:05.000100", datetime.datetime(2020, 1, 2, 3, 4, 5, 100)),
+            ("[1,2]", [1, 2]),
+            ("['a','it\\'s',NULL]", ["a", "it's", None]),
+            ("(1,'a')", (1, "a")),
+        ]
+    )
+    def test_format_parameter_value(self, expected: str, value):
+        self.assertEqual(expected, format_parameter_value(value))
+
+    def test_bind_parameters(self):
+        parameters = [ClickHouseParameter("id", ToUInt64), ClickHouseParameter("limit", ToUInt64, 10)]
+
+        self.assertEqual({"param_id": "1", "param_limit": "10"}, bind_parameters(parameters, {"id": 1}))
+        self.assertEqual({"param_id": "1", "param_limit": "5"}, bind_parameters(parameters, {"id": 1, "limit": 5}))
+
+    def test_bind_parameters_validation(self):
+        for parameters, values in (
+            ([ClickHouseParameter("id", ToUInt64)], {}),
+            ([ClickHouseParameter("id", ToUInt64)], {"id": 1, "other": 2}),
+            ([ClickHouseParameter("id", ToUInt64), ClickHouseParameter("id", "String")], {"id": 1}),
+        ):
+            with self.subTest(values=values), self.assertRaises(QueryException):
+                bind_parameters(parameters, values)
@@ -2,12 +2,17 @@ import unittest
 
 from parameterized import parameterized
 
-from pypika import Field
+from pypika import Field, FunctionException
 from pypika.clickhouse.search_string import (
+    HasToken,
+    HasTokenCaseInsensitive,
     Like,
     Match,
     MultiMatchAny,
+    MultiSearchAllPositions,
     MultiSearchAny,
+    MultiSearchFirstIndex,
+    NgramSearch,
     NotLike,
 )
 
@@ -35,7 +40,54 @@ class TestMultiSearch(unittest.TestCase):
                 MultiMatchAny(Field("name"), ["sarah", "connor"]),
                 "multiMatchAny(toString(\"name\"),['sarah','connor'])",
             ),
+            (
+                MultiSearchAllPositions(Field("name"), ["sarah", "connor"]),
+                "multiSearchAllPositions(toString(\"name\"),['sarah','connor'])",
+            ),
+            (
+                MultiSearchFirstIndex(Field("name"), ["sarah", "connor"]),
+                "multiSearchFirstIndex(toString(\"name\"),['sarah','connor'])",
+            ),
+            (
+                MultiSearchAny(Field("name"), ["o'neil"]),
+                "multiSearchAny(toString(\"name\"),['o''neil'])",
+            ),
+            (
+                MultiMatchAny(Field("name"), [r"\d+", r"a\'b"]),
+                "multiMatchAny(toString(\"name\"),['\\\\d+','a\\\\''b'])",
+            ),
         ]
     )
     def test_multi_search_string(self, func, expected):
         self.assertEqual(func.get_sql(), expected)
+
+    def test_needles_are_split_in_or_calls(self):
+        func = MultiSearchAny(Field("name"), ["a", "b", "c"], max_needles=2)
+
+        self.assertEqual(
+            "(multiSearchAny(toString(\"name\"),['a','b']) OR multiSearchAny(toString(\"name\"),['c']))",
+            func.get_sql(),
+        )
+
+    def test_default_needle_limit(self):
+        func = MultiMatchAny(Field("name"), [str(i) for i in range(300)])
+
+        self.assertEqual(2, func.get_sql().count("multiMatchAny("))
+
+    def test_too_many_needles_raises_exception(self):
+        func = MultiSearchFirstIndex(Field("name"), ["a", "b", "c"], max_needles=2)
+
+        with self.assertRaises(FunctionException):
+            func.get_sql()
+
+
+class TestTokenSearch(unittest.TestCase):
+    @parameterized.expand(
+        [
+            (HasToken(Field("message"), "error"), "hasToken(message,'error')"),
+            (HasTokenCaseInsensitive(Field("message"), "Error"), "hasTokenCaseInsensitive(message,'Error')"),
+            (NgramSearch(Field("message"), "timeout"), "ngramSearch(message,'timeout')"),
+        ]
+    )
+    def test_get_sql(self, func, expected):
+        self.assertEqual(expected, func.get_sql())
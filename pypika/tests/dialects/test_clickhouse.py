@@ -2,9 +2,21 @@ from unittest import TestCase
 
 from pypika import (
     ClickHouseQuery,
+    Column,
     Database,
+    DialectNotSupported,
+    Field,
+    Interval,
+    JoinType,
+    Query,
+    QueryException,
     Table,
 )
+from pypika.clickhouse.engines import Buffer, Distributed, MergeTree, ReplacingMergeTree, SummingMergeTree
+from pypika.clickhouse.parameters import ClickHouseParameter
+from pypika.clickhouse.type_conversion import ToUInt64
+from pypika.functions import Lower
+from pypika.terms import Function
 
 
 class ClickHouseQueryTests(TestCase):
@@ -49,6 +61,12 @@ class ClickHouseDeleteTests(TestCase):
         self.assertEqual('ALTER TABLE "abc" DELETE WHERE "foo"="bar"', str(q1))
         self.assertEqual('ALTER TABLE "abc" DELETE WHERE "foo"="bar"', str(q2))
 
+    def test_chunks_of_rows_not_supported(self):
+        chunks = ClickHouseQuery.from_(self.table_abc).delete().where(self.table_abc.foo == 1).iter_chunks("id", 100)
+
+        with self.assertRaises(DialectNotSupported):
+            chunks.statement()
+
 
 class ClickHouseUpdateTests(TestCase):
     table_abc = Table("abc")
@@ -101,6 +119,12 @@ class ClickHouseDropQuery(TestCase):
         self.assertEqual('DROP VIEW "myview"', str(q3))
 
 
+class MergeTests(TestCase):
+    def test_merge_not_supported(self):
+        with self.assertRaises(DialectNotSupported):
+            ClickHouseQuery.merge_into(Table("users"))
+
+
 class DistinctOnTests(TestCase):
     table_abc = Table("abc")
 
@@ -144,3 +168,585 @@ class LimitByTests(TestCase):
             '''SELECT "xyz"."b","join"."b" FROM "xyz" JOIN "join" USING ("a") LIMIT 1 BY ("xyz"."a","join"."a")''',
             str(q),
         )
+
+
+class ExportTests(TestCase):
+    table_abc = Table("abc")
+
+    def test_into_outfile(self):
+        q = ClickHouseQuery.from_(self.table_abc).select("foo").export_to("abc.csv", format="CSVWithNames")
+
+        self.assertEqual('SELECT "foo" FROM "abc" INTO OUTFILE \'abc.csv\' FORMAT CSVWithNames', str(q))
+
+    def test_into_outfile_with_compression(self):
+        q = ClickHouseQuery.from_(self.table_abc).select("foo").export_to("abc.tsv.gz", compression="gzip")
+
+        self.assertEqual('SELECT "foo" FROM "abc" INTO OUTFILE \'abc.tsv.gz\' COMPRESSION \'gzip\'', str(q))
+
+    def test_format_to_stdout(self):
+        q = ClickHouseQuery.from_(self.table_abc).select("foo").export_to("stdout", format="jsoneachrow")
+
+        self.assertEqual('SELECT "foo" FROM "abc" FORMAT JSONEachRow', str(q))
+
+
+class InsertFormatTests(TestCase):
+    table_abc = Table("abc")
+
+    def test_insert_with_format(self):
+        q = ClickHouseQuery.into(self.table_abc).columns("a", "b").format("RowBinary")
+
+        self.assertEqual('INSERT INTO "abc" ("a","b") FORMAT RowBinary', str(q))
+
+    def test_format_name_is_case_insensitive(self):
+        q = ClickHouseQuery.into(self.table_abc).format("jsoneachrow")
+
+        self.assertEqual('INSERT INTO "abc" FORMAT JSONEachRow', str(q))
+
+    def test_unsupported_format_raises_exception(self):
+        with self.assertRaises(QueryException):
+            ClickHouseQuery.into(self.table_abc).format("XML")
+
+    def test_format_with_values_raises_exception(self):
+        with self.assertRaises(QueryException):
+            str(ClickHouseQuery.into(self.table_abc).insert(1).format("TSV"))
+
+    def test_encode_rows_uses_insert_columns(self):
+        q = ClickHouseQuery.into(self.table_abc).columns("a", "b").format("JSONEachRow")
+
+        self.assertEqual(b'{"a":1,"b":"x"}\n', b"".join(q.encode_rows([(1, "x")])))
+
+    def test_encode_rows_without_format_raises_exception(self):
+        with self.assertRaises(QueryException):
+            ClickHouseQuery.into(self.table_abc).columns("a").encode_rows([(1,)])
+
+    def test_encode_rows_in_format_without_encoder_raises_exception(self):
+        for format in ("CSV", "Parquet", "ORC", "Arrow", "Native"):
+            with self.subTest(format):
+                q = ClickHouseQuery.into(self.table_abc).columns("a").format(format)
+
+                self.assertEqual('INSERT INTO "abc" ("a") FORMAT {}'.format(format), str(q))
+                with self.assertRaisesRegex(QueryException, "cannot be encoded"):
+                    q.encode_rows([(1,)])
+
+
+class SettingsTests(TestCase):
+    table_abc = Table("abc")
+
+    def test_settings_after_limit_by_and_limit(self):
+        q = (
+            ClickHouseQuery.from_(self.table_abc)
+            .select("a", "b")
+            .limit_by(1, "a")
+            .limit(10)
+            .settings(max_threads=4, optimize_read_in_order=True)
+        )
+
+        self.assertEqual(
+            'SELECT "a","b" FROM "abc" LIMIT 1 BY ("a") LIMIT 10 SETTINGS max_threads=4,optimize_read_in_order=1',
+            str(q),
+        )
+
+    def test_settings_are_merged(self):
+        q = ClickHouseQuery.from_(self.table_abc).select("a").settings(max_threads=4).settings(max_block_size=1024)
+
+        self.assertEqual('SELECT "a" FROM "abc" SETTINGS max_threads=4,max_block_size=1024', str(q))
+
+    def test_string_setting_is_quoted(self):
+        q = ClickHouseQuery.from_(self.table_abc).select("a").settings(load_balancing="nearest_hostname")
+
+        self.assertEqual('SELECT "a" FROM "abc" SETTINGS load_balancing=\'nearest_hostname\'', str(q))
+
+    def test_settings_in_subquery(self):
+        subquery = ClickHouseQuery.from_(self.table_abc).select("a").settings(max_threads=2)
+        q = ClickHouseQuery.from_(subquery).select("a")
+
+        self.assertEqual('SELECT "sq0"."a" FROM (SELECT "a" FROM "abc" SETTINGS max_threads=2) AS "sq0"', str(q))
+
+    def test_insert_settings_before_values(self):
+        q = ClickHouseQuery.into(self.table_abc).insert(1, "a").settings(async_insert=1)
+
+        self.assertEqual('INSERT INTO "abc" SETTINGS async_insert=1 VALUES (1,\'a\')', str(q))
+
+    def test_insert_settings_before_format(self):
+        q = ClickHouseQuery.into(self.table_abc).columns("a").format("TSV").settings(async_insert=1)
+
+        self.assertEqual('INSERT INTO "abc" ("a") SETTINGS async_insert=1 FORMAT TSV', str(q))
+
+    def test_mutation_settings(self):
+        with self.subTest("update"):
+            q = (
+                ClickHouseQuery.update(self.table_abc)
+                .set("a", 1)
+                .where(self.table_abc.b == 2)
+                .settings(mutations_sync=2)
+            )
+
+            self.assertEqual('ALTER TABLE "abc" UPDATE "a"=1 WHERE "b"=2 SETTINGS mutations_sync=2', str(q))
+
+        with self.subTest("delete"):
+            q = ClickHouseQuery.from_(self.table_abc).delete().where(self.table_abc.b == 2).settings(mutations_sync=2)
+
+            self.assertEqual('ALTER TABLE "abc" DELETE WHERE "b"=2 SETTINGS mutations_sync=2', str(q))
+
+    def test_timeout(self):
+        q = ClickHouseQuery.from_(self.table_abc).select("a").settings(max_threads=4).timeout(1500)
+
+        self.assertEqual('SELECT "a" FROM "abc" SETTINGS max_threads=4,max_execution_time=1.5', str(q))
+        self.assertEqual(['SELECT "a" FROM "abc" SETTINGS max_threads=4,max_execution_time=1.5'], q.get_statements())
+
+    def test_timeout_in_whole_seconds(self):
+        q = ClickHouseQuery.from_(self.table_abc).select("a").timeout(10000)
+
+        self.assertEqual('SELECT "a" FROM "abc" SETTINGS max_execution_time=10', str(q))
+
+    def test_drop_settings(self):
+        q = ClickHouseQuery.drop_table(self.table_abc).on_cluster("cluster").settings(max_table_size_to_drop=0)
+
+        self.assertEqual('DROP TABLE "abc" ON CLUSTER "cluster" SETTINGS max_table_size_to_drop=0', str(q))
+
+    def test_invalid_setting_type_raises_exception(self):
+        for settings in ({"max_threads": "4"}, {"max_memory_usage": True}, {"optimize_read_in_order": 1}):
+            with self.subTest(settings):
+                with self.assertRaises(QueryException):
+                    ClickHouseQuery.from_(self.table_abc).select("a").settings(**settings)
+
+        with self.assertRaises(QueryException):
+            ClickHouseQuery.drop_table(self.table_abc).settings(max_execution_time="10")
+
+
+class DistributedQueryTests(TestCase):
+    table_abc, table_efg = Table("abc"), Table("efg")
+
+    def test_global_in_subquery(self):
+        subquery = ClickHouseQuery.from_(self.table_efg).select(self.table_efg.id)
+        q = ClickHouseQuery.from_(self.table_abc).select("a").where(self.table_abc.id.isin(subquery, global_=True))
+
+        self.assertEqual('SELECT "a" FROM "abc" WHERE "id" GLOBAL IN (SELECT "id" FROM "efg")', str(q))
+
+    def test_global_not_in(self):
+        q = ClickHouseQuery.from_(self.table_abc).select("a").where(self.table_abc.id.notin([1, 2], global_=True))
+
+        self.assertEqual('SELECT "a" FROM "abc" WHERE "id" GLOBAL NOT IN (1,2)', str(q))
+
+    def test_global_is_ignored_by_other_dialects(self):
+        q = Query.from_(self.table_abc).select("a").where(self.table_abc.id.isin([1, 2]).global_())
+
+        self.assertEqual('SELECT "a" FROM "abc" WHERE "id" IN (1,2)', str(q))
+
+    def test_global_any_join(self):
+        q = (
+            ClickHouseQuery.from_(self.table_abc)
+            .global_any_join(self.table_efg)
+            .on(self.table_abc.id == self.table_efg.id)
+            .select(self.table_abc.a)
+        )
+
+        self.assertEqual('SELECT "abc"."a" FROM "abc" GLOBAL ANY JOIN "efg" ON "abc"."id"="efg"."id"', str(q))
+
+    def test_join_strictness(self):
+        for how, expected in (
+            (JoinType.any, "ANY JOIN"),
+            (JoinType.all, "ALL JOIN"),
+            (JoinType.left_any, "LEFT ANY JOIN"),
+            (JoinType.global_left, "GLOBAL LEFT JOIN"),
+        ):
+            with self.subTest(how):
+                q = ClickHouseQuery.from_(self.table_abc).join(self.table_efg, how=how).using("id").select("a")
+
+                self.assertEqual('SELECT "abc"."a" FROM "abc" {} "efg" USING ("id")'.format(expected), str(q))
+
+    def test_asof_join(self):
+        q = (
+            ClickHouseQuery.from_(self.table_abc)
+            .asof_join(self.table_efg)
+            .on((self.table_abc.id == self.table_efg.id) & (self.table_abc.ts >= self.table_efg.ts))
+            .select(self.table_abc.a, self.table_efg.b)
+        )
+
+        self.assertEqual(
+            'SELECT "abc"."a","efg"."b" FROM "abc" ASOF JOIN "efg" ON "abc"."id"="efg"."id" AND "abc"."ts">="efg"."ts"',
+            str(q),
+        )
+
+
+class ArrayJoinTests(TestCase):
+    table_abc, table_efg = Table("abc"), Table("efg")
+
+    def test_array_join(self):
+        q = ClickHouseQuery.from_(self.table_abc).select("id", "tag").array_join(self.table_abc.tags.as_("tag"))
+
+        self.assertEqual('SELECT "id","tag" FROM "abc" ARRAY JOIN "tags" AS "tag"', str(q))
+
+    def test_left_array_join_multiple_arrays(self):
+        q = ClickHouseQuery.from_(self.table_abc).select("*").left_array_join("keys", "values")
+
+        self.assertEqual('SELECT * FROM "abc" LEFT ARRAY JOIN "keys","values"', str(q))
+
+    def test_array_join_before_joins(self):
+        q = (
+            ClickHouseQuery.from_(self.table_abc)
+            .join(self.table_efg)
+            .on(self.table_abc.id == self.table_efg.id)
+            .array_join(self.table_abc.tags)
+            .select(self.table_abc.id)
+        )
+
+        self.assertEqual(
+            'SELECT "abc"."id" FROM "abc" ARRAY JOIN "abc"."tags" JOIN "efg" ON "abc"."id"="efg"."id"', str(q)
+        )
+
+    def test_array_join_twice_raises_exception(self):
+        with self.assertRaises(AttributeError):
+            ClickHouseQuery.from_(self.table_abc).array_join("a").left_array_join("b")
+
+    def test_replace_table(self):
+        q = ClickHouseQuery.from_(self.table_abc).select("id").array_join(self.table_abc.tags)
+
+        self.assertEqual(
+            'SELECT "id" FROM "efg" ARRAY JOIN "tags"', str(q.replace_table(self.table_abc, self.table_efg))
+        )
+
+
+class CreateTableTests(TestCase):
+    table_hits = Table("hits")
+
+    def test_merge_tree(self):
+        q = (
+            ClickHouseQuery.create_table(self.table_hits)
+            .columns(("id", "UInt64"), ("ts", "DateTime"))
+            .engine(MergeTree())
+            .partition_by(Function("toYYYYMM", Field("ts")))
+            .order_by("id", "ts")
+            .primary_key("id")
+            .sample_by("id")
+            .settings(index_granularity=8192)
+        )
+
+        self.assertEqual(
+            'CREATE TABLE "hits" ("id" UInt64,"ts" DateTime) ENGINE = MergeTree() ORDER BY ("id","ts") '
+            'PARTITION BY toYYYYMM("ts") PRIMARY KEY "id" SAMPLE BY "id" SETTINGS index_granularity=8192',
+            str(q),
+        )
+
+    def test_replicated_engine_on_cluster(self):
+        q = (
+            ClickHouseQuery.create_table(self.table_hits)
+            .on_cluster("main")
+            .columns(("id", "UInt64"), ("ver", "UInt32"))
+            .engine(ReplacingMergeTree("ver").replicated("/clickhouse/{shard}/hits"))
+            .order_by("id")
+        )
+
+        self.assertEqual(
+            'CREATE TABLE "hits" ON CLUSTER "main" ("id" UInt64,"ver" UInt32) '
+            "ENGINE = ReplicatedReplacingMergeTree('/clickhouse/{shard}/hits','{replica}',\"ver\") ORDER BY \"id\"",
+            str(q),
+        )
+
+    def test_ttl(self):
+        q = (
+            ClickHouseQuery.create_table(self.table_hits)
+            .columns(("ts", "DateTime"))
+            .engine("MergeTree")
+            .order_by("ts")
+            .ttl(self.table_hits.ts + Interval(weeks=1), "TO VOLUME 'cold'")
+            .ttl(self.table_hits.ts + Interval(months=1))
+        )
+
+        self.assertEqual(
+            'CREATE TABLE "hits" ("ts" DateTime) ENGINE = MergeTree() ORDER BY "ts" '
+            "TTL \"ts\"+INTERVAL '1 WEEK' TO VOLUME 'cold',\"ts\"+INTERVAL '1 MONTH'",
+            str(q),
+        )
+
+    def test_skip_indexes_and_projections(self):
+        q = (
+            ClickHouseQuery.create_table(self.table_hits)
+            .columns(("id", "UInt64"), ("url", "String"))
+            .index("idx_url", "url", "bloom_filter(0.01)", 4)
+            .index("idx_id", "id", "minmax")
+            .projection("by_url", ClickHouseQuery.select(Field("url"), Field("id")).orderby(Field("url")))
+            .engine(MergeTree())
+            .order_by("id")
+        )
+
+        self.assertEqual(
+            'CREATE TABLE "hits" ("id" UInt64,"url" String,'
+            'INDEX "idx_url" "url" TYPE bloom_filter(0.01) GRANULARITY 4,'
+            'INDEX "idx_id" "id" TYPE minmax GRANULARITY 1,'
+            'PROJECTION "by_url" (SELECT "url","id" ORDER BY "url")) ENGINE = MergeTree() ORDER BY "id"',
+            str(q),
+        )
+
+    def test_distributed_as_table(self):
+        q = (
+            ClickHouseQuery.create_table("hits_all")
+            .on_cluster("main")
+            .as_table("hits")
+            .engine(Distributed("main", "default", "hits", Function("rand")))
+        )
+
+        self.assertEqual(
+            'CREATE TABLE "hits_all" ON CLUSTER "main" AS "hits" '
+            "ENGINE = Distributed('main','default','hits',rand())",
+            str(q),
+        )
+
+    def test_columns_and_as_table_raise_exception(self):
+        with self.assertRaises(QueryException):
+            ClickHouseQuery.create_table("hits_all").as_table("hits").columns("a")
+
+        with self.assertRaises(QueryException):
+            ClickHouseQuery.create_table("hits_all").columns("a").as_table("hits")
+
+    def test_unsupported_constraints_raise_exception(self):
+        q = ClickHouseQuery.create_table(self.table_hits).columns(Column("id", "UInt64"), Column("ref", "UInt64"))
+
+        for name, constrained in (("unique", q.unique("id")), ("foreign_key", q.foreign_key(["ref"], "refs", ["id"]))):
+            with self.subTest(name):
+                with self.assertRaises(DialectNotSupported):
+                    str(constrained.engine(MergeTree()))
+
+    def test_buffer(self):
+        q = ClickHouseQuery.create_table("hits_buffer").as_table("hits").engine(Buffer("default", "hits"))
+
+        self.assertEqual(
+            'CREATE TABLE "hits_buffer" AS "hits" '
+            "ENGINE = Buffer('default','hits',16,10,100,10000,1000000,10000000,100000000)",
+            str(q),
+        )
+
+    def test_as_select(self):
+        q = (
+            ClickHouseQuery.create_table("top_hits")
+            .engine(SummingMergeTree("hits"))
+            .order_by("url")
+            .as_select(ClickHouseQuery.from_(self.table_hits).select("url", "hits"))
+        )
+
+        self.assertEqual(
+            'CREATE TABLE "top_hits" ENGINE = SummingMergeTree(("hits")) ORDER BY "url" '
+            'AS SELECT "url","hits" FROM "hits"',
+            str(q),
+        )
+
+    def test_engine_twice_raises_exception(self):
+        with self.assertRaises(AttributeError):
+            ClickHouseQuery.create_table(self.table_hits).engine(MergeTree()).engine(MergeTree())
+
+
+class DictionaryTests(TestCase):
+    table_events, table_users, table_orgs = Table("events"), Table("users"), Table("orgs")
+
+    def test_create_dictionary(self):
+        q = (
+            ClickHouseQuery.create_dictionary("users_dict")
+            .if_not_exists()
+            .on_cluster("main")
+            .columns(("id", "UInt64"), Column("name", "String", default=""))
+            .primary_key("id")
+            .source("clickhouse", table="users", db="default")
+            .layout("hashed")
+            .lifetime(300, 360)
+        )
+
+        self.assertEqual(
+            'CREATE DICTIONARY IF NOT EXISTS "users_dict" ON CLUSTER "main" ("id" UInt64,"name" String DEFAULT \'\') '
+            "PRIMARY KEY \"id\" SOURCE(CLICKHOUSE(TABLE 'users' DB 'default')) LAYOUT(HASHED()) "
+            "LIFETIME(MIN 300 MAX 360)",
+            str(q),
+        )
+
+    def test_create_range_dictionary(self):
+        q = (
+            ClickHouseQuery.create_dictionary("prices")
+            .columns(("id", "UInt64"), ("start", "Date"), ("end", "Date"), ("price", "Float64"))
+            .primary_key("id")
+            .source("clickhouse", table="prices")
+            .layout("range_hashed")
+            .lifetime(600)
+            .range("start", "end")
+        )
+
+        self.assertEqual(
+            'CREATE DICTIONARY "prices" ("id" UInt64,"start" Date,"end" Date,"price" Float64) PRIMARY KEY "id" '
+            "SOURCE(CLICKHOUSE(TABLE 'prices')) LAYOUT(RANGE_HASHED()) LIFETIME(600) RANGE(MIN \"start\" MAX \"end\")",
+            str(q),
+        )
+
+    def test_create_dictionary_validation(self):
+        base = ClickHouseQuery.create_dictionary("d").columns(("id", "UInt64")).primary_key("id")
+
+        for q in (
+            base.layout("flat"),
+            base.source("clickhouse", table="t"),
+            base.source("clickhouse", table="t").layout("range_hashed"),
+            ClickHouseQuery.create_dictionary("d").columns(("id", "UInt64")).source("null").layout("flat"),
+        ):
+            with self.subTest(q=q), self.assertRaises(QueryException):
+                q.get_sql()
+
+    def test_use_dictionary(self):
+        q = (
+            ClickHouseQuery.from_(self.table_events)
+            .left_join(self.table_users)
+            .on(self.table_events.user_id == self.table_users.id)
+            .select(self.table_events.id, self.table_users.name, self.table_users.email.as_("mail"))
+            .where(self.table_users.active == 1)
+        )
+
+        self.assertEqual(
+            'SELECT "id",dictGet(\'users_dict\',\'name\',"user_id") AS "name",'
+            'dictGet(\'users_dict\',\'email\',"user_id") AS "mail" FROM "events" '
+            'WHERE dictGet(\'users_dict\',\'active\',"user_id")=1',
+            str(q.use_dictionary(self.table_users, "users_dict")),
+        )
+        self.assertIn("LEFT JOIN", str(q))
+
+    def test_use_dictionary_keeps_other_joins(self):
+        q = (
+            ClickHouseQuery.from_(self.table_events)
+            .left_join(self.table_users)
+            .using("user_id")
+            .join(self.table_orgs)
+            .on(self.table_orgs.id == self.table_users.org_id)
+            .select(self.table_orgs.name)
+            .use_dictionary(self.table_users, "users_dict")
+        )
+
+        self.assertEqual(
+            'SELECT "orgs"."name" FROM "events" JOIN "orgs" '
+            'ON "orgs"."id"=dictGet(\'users_dict\',\'org_id\',"events"."user_id")',
+            str(q),
+        )
+
+    def test_use_dictionary_composite_key(self):
+        rates = Table("rates")
+        q = (
+            ClickHouseQuery.from_(self.table_events)
+            .left_join(rates)
+            .on((rates.currency == self.table_events.currency) & (rates.day == self.table_events.day))
+            .select(rates.rate)
+            .use_dictionary(rates, "rates_dict")
+        )
+
+        self.assertEqual(
+            'SELECT dictGet(\'rates_dict\',\'rate\',("currency","day")) AS "rate" FROM "events"',
+            str(q),
+        )
+
+    def test_use_dictionary_unsupported_joins(self):
+        inner = (
+            ClickHouseQuery.from_(self.table_events)
+            .join(self.table_users)
+            .on(self.table_events.user_id == self.table_users.id)
+            .select(self.table_users.name)
+        )
+        non_equi = (
+            ClickHouseQuery.from_(self.table_events)
+            .left_join(self.table_users)
+            .on(self.table_events.user_id > self.table_users.id)
+            .select(self.table_users.name)
+        )
+        key_selected = (
+            ClickHouseQuery.from_(self.table_events)
+            .left_join(self.table_users)
+            .on(self.table_events.user_id == self.table_users.id)
+            .select(self.table_users.id)
+        )
+
+        for q in (inner, non_equi, key_selected):
+            with self.subTest(q=q), self.assertRaises(QueryException):
+                q.use_dictionary(self.table_users, "users_dict")
+
+        with self.assertRaises(QueryException):
+            inner.use_dictionary(self.table_orgs, "orgs_dict")
+
+
+class ParameterizedQueryTests(TestCase):
+    table_hits = Table("hits")
+
+    def test_get_parameterized_sql(self):
+        sub = ClickHouseQuery.from_("users").select("id").where(Field("org") == ClickHouseParameter("org", "String"))
+        q = (
+            ClickHouseQuery.from_(self.table_hits)
+            .select("url")
+            .where(self.table_hits.counter_id == ClickHouseParameter("counter", ToUInt64))
+            .where(Lower(self.table_hits.url) == ClickHouseParameter("url", "String", "x"))
+            .where(self.table_hits.user_id.isin(sub))
+            .where(self.table_hits.is_robot == 0)
+        )
+
+        sql, params = q.get_parameterized_sql(counter=34, org="acme")
+
+        self.assertEqual(
+            'SELECT "url" FROM "hits" WHERE "counter_id"={counter:UInt64} AND LOWER("url")={url:String} '
+            'AND "user_id" IN (SELECT "id" FROM "users" WHERE "org"={org:String}) AND "is_robot"=0',
+            sql,
+        )
+        self.assertEqual({"param_counter": "34", "param_url": "x", "param_org": "acme"}, params)
+
+    def test_str_renders_placeholders(self):
+        q = (
+            ClickHouseQuery.from_(self.table_hits)
+            .select("url")
+            .where(Field("id") == ClickHouseParameter("id", "UInt64"))
+        )
+
+        self.assertEqual('SELECT "url" FROM "hits" WHERE "id"={id:UInt64}', str(q))
+
+    def test_missing_value_raises_exception(self):
+        q = (
+            ClickHouseQuery.from_(self.table_hits)
+            .select("url")
+            .where(Field("id") == ClickHouseParameter("id", "UInt64"))
+        )
+
+        with self.assertRaises(QueryException):
+            q.get_parameterized_sql()
+
+
+class ExplainTests(TestCase):
+    table_abc = Table("abc")
+
+    def test_explain(self):
+        q = ClickHouseQuery.from_(self.table_abc).select("a")
+
+        self.assertEqual('EXPLAIN PIPELINE SELECT "a" FROM "abc"', str(q.explain()))
+        self.assertEqual('EXPLAIN PLAN SELECT "a" FROM "abc"', str(q.explain(format="plan")))
+        self.assertEqual('EXPLAIN PLAN json = 1 SELECT "a" FROM "abc"', str(q.explain(format="json")))
+
+    def test_explain_analyze_not_supported(self):
+        with self.assertRaises(DialectNotSupported):
+            ClickHouseQuery.from_(self.table_abc).select("a").explain(analyze=True)
+
+
+class EstimateTests(TestCase):
+    table_abc = Table("abc")
+
+    def test_estimate_count(self):
+        self.assertEqual(
+            'SELECT SUM("rows") AS "estimate" FROM "system"."parts" '
+            "WHERE \"active\"=1 AND \"database\"=currentDatabase() AND \"table\"='abc'",
+            str(ClickHouseQuery.estimate_count(self.table_abc)),
+        )
+
+    def test_estimate_count_with_database(self):
+        self.assertEqual(
+            'SELECT SUM("rows") AS "estimate" FROM "system"."parts" '
+            "WHERE \"active\"=1 AND \"database\"='analytics' AND \"table\"='abc'",
+            str(ClickHouseQuery.estimate_count(Table("abc", schema="analytics"))),
+        )
+
+    def test_estimate(self):
+        q = ClickHouseQuery.from_(self.table_abc).select("a").where(self.table_abc.b == 1)
+
+        self.assertEqual('EXPLAIN ESTIMATE SELECT "a" FROM "abc" WHERE "b"=1', str(q.estimate()))
+
+    def test_estimated_rows(self):
+        explain = ClickHouseQuery.from_(self.table_abc).select("a").estimate()
+
+        self.assertEqual(
+            24576, explain.estimated_rows([("default", "abc", 2, 16384, 2), ("default", "abc_local", 1, 8192, 1)])
+        )
+        self.assertEqual(8192, explain.estimated_rows([{"database": "default", "table": "abc", "rows": "8192"}]))
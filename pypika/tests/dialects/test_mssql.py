@@ -1,6 +1,6 @@
 import unittest
 
-from pypika import Table
+from pypika import AliasedQuery, Table
 from pypika.analytics import Count
 from pypika.dialects import MSSQLQuery
 from pypika.utils import QueryException
@@ -12,6 +12,11 @@ class SelectTests(unittest.TestCase):
 
         self.assertEqual('SELECT "def" FROM "abc"', str(q))
 
+    def test_modulo(self):
+        q = MSSQLQuery.from_("abc").select(Table("abc").foo % 3 * 2)
+
+        self.assertEqual('SELECT ("foo"%3)*2 FROM "abc"', str(q))
+
     def test_distinct_select(self):
         q = MSSQLQuery.from_("abc").select("def").distinct()
 
@@ -79,3 +84,178 @@ class SelectTests(unittest.TestCase):
         self.assertEqual(
             'SELECT "sq0"."abc" "a",COUNT(\'*\') FROM (SELECT "abc" FROM "table1") "sq0" GROUP BY "sq0"."abc"', str(q)
         )
+
+
+class UpdateFromValuesTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_update_from_values(self):
+        q = MSSQLQuery.update(self.table_abc).set_from_values(["id"], ["name"], [(1, "a")])
+
+        self.assertEqual(
+            'UPDATE "abc" SET "name"="v"."name" FROM (VALUES (1,\'a\')) AS "v"("id","name") WHERE "abc"."id"="v"."id"',
+            str(q),
+        )
+
+    def test_chunked_by_table_value_constructor_limit(self):
+        queries = MSSQLQuery.update_from_values(self.table_abc, ["id"], ["n"], [(i, i) for i in range(2001)])
+
+        self.assertEqual(3, len(queries))
+
+
+class MergeTests(unittest.TestCase):
+    users = Table("users")
+
+    def test_merge_values(self):
+        q = (
+            MSSQLQuery.merge_into(self.users)
+            .using_values([(1, "a"), (2, "b")], ["id", "name"])
+            .on_field("id")
+            .when_matched()
+            .update()
+            .when_not_matched()
+            .insert()
+        )
+
+        self.assertEqual(
+            'MERGE INTO "users" USING (VALUES (1,\'a\'),(2,\'b\')) AS "s"("id","name") ON "users"."id"="s"."id" '
+            'WHEN MATCHED THEN UPDATE SET "name"="s"."name" '
+            'WHEN NOT MATCHED THEN INSERT ("id","name") VALUES ("s"."id","s"."name");',
+            str(q),
+        )
+
+    def test_not_matched_by_source(self):
+        staging = Table("staging")
+        q = (
+            MSSQLQuery.merge_into(self.users)
+            .using(staging)
+            .on_field("id")
+            .when_not_matched_by_source(self.users.active == 1)
+            .delete()
+        )
+
+        self.assertEqual(
+            'MERGE INTO "users" USING "staging" ON "users"."id"="staging"."id" '
+            'WHEN NOT MATCHED BY SOURCE AND "users"."active"=1 THEN DELETE;',
+            str(q),
+        )
+
+
+class HintTests(unittest.TestCase):
+    table_abc, table_efg = Table("abc"), Table("efg")
+
+    def test_query_hints(self):
+        q = (
+            MSSQLQuery.from_(self.table_abc)
+            .select("def")
+            .orderby("def")
+            .limit(10)
+            .option("RECOMPILE", "MAXDOP 4", "OPTIMIZE FOR UNKNOWN", "HASH JOIN")
+        )
+
+        self.assertEqual(
+            'SELECT "def" FROM "abc" ORDER BY "def" OFFSET 0 ROWS FETCH NEXT 10 ROWS ONLY '
+            "OPTION (RECOMPILE,MAXDOP 4,OPTIMIZE FOR UNKNOWN,HASH JOIN)",
+            str(q),
+        )
+
+    def test_invalid_query_hint(self):
+        with self.assertRaises(QueryException):
+            MSSQLQuery.from_(self.table_abc).select("def").option("MAXDOP four")
+
+    def test_query_hints_in_subquery(self):
+        subquery = MSSQLQuery.from_(self.table_abc).select("def").option("RECOMPILE")
+        q = MSSQLQuery.from_(subquery).select("def")
+
+        with self.assertRaises(QueryException):
+            str(q)
+
+    def test_query_hints_in_cte(self):
+        cte = MSSQLQuery.from_(self.table_abc).select("def").option("RECOMPILE")
+        q = MSSQLQuery.with_(cte, "cte").from_(AliasedQuery("cte")).select("def")
+
+        with self.assertRaises(QueryException):
+            str(q)
+
+    def test_query_hints_in_set_operation(self):
+        q = (
+            MSSQLQuery.from_(self.table_abc)
+            .select("def")
+            .option("RECOMPILE")
+            .union(MSSQLQuery.from_(self.table_efg).select("def"))
+        )
+
+        with self.assertRaises(QueryException):
+            str(q)
+
+    def test_table_hints(self):
+        efg = self.table_efg.as_("e")
+        q = (
+            MSSQLQuery.from_(self.table_abc)
+            .join(efg)
+            .on(self.table_abc.id == efg.id)
+            .select(self.table_abc.foo)
+            .table_hint(self.table_abc, "NOLOCK", "INDEX(ix_abc)")
+            .table_hint(efg, "FORCESEEK")
+        )
+
+        self.assertEqual(
+            'SELECT "abc"."foo" FROM "abc" WITH (NOLOCK,INDEX(ix_abc)) '
+            'JOIN "efg" "e" WITH (FORCESEEK) ON "abc"."id"="e"."id"',
+            str(q),
+        )
+
+    def test_table_hints_on_update_target(self):
+        q = (
+            MSSQLQuery.update(self.table_abc)
+            .set(self.table_abc.foo, 1)
+            .where(self.table_abc.bar == 2)
+            .table_hint(self.table_abc, "ROWLOCK")
+            .option("MAXDOP 1")
+        )
+
+        self.assertEqual('UPDATE "abc" WITH (ROWLOCK) SET "foo"=1 WHERE "bar"=2 OPTION (MAXDOP 1)', str(q))
+
+    def test_table_hints_on_delete_target(self):
+        q = (
+            MSSQLQuery.from_(self.table_abc)
+            .delete()
+            .where(self.table_abc.bar == 2)
+            .table_hint(self.table_abc, "READPAST")
+        )
+
+        self.assertEqual('DELETE FROM "abc" WITH (READPAST) WHERE "bar"=2', str(q))
+
+    def test_nolock_on_update_target(self):
+        with self.assertRaises(QueryException):
+            MSSQLQuery.update(self.table_abc).set(self.table_abc.foo, 1).table_hint(self.table_abc, "NOLOCK")
+
+    def test_table_hint_requires_query_table(self):
+        with self.assertRaises(QueryException):
+            MSSQLQuery.from_(self.table_abc).select("foo").table_hint(self.table_efg, "NOLOCK")
+
+    def test_invalid_table_hint(self):
+        with self.assertRaises(QueryException):
+            MSSQLQuery.from_(self.table_abc).select("foo").table_hint(self.table_abc, "NOLOCK) DROP TABLE abc --")
+
+    def test_hints_are_immutable(self):
+        q = MSSQLQuery.from_(self.table_abc).select("foo")
+        q.table_hint(self.table_abc, "NOLOCK").option("RECOMPILE")
+
+        self.assertEqual('SELECT "foo" FROM "abc"', str(q))
+
+
+class EstimateTests(unittest.TestCase):
+    def test_estimate_count(self):
+        self.assertEqual(
+            'SELECT SUM("row_count") "estimate" FROM "sys"."dm_db_partition_stats" '
+            "WHERE \"object_id\"=OBJECT_ID('[dbo].[abc]') AND \"index_id\" IN (0,1)",
+            str(MSSQLQuery.estimate_count(Table("abc", schema="dbo"))),
+        )
+
+    def test_estimate_count_escapes_brackets(self):
+        self.assertEqual(
+            'SELECT SUM("row_count") "estimate" FROM "sys"."dm_db_partition_stats" '
+            "WHERE \"object_id\"=OBJECT_ID('[a]]b]') AND \"index_id\" IN (0,1)",
+            str(MSSQLQuery.estimate_count("a]b")),
+        )
@@ -1,6 +1,6 @@
 import unittest
 
-from pypika import Column, MySQLQuery, QueryException, Table
+from pypika import Column, DialectNotSupported, Hint, MySQLQuery, QueryException, Table
 
 
 class SelectTests(unittest.TestCase):
@@ -89,3 +89,173 @@ class TableTests(unittest.TestCase):
             'DROP TABLE `abc`',
             str(q),
         )
+
+
+class ExportTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_select_into_outfile(self):
+        q = MySQLQuery.from_(self.table_abc).select("foo").export_to("/tmp/abc.tsv")
+
+        self.assertEqual("SELECT `foo` FROM `abc` INTO OUTFILE '/tmp/abc.tsv'", str(q))
+
+    def test_select_into_outfile_csv(self):
+        q = MySQLQuery.from_(self.table_abc).select("foo").export_to("/tmp/abc.csv", format="csv")
+
+        self.assertEqual(
+            "SELECT `foo` FROM `abc` INTO OUTFILE '/tmp/abc.csv' "
+            "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' LINES TERMINATED BY '\\n'",
+            str(q),
+        )
+
+    def test_select_into_outfile_with_options(self):
+        q = MySQLQuery.from_(self.table_abc).select("foo").export_to("/tmp/abc.txt", fields_terminated_by="|")
+
+        self.assertEqual("SELECT `foo` FROM `abc` INTO OUTFILE '/tmp/abc.txt' FIELDS TERMINATED BY '|'", str(q))
+
+    def test_unknown_option_raises_exception(self):
+        with self.assertRaises(QueryException):
+            MySQLQuery.from_(self.table_abc).select("foo").export_to("/tmp/abc.txt", header=True)
+
+
+class UpdateFromValuesTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_update_joins_union_of_rows(self):
+        queries = MySQLQuery.update_from_values(self.table_abc, ["id"], ["name"], [(1, "a"), (2, "b")])
+
+        self.assertEqual(
+            [
+                "UPDATE `abc` JOIN (SELECT 1 AS `id`,'a' AS `name` UNION ALL SELECT 2,'b') `v` "
+                "ON `abc`.`id`=`v`.`id` SET `abc`.`name`=`v`.`name`"
+            ],
+            [str(q) for q in queries],
+        )
+
+
+class MergeTests(unittest.TestCase):
+    def test_merge_not_supported(self):
+        with self.assertRaises(DialectNotSupported):
+            MySQLQuery.merge_into(Table("users"))
+
+
+class HintTests(unittest.TestCase):
+    table_abc, table_efg = Table("abc"), Table("efg")
+
+    def test_optimizer_hints(self):
+        q = (
+            MySQLQuery.from_(self.table_abc)
+            .join(self.table_efg)
+            .on(self.table_abc.id == self.table_efg.id)
+            .select(self.table_abc.foo)
+            .distinct()
+            .hint(Hint("BKA", self.table_abc, self.table_efg), Hint("MAX_EXECUTION_TIME", 1000))
+        )
+
+        self.assertEqual(
+            "SELECT /*+ BKA(`abc`, `efg`) MAX_EXECUTION_TIME(1000) */ DISTINCT `abc`.`foo` "
+            "FROM `abc` JOIN `efg` ON `abc`.`id`=`efg`.`id`",
+            str(q),
+        )
+
+    def test_index_hint(self):
+        q = MySQLQuery.from_(self.table_abc).select("foo").hint(Hint("INDEX", self.table_abc, "ix_a", "ix_b"))
+
+        self.assertEqual("SELECT /*+ INDEX(`abc` ix_a, ix_b) */ `foo` FROM `abc`", str(q))
+
+    def test_single_table_hint(self):
+        q = MySQLQuery.from_(self.table_abc).select("foo").hint(Hint("NO_ICP", self.table_abc))
+
+        self.assertEqual("SELECT /*+ NO_ICP(`abc`) */ `foo` FROM `abc`", str(q))
+
+    def test_hint_without_arguments(self):
+        q = MySQLQuery.update(self.table_abc).set("foo", 1).hint(Hint("NO_ICP"))
+
+        self.assertEqual("UPDATE /*+ NO_ICP() */ `abc` SET `foo`=1", str(q))
+
+
+class TimeoutTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_timeout_hint(self):
+        q = MySQLQuery.from_(self.table_abc).select("foo").hint(Hint("NO_ICP", self.table_abc)).timeout(500)
+
+        self.assertEqual("SELECT /*+ NO_ICP(`abc`) MAX_EXECUTION_TIME(500) */ `foo` FROM `abc`", str(q))
+        self.assertEqual(["SELECT /*+ NO_ICP(`abc`) MAX_EXECUTION_TIME(500) */ `foo` FROM `abc`"], q.get_statements())
+
+    def test_timeout_replaces_previous_timeout(self):
+        q = MySQLQuery.from_(self.table_abc).select("foo").timeout(500).timeout(200)
+
+        self.assertEqual("SELECT /*+ MAX_EXECUTION_TIME(200) */ `foo` FROM `abc`", str(q))
+
+    def test_timeout_only_for_select(self):
+        with self.assertRaises(QueryException):
+            str(MySQLQuery.update(self.table_abc).set("foo", 1).timeout(500))
+
+        with self.assertRaises(QueryException):
+            str(MySQLQuery.from_(self.table_abc).delete().timeout(500))
+
+
+class ExplainTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_explain(self):
+        q = MySQLQuery.from_(self.table_abc).select("foo")
+
+        self.assertEqual("EXPLAIN FORMAT=TREE SELECT `foo` FROM `abc`", str(q.explain()))
+        self.assertEqual("EXPLAIN FORMAT=JSON SELECT `foo` FROM `abc`", str(q.explain(format="json")))
+        self.assertEqual("EXPLAIN FORMAT=TREE SELECT `foo` FROM `abc`", str(q.explain(format="text")))
+
+    def test_explain_analyze(self):
+        q = MySQLQuery.from_(self.table_abc).select("foo")
+
+        self.assertEqual("EXPLAIN ANALYZE SELECT `foo` FROM `abc`", str(q.explain(analyze=True)))
+
+        with self.assertRaises(QueryException):
+            str(q.explain(analyze=True, format="json"))
+
+    def test_explain_buffers_not_supported(self):
+        with self.assertRaises(DialectNotSupported):
+            MySQLQuery.from_(self.table_abc).select("foo").explain(buffers=True)
+
+
+class EstimateTests(unittest.TestCase):
+    table_abc = Table("abc")
+    plan = (
+        '{"query_block": {"select_id": 1, "nested_loop": ['
+        '{"table": {"table_name": "abc", "access_type": "ALL", "rows_examined_per_scan": 1000, '
+        '"rows_produced_per_join": 100}}, '
+        '{"table": {"table_name": "efg", "access_type": "ref", "rows_examined_per_scan": 2, '
+        '"rows_produced_per_join": 200}}]}}'
+    )
+
+    def test_estimate_count(self):
+        self.assertEqual(
+            "SELECT `TABLE_ROWS` `estimate` FROM `information_schema`.`TABLES` "
+            "WHERE `TABLE_SCHEMA`=DATABASE() AND `TABLE_NAME`='abc'",
+            str(MySQLQuery.estimate_count(self.table_abc)),
+        )
+
+    def test_estimate_count_with_schema(self):
+        self.assertEqual(
+            "SELECT `TABLE_ROWS` `estimate` FROM `information_schema`.`TABLES` "
+            "WHERE `TABLE_SCHEMA`='shop' AND `TABLE_NAME`='abc'",
+            str(MySQLQuery.estimate_count(Table("abc", schema="shop"))),
+        )
+
+    def test_estimate(self):
+        q = MySQLQuery.from_(self.table_abc).select("foo").where(self.table_abc.bar == 1)
+
+        self.assertEqual("EXPLAIN FORMAT=JSON SELECT `foo` FROM `abc` WHERE `bar`=1", str(q.estimate()))
+
+    def test_estimated_rows_of_last_join(self):
+        explain = MySQLQuery.from_(self.table_abc).select("foo").estimate()
+
+        self.assertEqual(200, explain.estimated_rows(self.plan))
+        self.assertEqual(200, explain.estimated_rows([(self.plan,)]))
+
+    def test_estimated_rows_missing(self):
+        explain = MySQLQuery.from_(self.table_abc).select("foo").estimate()
+
+        with self.assertRaises(QueryException):
+            explain.estimated_rows('{"query_block": {"select_id": 1, "message": "No tables used"}}')
@@ -1,6 +1,6 @@
 import unittest
 
-from pypika import OracleQuery, Table
+from pypika import DialectNotSupported, Hint, OracleQuery, QueryLabel, Table
 from pypika.analytics import Count
 
 
@@ -49,3 +49,150 @@ class SelectTests(unittest.TestCase):
             q = OracleQuery.from_(t).select(t.test).fetch_next(limit)
 
             self.assertEqual(f'SELECT test FROM table1 FETCH NEXT {limit} ROWS ONLY', str(q))
+
+
+class UpdateFromValuesTests(unittest.TestCase):
+    def test_not_supported(self):
+        with self.assertRaises(DialectNotSupported):
+            OracleQuery.update_from_values("abc", ["id"], ["name"], [(1, "a")])
+
+
+class MergeTests(unittest.TestCase):
+    users = Table("users")
+
+    def test_merge_values(self):
+        q = (
+            OracleQuery.merge_into(self.users)
+            .using_values([(1, "a"), (2, "b")], ["id", "name"])
+            .on_field("id")
+            .when_matched()
+            .update()
+            .when_not_matched()
+            .insert()
+        )
+
+        self.assertEqual(
+            "MERGE INTO users USING (SELECT 1 id,'a' name FROM DUAL UNION ALL SELECT 2,'b' FROM DUAL) s "
+            "ON (users.id=s.id) "
+            "WHEN MATCHED THEN UPDATE SET name=s.name "
+            "WHEN NOT MATCHED THEN INSERT (id,name) VALUES (s.id,s.name)",
+            str(q),
+        )
+
+    def test_conditions_as_where_clauses(self):
+        s = Table("staging").as_("s")
+        q = (
+            OracleQuery.merge_into(self.users)
+            .using(s)
+            .on_field("id")
+            .when_matched(s.deleted == 1)
+            .delete()
+            .when_matched(s.version > self.users.version)
+            .update(["name"])
+            .when_not_matched(s.deleted == 0)
+            .insert(["id", "name"])
+        )
+
+        self.assertEqual(
+            "MERGE INTO users USING staging s ON (users.id=s.id) "
+            "WHEN MATCHED THEN UPDATE SET name=s.name WHERE s.version>users.version DELETE WHERE s.deleted=1 "
+            "WHEN NOT MATCHED THEN INSERT (id,name) VALUES (s.id,s.name) WHERE s.deleted=0",
+            str(q),
+        )
+
+    def test_single_branch_per_action(self):
+        staging = Table("staging")
+        q = (
+            OracleQuery.merge_into(self.users)
+            .using(staging)
+            .on_field("id")
+            .when_matched(staging.id > 1)
+            .update(["name"])
+            .when_matched()
+            .update(["email"])
+        )
+
+        with self.assertRaises(DialectNotSupported):
+            str(q)
+
+    def test_delete_requires_update(self):
+        staging = Table("staging")
+        q = OracleQuery.merge_into(self.users).using(staging).on_field("id").when_matched(staging.id > 1).delete()
+
+        with self.assertRaises(DialectNotSupported):
+            str(q)
+
+
+class HintTests(unittest.TestCase):
+    orders, customers = Table("orders").as_("o"), Table("customers")
+
+    def test_select_hints(self):
+        q = (
+            OracleQuery.from_(self.orders)
+            .join(self.customers)
+            .on(self.orders.customer_id == self.customers.id)
+            .select(self.orders.id)
+            .hint(
+                Hint("PARALLEL", self.orders, 8),
+                Hint("INDEX", self.orders, "ix_orders_date"),
+                Hint("LEADING", self.orders, self.customers),
+            )
+        )
+
+        self.assertEqual(
+            "SELECT /*+ PARALLEL(o 8) INDEX(o ix_orders_date) LEADING(o customers) */ o.id "
+            "FROM orders o JOIN customers ON o.customer_id=customers.id",
+            str(q),
+        )
+
+    def test_dml_hints(self):
+        table = Table("orders")
+
+        self.assertEqual(
+            "INSERT /*+ APPEND */ INTO orders VALUES (1)", str(OracleQuery.into(table).insert(1).hint(Hint("APPEND")))
+        )
+        self.assertEqual(
+            "UPDATE /*+ INDEX(orders ix_status) */ orders SET status=1",
+            str(OracleQuery.update(table).set(table.status, 1).hint(Hint("INDEX", table, "ix_status"))),
+        )
+        self.assertEqual(
+            "DELETE /*+ PARALLEL(orders 4) */ FROM orders",
+            str(OracleQuery.from_(table).delete().hint(Hint("PARALLEL", table, 4))),
+        )
+
+    def test_hints_in_subquery(self):
+        subquery = OracleQuery.from_(self.orders).select(self.orders.id).hint(Hint("FULL", self.orders)).as_("sq")
+        q = OracleQuery.from_(subquery).select(subquery.id).hint(Hint("NO_MERGE", subquery))
+
+        self.assertEqual(
+            "SELECT /*+ NO_MERGE(sq) */ sq.id FROM (SELECT /*+ FULL(o) */ o.id FROM orders o) sq",
+            str(q),
+        )
+
+    def test_labels_not_supported(self):
+        with self.assertRaises(DialectNotSupported):
+            OracleQuery.from_(self.orders).select("id").hint(QueryLabel("nightly"))
+
+
+class ExplainTests(unittest.TestCase):
+    def test_explain_plan(self):
+        q = OracleQuery.from_(Table("abc")).select("foo")
+
+        self.assertEqual("EXPLAIN PLAN FOR SELECT foo FROM abc", str(q.explain()))
+
+    def test_explain_format_not_supported(self):
+        with self.assertRaises(DialectNotSupported):
+            OracleQuery.from_(Table("abc")).select("foo").explain(format="text")
+
+
+class EstimateTests(unittest.TestCase):
+    def test_estimate_count(self):
+        self.assertEqual(
+            "SELECT NUM_ROWS estimate FROM USER_TABLES WHERE TABLE_NAME='ABC'", str(OracleQuery.estimate_count("ABC"))
+        )
+
+    def test_estimate_count_with_schema(self):
+        self.assertEqual(
+            "SELECT NUM_ROWS estimate FROM ALL_TABLES WHERE OWNER='SALES' AND TABLE_NAME='ABC'",
+            str(OracleQuery.estimate_count(Table("ABC", schema="SALES"))),
+        )
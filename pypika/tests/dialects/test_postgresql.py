@@ -1,3 +1,4 @@
+import json
 import unittest
 from collections import OrderedDict
 
@@ -5,6 +6,8 @@ from pypika import (
     JSON,
     Array,
     Field,
+    Hint,
+    NamedParameter,
     QueryException,
     Table,
 )
@@ -269,3 +272,204 @@ class ReturningClauseTests(unittest.TestCase):
             'RETURNING "xyz"."a"',
             str(q),
         )
+
+
+class ExportTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_copy_to_stdout(self):
+        q = PostgreSQLQuery.from_(self.table_abc).select("foo").export_to("STDOUT")
+
+        self.assertEqual('COPY (SELECT "foo" FROM "abc") TO STDOUT', str(q))
+
+    def test_copy_to_file_with_format_and_options(self):
+        q = (
+            PostgreSQLQuery.from_(self.table_abc)
+            .select("foo")
+            .where(self.table_abc.bar == "x")
+            .export_to("/tmp/abc.csv", format="CSV", header=True)
+        )
+
+        self.assertEqual(
+            'COPY (SELECT "foo" FROM "abc" WHERE "bar"=\'x\') TO \'/tmp/abc.csv\' WITH (FORMAT csv,HEADER true)', str(q)
+        )
+
+    def test_sql_options_are_passed_to_the_query(self):
+        q = PostgreSQLQuery.from_(self.table_abc).select("foo").where(self.table_abc.bar == "x").export_to("STDOUT")
+        parameter = NamedParameter("bar")
+
+        self.assertEqual(
+            "COPY (SELECT foo FROM abc WHERE bar=:bar) TO STDOUT", q.get_sql(quote_char=None, parameter=parameter)
+        )
+        self.assertEqual({"bar": "x"}, parameter.get_parameters())
+
+    def test_unsupported_format_raises_exception(self):
+        with self.assertRaises(QueryException):
+            PostgreSQLQuery.from_(self.table_abc).select("foo").export_to("STDOUT", format="parquet")
+
+    def test_export_non_select_query_raises_exception(self):
+        with self.assertRaises(QueryException):
+            PostgreSQLQuery.into(self.table_abc).insert(1).export_to("STDOUT")
+
+
+class UnnestTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_insert_unnest_rows(self):
+        q = PostgreSQLQuery.into(self.table_abc).insert_unnest(["id", "name"], [(1, "a"), (2, "b")], ["int", "text"])
+
+        self.assertEqual('INSERT INTO "abc" ("id","name") SELECT * FROM unnest(%s::int[],%s::text[])', str(q))
+        self.assertEqual([[1, 2], ["a", "b"]], q.unnest_parameters())
+
+    def test_insert_unnest_column_arrays(self):
+        q = PostgreSQLQuery.into(self.table_abc).insert_unnest(
+            ["id", "name"], {"name": ["a", "b"], "id": [1, 2]}, ["int", "text"], placeholder=lambda idx: f"${idx + 1}"
+        )
+
+        self.assertEqual('INSERT INTO "abc" ("id","name") SELECT * FROM unnest($1::int[],$2::text[])', str(q))
+        self.assertEqual([[1, 2], ["a", "b"]], q.unnest_parameters())
+
+    def test_insert_unnest_upsert(self):
+        q = (
+            PostgreSQLQuery.into(self.table_abc)
+            .insert_unnest(["id", "name"], [(1, "a")], ["int", "text"])
+            .on_conflict("id")
+            .do_update("name")
+        )
+
+        self.assertEqual(
+            'INSERT INTO "abc" ("id","name") SELECT * FROM unnest(%s::int[],%s::text[]) '
+            'ON CONFLICT ("id") DO UPDATE SET "name"=EXCLUDED."name"',
+            str(q),
+        )
+
+    def test_update_unnest(self):
+        q = (
+            PostgreSQLQuery.update(self.table_abc)
+            .update_unnest(["id", "name"], [(1, "a"), (2, "b")], ["int", "text"], keys=["id"])
+            .where(self.table_abc.active == True)  # noqa: E712
+        )
+
+        self.assertEqual(
+            'UPDATE "abc" SET "name"="v"."name" FROM unnest(%s::int[],%s::text[]) AS "v"("id","name") '
+            'WHERE "abc"."id"="v"."id" AND "abc"."active"=true',
+            str(q),
+        )
+        self.assertEqual([[1, 2], ["a", "b"]], q.unnest_parameters())
+
+    def test_invalid_data_raises_exception(self):
+        for build in (
+            lambda: PostgreSQLQuery.into(self.table_abc).insert_unnest(["id", "name"], [(1,)], ["int", "text"]),
+            lambda: PostgreSQLQuery.into(self.table_abc).insert_unnest(["id"], [(1,)], ["int", "text"]),
+            lambda: PostgreSQLQuery.into(self.table_abc).insert_unnest(["id"], {"other": [1]}, ["int"]),
+            lambda: PostgreSQLQuery.from_(self.table_abc).insert_unnest(["id"], [(1,)], ["int"]),
+            lambda: PostgreSQLQuery.update(self.table_abc).update_unnest(["id"], [(1,)], ["int"], keys=["id"]),
+        ):
+            with self.subTest(), self.assertRaises(QueryException):
+                build()
+
+
+class MergeTests(unittest.TestCase):
+    def test_merge_with_conditional_delete(self):
+        staging = Table("staging")
+        q = (
+            PostgreSQLQuery.merge_into(Table("users"))
+            .using(staging)
+            .on_field("id")
+            .when_matched(staging.deleted == True)  # noqa: E712
+            .delete()
+            .when_matched()
+            .update(["name"])
+            .when_not_matched()
+            .insert(["id", "name"])
+        )
+
+        self.assertEqual(
+            'MERGE INTO "users" USING "staging" ON "users"."id"="staging"."id" '
+            'WHEN MATCHED AND "staging"."deleted"=true THEN DELETE '
+            'WHEN MATCHED THEN UPDATE SET "name"="staging"."name" '
+            'WHEN NOT MATCHED THEN INSERT ("id","name") VALUES ("staging"."id","staging"."name")',
+            str(q),
+        )
+
+
+class HintTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_hints_precede_statement(self):
+        q = (
+            PostgreSQLQuery.from_(self.table_abc)
+            .select("foo")
+            .hint(Hint("IndexScan", self.table_abc, "ix_foo"), Hint("Parallel", self.table_abc, 4, "hard"))
+        )
+
+        self.assertEqual('/*+ IndexScan("abc" ix_foo) Parallel("abc" 4 hard) */ SELECT "foo" FROM "abc"', str(q))
+
+    def test_hints_with_returning(self):
+        q = PostgreSQLQuery.update(self.table_abc).set("foo", 1).returning("id").hint(Hint("SeqScan", self.table_abc))
+
+        self.assertEqual('/*+ SeqScan("abc") */ UPDATE "abc" SET "foo"=1 RETURNING "abc"."id"', str(q))
+
+    def test_hints_in_subquery(self):
+        subquery = PostgreSQLQuery.from_(self.table_abc).select("foo").hint(Hint("SeqScan", self.table_abc))
+
+        with self.assertRaises(QueryException):
+            str(PostgreSQLQuery.from_(subquery).select("foo"))
+
+
+class ExplainTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_explain(self):
+        q = PostgreSQLQuery.from_(self.table_abc).select("foo")
+
+        self.assertEqual('EXPLAIN SELECT "foo" FROM "abc"', str(q.explain()))
+
+    def test_explain_options(self):
+        q = PostgreSQLQuery.from_(self.table_abc).select("foo").where(self.table_abc.bar == 1)
+
+        self.assertEqual(
+            'EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) SELECT "foo" FROM "abc" WHERE "bar"=1',
+            str(q.explain(analyze=True, buffers=True, format="json")),
+        )
+        self.assertEqual('EXPLAIN (FORMAT TEXT) SELECT "foo" FROM "abc" WHERE "bar"=1', str(q.explain(format="TEXT")))
+
+    def test_explain_update(self):
+        q = PostgreSQLQuery.update(self.table_abc).set("foo", 1)
+
+        self.assertEqual('EXPLAIN (ANALYZE) UPDATE "abc" SET "foo"=1', str(q.explain(analyze=True)))
+
+    def test_unsupported_format(self):
+        with self.assertRaises(QueryException):
+            PostgreSQLQuery.from_(self.table_abc).select("foo").explain(format="tree")
+
+
+class EstimateTests(unittest.TestCase):
+    table_abc = Table("abc")
+    plan = '[{"Plan": {"Node Type": "Seq Scan", "Relation Name": "abc", "Plan Rows": 1250, "Plan Width": 4}}]'
+
+    def test_estimate_count(self):
+        self.assertEqual(
+            'SELECT CAST(GREATEST("reltuples",0) AS BIGINT) "estimate" FROM "pg_class" '
+            "WHERE \"oid\"=CAST('\"abc\"' AS REGCLASS)",
+            str(PostgreSQLQuery.estimate_count("abc")),
+        )
+
+    def test_estimate_count_with_schema(self):
+        self.assertEqual(
+            'SELECT CAST(GREATEST("reltuples",0) AS BIGINT) "estimate" FROM "pg_class" '
+            "WHERE \"oid\"=CAST('\"public\".\"abc\"' AS REGCLASS)",
+            str(PostgreSQLQuery.estimate_count(Table("abc", schema="public"))),
+        )
+
+    def test_estimate(self):
+        q = PostgreSQLQuery.from_(self.table_abc).select("foo").where(self.table_abc.bar == 1)
+
+        self.assertEqual('EXPLAIN (FORMAT JSON) SELECT "foo" FROM "abc" WHERE "bar"=1', str(q.estimate()))
+
+    def test_estimated_rows(self):
+        explain = PostgreSQLQuery.from_(self.table_abc).select("foo").estimate()
+
+        self.assertEqual(1250, explain.estimated_rows(self.plan))
+        self.assertEqual(1250, explain.estimated_rows(json.loads(self.plan)))
+        self.assertEqual(1250, explain.estimated_rows([(json.loads(self.plan),)]))
@@ -0,0 +1,31 @@
+import unittest
+
+from pypika import QueryException, Table
+from pypika.dialects import RedshiftQuery
+
+
+class ExportTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_unload(self):
+        q = RedshiftQuery.from_(self.table_abc).select("foo").export_to("s3://bucket/abc_")
+
+        self.assertEqual('UNLOAD (\'SELECT "foo" FROM "abc"\') TO \'s3://bucket/abc_\'', str(q))
+
+    def test_unload_escapes_quotes_in_query(self):
+        q = (
+            RedshiftQuery.from_(self.table_abc)
+            .select("foo")
+            .where(self.table_abc.bar == "x")
+            .export_to("s3://bucket/abc_", format="parquet", iam_role="arn:aws:iam::0:role/unload", allowoverwrite=True)
+        )
+
+        self.assertEqual(
+            'UNLOAD (\'SELECT "foo" FROM "abc" WHERE "bar"=\'\'x\'\'\') TO \'s3://bucket/abc_\' '
+            'IAM_ROLE \'arn:aws:iam::0:role/unload\' ALLOWOVERWRITE FORMAT AS PARQUET',
+            str(q),
+        )
+
+    def test_unsupported_format_raises_exception(self):
+        with self.assertRaises(QueryException):
+            RedshiftQuery.from_(self.table_abc).select("foo").export_to("s3://bucket/abc_", format="orc")
@@ -2,6 +2,10 @@ import unittest
 
 from pypika import (
     Column,
+    DialectNotSupported,
+    Hint,
+    QueryLabel,
+    Table,
     Tables,
 )
 from pypika import (
@@ -58,3 +62,58 @@ class QuoteTests(unittest.TestCase):
     def test_dont_use_double_quotes_on_drop_queries(self):
         q = SnowflakeQuery.drop_table(self.table_abc)
         self.assertEqual("DROP TABLE abc", q.get_sql())
+
+
+class ExportTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_copy_into_stage(self):
+        q = SnowflakeQuery.from_(self.table_abc).select("foo").export_to("@stage/abc/", format="csv", header=True)
+
+        self.assertEqual("COPY INTO @stage/abc/ FROM (SELECT foo FROM abc) FILE_FORMAT=(TYPE=CSV) HEADER=TRUE", str(q))
+
+    def test_copy_into_external_location(self):
+        q = SnowflakeQuery.from_(self.table_abc).select("foo").export_to("s3://bucket/abc/", format="parquet")
+
+        self.assertEqual("COPY INTO 's3://bucket/abc/' FROM (SELECT foo FROM abc) FILE_FORMAT=(TYPE=PARQUET)", str(q))
+
+
+class MergeTests(unittest.TestCase):
+    def test_merge_values(self):
+        q = (
+            SnowflakeQuery.merge_into(Table("users"))
+            .using_values([(1, "a")], ["id", "name"])
+            .on_field("id")
+            .when_matched()
+            .update()
+            .when_not_matched()
+            .insert()
+        )
+
+        self.assertEqual(
+            "MERGE INTO users USING (VALUES (1,'a')) AS s(id,name) ON users.id=s.id "
+            "WHEN MATCHED THEN UPDATE SET name=s.name "
+            "WHEN NOT MATCHED THEN INSERT (id,name) VALUES (s.id,s.name)",
+            str(q),
+        )
+
+
+class HintTests(unittest.TestCase):
+    def test_label(self):
+        q = SnowflakeQuery.from_(Table("abc")).select("foo").hint(QueryLabel("nightly_report"))
+
+        self.assertEqual("/* label(nightly_report) */ SELECT foo FROM abc", str(q))
+
+    def test_optimizer_hints_not_supported(self):
+        with self.assertRaises(DialectNotSupported):
+            SnowflakeQuery.from_(Table("abc")).select("foo").hint(Hint("FULL", Table("abc")))
+
+
+class ExplainTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_explain(self):
+        q = SnowflakeQuery.from_(self.table_abc).select("foo")
+
+        self.assertEqual("EXPLAIN SELECT foo FROM abc", str(q.explain()))
+        self.assertEqual("EXPLAIN USING JSON SELECT foo FROM abc", str(q.explain(format="json")))
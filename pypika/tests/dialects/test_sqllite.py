@@ -1,6 +1,6 @@
 import unittest
 
-from pypika import Table
+from pypika import QueryException, Table
 from pypika.dialects import SQLLiteQuery
 
 
@@ -33,3 +33,17 @@ class ReplaceTests(unittest.TestCase):
         query = SQLLiteQuery.into("abc").insert_or_replace("v1", "v2", "v3")
         expected_output = "INSERT OR REPLACE INTO \"abc\" VALUES ('v1','v2','v3')"
         self.assertEqual(expected_output, str(query))
+
+
+class ExplainTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_explain_query_plan(self):
+        q = SQLLiteQuery.from_(self.table_abc).select("foo")
+
+        self.assertEqual('EXPLAIN QUERY PLAN SELECT "foo" FROM "abc"', str(q.explain()))
+        self.assertEqual('EXPLAIN QUERY PLAN SELECT "foo" FROM "abc"', str(q.explain(format="text")))
+
+    def test_unsupported_format(self):
+        with self.assertRaises(QueryException):
+            SQLLiteQuery.from_(self.table_abc).select("foo").explain(format="json")
@@ -1,6 +1,6 @@
 import unittest
 
-from pypika import Columns, Table, Tables, VerticaQuery
+from pypika import Columns, Hint, QueryLabel, Table, Tables, VerticaQuery
 
 
 class VerticaQueryTests(unittest.TestCase):
@@ -26,6 +26,11 @@ class VerticaQueryTests(unittest.TestCase):
 
         self.assertEqual('DELETE /*+label(test_hint)*/ FROM "abc"', str(q))
 
+    def test_label_and_hints(self):
+        q = VerticaQuery.from_("abc").select("*").hint(QueryLabel("test_hint"), Hint("SYNTACTIC_JOIN"))
+
+        self.assertEqual('SELECT /*+label(test_hint), SYNTACTIC_JOIN*/ * FROM "abc"', str(q))
+
 
 class CopyCSVTests(unittest.TestCase):
     table_abc = Table("abc")
@@ -91,3 +96,26 @@ class CreateTemporaryTableTests(unittest.TestCase):
     def test_create_table_preserve_rows_without_temporary_raises_error(self):
         with self.assertRaises(AttributeError):
             VerticaQuery.create_table(self.new_table).preserve_rows()
+
+
+class ExportTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_export_defaults_to_parquet(self):
+        q = VerticaQuery.from_(self.table_abc).select("foo").export_to("/data/abc")
+
+        self.assertEqual('EXPORT TO PARQUET(directory=\'/data/abc\') AS SELECT "foo" FROM "abc"', str(q))
+
+    def test_export_with_format_and_options(self):
+        q = VerticaQuery.from_(self.table_abc).select("foo").export_to("/data/abc", format="orc", compression="zstd")
+
+        self.assertEqual(
+            'EXPORT TO ORC(directory=\'/data/abc\',compression=\'zstd\') AS SELECT "foo" FROM "abc"', str(q)
+        )
+
+    def test_export_keeps_label_hint(self):
+        q = VerticaQuery.from_(self.table_abc).select("foo").hint("test_hint").export_to("/data/abc")
+
+        self.assertEqual(
+            'EXPORT TO PARQUET(directory=\'/data/abc\') AS SELECT /*+label(test_hint)*/ "foo" FROM "abc"', str(q)
+        )
@@ -1,6 +1,16 @@
+import sqlite3
 import unittest
 
-from pypika import SYSTEM_TIME, PostgreSQLQuery, Query, Table
+from pypika import (
+    SYSTEM_TIME,
+    MSSQLQuery,
+    MySQLQuery,
+    PostgreSQLQuery,
+    Query,
+    QueryException,
+    SQLLiteQuery,
+    Table,
+)
 
 __author__ = "Timothy Heys"
 __email__ = "theys@kayak.com"
@@ -95,3 +105,53 @@ class PostgresDeleteTests(unittest.TestCase):
         )
 
         self.assertEqual('DELETE FROM "abc" USING "trash" WHERE "abc"."id"="trash"."abc_id"', str(q1))
+
+
+class ChunkedDeleteTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_chunk_statement(self):
+        for query_cls, expected in (
+            (Query, 'DELETE FROM "abc" WHERE "id" IN (SELECT "id" FROM "abc" WHERE "foo"=1 ORDER BY "id" LIMIT 100)'),
+            (MySQLQuery, "DELETE FROM `abc` WHERE `foo`=1 ORDER BY `id` LIMIT 100"),
+            (MSSQLQuery, 'DELETE TOP (100) FROM "abc" WHERE "foo"=1'),
+            (
+                PostgreSQLQuery,
+                'DELETE FROM "abc" WHERE "ctid" IN (SELECT "ctid" FROM "abc" WHERE "foo"=1 LIMIT 100)',
+            ),
+        ):
+            with self.subTest(query_cls.__name__):
+                q = query_cls.from_(self.table_abc).delete().where(self.table_abc.foo == 1)
+
+                self.assertEqual(expected, str(q.iter_chunks("id", 100).statement()))
+
+    def test_chunk_statement_of_mutable_query(self):
+        q = MySQLQuery.from_(self.table_abc, immutable=False).delete()
+
+        q.iter_chunks(self.table_abc.id, 100).statement()
+
+        self.assertEqual("DELETE FROM `abc`", str(q))
+
+    def test_run(self):
+        connection = sqlite3.connect(":memory:")
+        connection.execute('CREATE TABLE "abc" ("id" INTEGER PRIMARY KEY, "foo" INTEGER)')
+        connection.executemany('INSERT INTO "abc" VALUES (?,?)', [(i, i % 2) for i in range(25)])
+        throttled = []
+
+        chunks = SQLLiteQuery.from_(self.table_abc).delete().where(self.table_abc.foo == 1).iter_chunks("id", 5)
+        total = chunks.run(lambda statement: connection.execute(str(statement)).rowcount, throttle=throttled.append)
+
+        self.assertEqual(12, total)
+        self.assertEqual([5, 5], throttled)
+        self.assertEqual(13, connection.execute('SELECT COUNT(*) FROM "abc"').fetchone()[0])
+        connection.close()
+
+    def test_invalid_chunks(self):
+        with self.assertRaises(QueryException):
+            Query.from_(self.table_abc).select("id").iter_chunks("id", 100)
+
+        with self.assertRaises(QueryException):
+            Query.from_(self.table_abc).delete().limit(10).iter_chunks("id", 100)
+
+        with self.assertRaises(QueryException):
+            Query.from_(self.table_abc).delete().iter_chunks("id", 0)
@@ -165,6 +165,24 @@ class InsertIntoTests(unittest.TestCase):
             'WITH sub_qs AS (SELECT "id" FROM "abc") INSERT INTO "abc" SELECT "sub_qs"."id" FROM sub_qs', str(q)
         )
 
+    def test_insert_chunks(self):
+        queries = Query.into(self.table_abc).columns("a", "b").insert_chunks([(1, "a"), (2, "b"), (3, "c")], max_rows=2)
+
+        self.assertEqual(
+            [
+                "INSERT INTO \"abc\" (\"a\",\"b\") VALUES (1,'a'),(2,'b')",
+                "INSERT INTO \"abc\" (\"a\",\"b\") VALUES (3,'c')",
+            ],
+            [str(query) for query in queries],
+        )
+
+    def test_insert_chunks_by_size(self):
+        queries = Query.into(self.table_abc).insert_chunks([(1,), (2,), (3,)], max_size=8)
+
+        self.assertEqual(
+            ['INSERT INTO "abc" VALUES (1),(2)', 'INSERT INTO "abc" VALUES (3)'], [str(query) for query in queries]
+        )
+
 
 class PostgresInsertIntoOnConflictTests(unittest.TestCase):
     table_abc = Table("abc")
@@ -737,6 +755,74 @@ class InsertIntoOnDuplicateTests(unittest.TestCase):
             str(query),
         )
 
+    def test_update_from_inserted_with_row_alias(self):
+        query = (
+            MySQLQuery.into(self.table_abc)
+            .columns(self.table_abc.foo, self.table_abc.bar)
+            .insert((1, "a"), (2, "b"))
+            .on_duplicate_key_update_from_inserted(self.table_abc.bar)
+        )
+
+        self.assertEqual(
+            "INSERT INTO `abc` (`foo`,`bar`) VALUES (1,'a'),(2,'b') AS `new` ON DUPLICATE KEY UPDATE `bar`=`new`.`bar`",
+            str(query),
+        )
+
+    def test_update_from_inserted_defaults_to_inserted_columns(self):
+        query = (
+            MySQLQuery.into(self.table_abc)
+            .columns("foo", "bar")
+            .insert(1, "a")
+            .on_duplicate_key_update_from_inserted()
+            .on_duplicate_key_update(self.table_abc.baz, 0)
+        )
+
+        self.assertEqual(
+            "INSERT INTO `abc` (`foo`,`bar`) VALUES (1,'a') AS `new` "
+            "ON DUPLICATE KEY UPDATE `baz`=0,`foo`=`new`.`foo`,`bar`=`new`.`bar`",
+            str(query),
+        )
+
+    def test_update_from_inserted_on_older_servers(self):
+        query = (
+            MySQLQuery.into(self.table_abc, server_version=(8, 0, 18))
+            .columns("foo", "bar")
+            .insert(1, "a")
+            .on_duplicate_key_update_from_inserted("bar")
+        )
+
+        self.assertEqual(
+            "INSERT INTO `abc` (`foo`,`bar`) VALUES (1,'a') ON DUPLICATE KEY UPDATE `bar`=VALUES(`bar`)", str(query)
+        )
+
+    def test_update_from_inserted_chunks(self):
+        queries = (
+            MySQLQuery.into(self.table_abc)
+            .columns("foo", "bar")
+            .on_duplicate_key_update_from_inserted("bar")
+            .insert_chunks([(1, "a"), (2, "b"), (3, "c")], max_rows=2)
+        )
+
+        self.assertEqual(
+            [
+                "INSERT INTO `abc` (`foo`,`bar`) VALUES (1,'a'),(2,'b') AS `new` ON DUPLICATE KEY UPDATE `bar`=`new`.`bar`",
+                "INSERT INTO `abc` (`foo`,`bar`) VALUES (3,'c') AS `new` ON DUPLICATE KEY UPDATE `bar`=`new`.`bar`",
+            ],
+            [str(query) for query in queries],
+        )
+
+    def test_update_from_inserted_requires_columns(self):
+        query = MySQLQuery.into(self.table_abc).insert(1, "a").on_duplicate_key_update_from_inserted()
+
+        with self.assertRaises(QueryException):
+            str(query)
+
+    def test_update_from_inserted_and_ignore(self):
+        with self.assertRaises(QueryException):
+            MySQLQuery.into(self.table_abc).insert(1).on_duplicate_key_update_from_inserted(
+                "foo"
+            ).on_duplicate_key_ignore()
+
 
 class InsertSelectFromTests(unittest.TestCase):
     table_abc, table_efg, table_hij = Tables("abc", "efg", "hij")
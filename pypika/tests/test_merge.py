@@ -0,0 +1,131 @@
+import unittest
+
+from pypika import DialectNotSupported, Query, QueryException, Table
+
+
+class MergeTests(unittest.TestCase):
+    users, staging = Table("users"), Table("staging")
+
+    def test_upsert_from_table(self):
+        q = (
+            Query.merge_into(self.users)
+            .using(self.staging)
+            .on(self.users.id == self.staging.id)
+            .when_matched()
+            .update(["name"])
+            .when_not_matched()
+            .insert(["id", "name"])
+        )
+
+        self.assertEqual(
+            'MERGE INTO "users" USING "staging" ON "users"."id"="staging"."id" '
+            'WHEN MATCHED THEN UPDATE SET "name"="staging"."name" '
+            'WHEN NOT MATCHED THEN INSERT ("id","name") VALUES ("staging"."id","staging"."name")',
+            str(q),
+        )
+
+    def test_upsert_from_values(self):
+        q = (
+            Query.merge_into("users")
+            .using_values([(1, "a"), (2, "b")], ["id", "name"])
+            .on_field("id")
+            .when_matched()
+            .update()
+            .when_not_matched()
+            .insert()
+        )
+
+        self.assertEqual(
+            'MERGE INTO "users" USING (VALUES (1,\'a\'),(2,\'b\')) AS "s"("id","name") ON "users"."id"="s"."id" '
+            'WHEN MATCHED THEN UPDATE SET "name"="s"."name" '
+            'WHEN NOT MATCHED THEN INSERT ("id","name") VALUES ("s"."id","s"."name")',
+            str(q),
+        )
+
+    def test_source_subquery(self):
+        subquery = Query.from_(self.staging).select(self.staging.id, self.staging.name).as_("s")
+        q = Query.merge_into(self.users).using(subquery).on_field("id").when_matched().update(["name"])
+
+        self.assertEqual(
+            'MERGE INTO "users" USING (SELECT "id","name" FROM "staging") "s" ON "users"."id"="s"."id" '
+            'WHEN MATCHED THEN UPDATE SET "name"="s"."name"',
+            str(q),
+        )
+
+    def test_subquery_requires_alias(self):
+        with self.assertRaises(QueryException):
+            Query.merge_into(self.users).using(Query.from_(self.staging).select("id"))
+
+    def test_conditional_branches(self):
+        s = self.staging.as_("s")
+        q = (
+            Query.merge_into(self.users)
+            .using(s)
+            .on_field("id")
+            .when_matched(s.deleted == 1)
+            .delete()
+            .when_matched(s.version > self.users.version)
+            .update({"name": s.name, "version": s.version + 1})
+            .when_not_matched(s.deleted == 0)
+            .insert(["id", "name"])
+        )
+
+        self.assertEqual(
+            'MERGE INTO "users" USING "staging" "s" ON "users"."id"="s"."id" '
+            'WHEN MATCHED AND "s"."deleted"=1 THEN DELETE '
+            'WHEN MATCHED AND "s"."version">"users"."version" THEN UPDATE SET "name"="s"."name","version"="s"."version"+1 '
+            'WHEN NOT MATCHED AND "s"."deleted"=0 THEN INSERT ("id","name") VALUES ("s"."id","s"."name")',
+            str(q),
+        )
+
+    def test_update_constant_values(self):
+        q = Query.merge_into(self.users).using(self.staging).on_field("id").when_matched().update({"active": False})
+
+        self.assertEqual(
+            'MERGE INTO "users" USING "staging" ON "users"."id"="staging"."id" '
+            'WHEN MATCHED THEN UPDATE SET "active"=false',
+            str(q),
+        )
+
+    def test_is_immutable(self):
+        base = Query.merge_into(self.users).using(self.staging).on_field("id")
+        q = base.when_matched().delete()
+
+        with self.assertRaises(QueryException):
+            str(base)
+        self.assertEqual(
+            'MERGE INTO "users" USING "staging" ON "users"."id"="staging"."id" WHEN MATCHED THEN DELETE', str(q)
+        )
+
+    def test_default_columns_require_values_source(self):
+        with self.assertRaises(QueryException):
+            Query.merge_into(self.users).using(self.staging).on_field("id").when_matched().update()
+
+    def test_insert_only_unmatched_rows(self):
+        with self.assertRaises(QueryException):
+            Query.merge_into(self.users).using(self.staging).on_field("id").when_matched().insert(["id"])
+
+        with self.assertRaises(QueryException):
+            Query.merge_into(self.users).using(self.staging).on_field("id").when_not_matched().delete()
+
+    def test_unreachable_branch(self):
+        q = (
+            Query.merge_into(self.users)
+            .using(self.staging)
+            .on_field("id")
+            .when_matched()
+            .delete()
+            .when_matched(self.staging.id > 1)
+            .update(["name"])
+        )
+
+        with self.assertRaises(QueryException):
+            str(q)
+
+    def test_requires_on(self):
+        with self.assertRaises(QueryException):
+            str(Query.merge_into(self.users).using(self.staging).when_matched().delete())
+
+    def test_not_matched_by_source_not_supported(self):
+        with self.assertRaises(DialectNotSupported):
+            Query.merge_into(self.users).using(self.staging).on_field("id").when_not_matched_by_source()
@@ -0,0 +1,429 @@
+import sqlite3
+import unittest
+
+from pypika import AliasedQuery, Field, MSSQLQuery, PostgreSQLQuery, Query, Table, analytics as an, functions as fn
+from pypika.dialects import SQLLiteQuery
+from pypika.optimizer import prune_columns, push_down_predicates
+
+
+class PushDownPredicatesTests(unittest.TestCase):
+    table_abc, table_efg = Table("abc"), Table("efg")
+
+    def subquery(self, query_cls=Query):
+        return query_cls.from_(self.table_abc).select(
+            self.table_abc.foo, self.table_abc.bar.as_("baz"), (self.table_abc.buz + 1).as_("fiz")
+        )
+
+    def test_push_down_into_subquery(self):
+        subquery = self.subquery()
+        q = Query.from_(subquery).select(subquery.foo).where((subquery.baz == 1) & subquery.foo.isin([1, 2]))
+
+        self.assertEqual(
+            'SELECT "sq0"."foo" FROM (SELECT "foo","bar" "baz","buz"+1 "fiz" FROM "abc" '
+            'WHERE "bar"=1 AND "foo" IN (1,2)) "sq0"',
+            str(push_down_predicates(q)),
+        )
+
+    def test_original_query_is_not_modified(self):
+        subquery = self.subquery()
+        q = Query.from_(subquery).select(subquery.foo).where(subquery.baz == 1)
+        sql = str(q)
+
+        q.optimize()
+
+        self.assertEqual(sql, str(q))
+        self.assertEqual(sql, str(q.optimize(push_down_predicates=False, prune_columns=False)))
+
+    def test_computed_columns_are_kept(self):
+        subquery = self.subquery()
+        q = Query.from_(subquery).select(subquery.foo).where(subquery.fiz > 1)
+
+        self.assertEqual(str(q), str(push_down_predicates(q)))
+
+    def test_condition_on_several_sources_is_kept(self):
+        subquery = self.subquery()
+        q = (
+            Query.from_(subquery)
+            .join(self.table_efg)
+            .on(subquery.foo == self.table_efg.foo)
+            .select(subquery.foo)
+            .where(subquery.baz == self.table_efg.bar)
+        )
+
+        self.assertEqual(str(q), str(push_down_predicates(q)))
+
+    def test_push_down_into_grouped_subquery(self):
+        subquery = (
+            Query.from_(self.table_abc)
+            .select(self.table_abc.foo, fn.Sum(self.table_abc.bar).as_("total"))
+            .groupby(self.table_abc.foo)
+        )
+        q = Query.from_(subquery).select("*").where((subquery.foo == 1) & (subquery.total > 10))
+
+        self.assertEqual(
+            'SELECT * FROM (SELECT "foo",SUM("bar") "total" FROM "abc" WHERE "foo"=1 GROUP BY "foo") "sq0" '
+            'WHERE "sq0"."total">10',
+            str(push_down_predicates(q)),
+        )
+
+    def test_aggregate_without_group_by_is_kept(self):
+        subquery = Query.from_(self.table_abc).select(fn.Max(self.table_abc.foo).as_("foo"))
+        q = Query.from_(subquery).select("*").where(subquery.foo > 1)
+
+        self.assertEqual(str(q), str(push_down_predicates(q)))
+
+    def test_having_without_group_by_is_kept(self):
+        subquery = Query.from_(self.table_abc).select(self.table_abc.foo).having(fn.Count("*") > 1)
+        q = Query.from_(subquery).select(subquery.foo).where(subquery.foo == 1)
+
+        self.assertEqual(str(q), str(push_down_predicates(q)))
+
+    def test_window_functions(self):
+        subquery = Query.from_(self.table_abc).select(
+            self.table_abc.foo,
+            self.table_abc.bar,
+            an.RowNumber().over(self.table_abc.foo).orderby(self.table_abc.bar).as_("rn"),
+        )
+        q = Query.from_(subquery).select("*").where((subquery.foo == 1) & (subquery.bar == 2) & (subquery.rn == 1))
+
+        self.assertEqual(
+            'SELECT * FROM (SELECT "foo","bar",ROW_NUMBER() OVER(PARTITION BY "foo" ORDER BY "bar") "rn" '
+            'FROM "abc" WHERE "foo"=1) "sq0" WHERE "sq0"."bar"=2 AND "sq0"."rn"=1',
+            str(push_down_predicates(q)),
+        )
+
+    def test_limited_subqueries_are_kept(self):
+        for subquery in (
+            self.subquery().limit(10),
+            self.subquery().offset(10),
+            self.subquery(MSSQLQuery).top(10),
+            self.subquery(PostgreSQLQuery).distinct_on("foo"),
+        ):
+            with self.subTest(str(subquery)):
+                q = subquery.QUERY_CLS.from_(subquery).select("*").where(subquery.baz == 1)
+
+                self.assertEqual(str(q), str(push_down_predicates(q)))
+
+    def test_push_down_through_distinct(self):
+        subquery = Query.from_(self.table_abc).select(self.table_abc.foo).distinct()
+        q = Query.from_(subquery).select("*").where(subquery.foo == 1)
+
+        self.assertEqual(
+            'SELECT * FROM (SELECT DISTINCT "foo" FROM "abc" WHERE "foo"=1) "sq0"',
+            str(push_down_predicates(q)),
+        )
+
+    def test_push_down_through_star(self):
+        subquery = Query.from_(self.table_abc).select("*")
+        q = Query.from_(subquery).select("*").where(subquery.foo == 1)
+
+        self.assertEqual('SELECT * FROM (SELECT * FROM "abc" WHERE "foo"=1) "sq0"', str(push_down_predicates(q)))
+
+    def test_push_down_through_nested_subqueries(self):
+        subquery = self.subquery()
+        middle = Query.from_(subquery).select(subquery.foo, subquery.baz)
+        q = Query.from_(middle).select("*").where(middle.baz == 5)
+
+        self.assertEqual(
+            'SELECT * FROM (SELECT "sq0"."foo","sq0"."baz" FROM (SELECT "foo","bar" "baz","buz"+1 "fiz" FROM "abc" '
+            'WHERE "bar"=5) "sq0") "sq1"',
+            str(push_down_predicates(q)),
+        )
+
+    def test_outer_joins(self):
+        subquery = self.subquery()
+        inner = (
+            Query.from_(self.table_efg)
+            .join(subquery)
+            .on(self.table_efg.foo == subquery.foo)
+            .select("*")
+            .where(subquery.baz == 1)
+        )
+        left = (
+            Query.from_(self.table_efg)
+            .left_join(subquery)
+            .on(self.table_efg.foo == subquery.foo)
+            .select("*")
+            .where(subquery.baz == 1)
+        )
+        right = (
+            Query.from_(subquery)
+            .right_join(self.table_efg)
+            .on(self.table_efg.foo == subquery.foo)
+            .select("*")
+            .where(subquery.baz == 1)
+        )
+
+        self.assertEqual(
+            'SELECT * FROM "efg" JOIN (SELECT "foo","bar" "baz","buz"+1 "fiz" FROM "abc" WHERE "bar"=1) "sq0" '
+            'ON "efg"."foo"="sq0"."foo"',
+            str(push_down_predicates(inner)),
+        )
+        self.assertEqual(str(left), str(push_down_predicates(left)))
+        self.assertEqual(str(right), str(push_down_predicates(right)))
+
+    def test_push_down_into_cte(self):
+        cte = AliasedQuery("cte")
+        q = Query.with_(self.subquery(), "cte").from_(cte).select(cte.foo).where(cte.baz == 1)
+
+        self.assertEqual(
+            'WITH cte AS (SELECT "foo","bar" "baz","buz"+1 "fiz" FROM "abc" WHERE "bar"=1) SELECT "cte"."foo" FROM cte',
+            str(push_down_predicates(q)),
+        )
+
+    def test_cte_used_twice_is_kept(self):
+        cte, other = AliasedQuery("cte"), AliasedQuery("cte").as_("other")
+        q = (
+            Query.with_(self.subquery(), "cte")
+            .from_(cte)
+            .join(other)
+            .on(cte.foo == Field("baz", table=other))
+            .select(cte.foo)
+            .where(cte.baz == 1)
+        )
+
+        self.assertEqual(str(q), str(push_down_predicates(q)))
+
+    def test_cte_also_read_as_table_is_kept(self):
+        cte = AliasedQuery("cte")
+        other = Query.from_(Table("cte")).select("foo")
+        q = Query.with_(self.subquery(), "cte").from_(cte).select(cte.foo).where((cte.baz == 1) & cte.foo.isin(other))
+
+        self.assertEqual(str(q), str(push_down_predicates(q)))
+
+    def test_cte_used_by_update_set_value_is_kept(self):
+        cte = AliasedQuery("cte")
+        q = (
+            PostgreSQLQuery.with_(self.subquery(), "cte")
+            .update(self.table_efg)
+            .from_(cte)
+            .set(self.table_efg.bar, Query.from_(cte).select(fn.Max(cte.baz)))
+            .where((self.table_efg.foo == cte.foo) & (cte.baz == 1))
+        )
+
+        self.assertEqual(str(q), str(push_down_predicates(q)))
+
+
+class PruneColumnsTests(unittest.TestCase):
+    table_abc, table_efg = Table("abc"), Table("efg")
+
+    def subquery(self):
+        return Query.from_(self.table_abc).select(
+            self.table_abc.foo, self.table_abc.bar.as_("baz"), (self.table_abc.buz + 1).as_("fiz")
+        )
+
+    def test_prune_subquery(self):
+        subquery = self.subquery()
+        q = Query.from_(subquery).select(subquery.foo).where(subquery.baz == 1)
+
+        self.assertEqual(
+            'SELECT "sq0"."foo" FROM (SELECT "foo","bar" "baz" FROM "abc") "sq0" WHERE "sq0"."baz"=1',
+            str(prune_columns(q)),
+        )
+
+    def test_prune_cte(self):
+        cte = AliasedQuery("cte")
+        q = Query.with_(self.subquery(), "cte").from_(cte).select(cte.fiz)
+
+        self.assertEqual(
+            'WITH cte AS (SELECT "buz"+1 "fiz" FROM "abc") SELECT "cte"."fiz" FROM cte', str(prune_columns(q))
+        )
+
+    def test_cte_keeps_the_columns_of_every_reference(self):
+        cte = AliasedQuery("cte")
+        other = Query.from_(cte).select(cte.baz)
+        q = Query.with_(self.subquery(), "cte").from_(cte).select(cte.foo).where(cte.foo.isin(other))
+
+        self.assertEqual(
+            'WITH cte AS (SELECT "foo","bar" "baz" FROM "abc") SELECT "cte"."foo" FROM cte '
+            'WHERE "cte"."foo" IN (SELECT "cte"."baz" FROM cte)',
+            str(prune_columns(q)),
+        )
+
+    def test_prune_nested_subqueries(self):
+        subquery = self.subquery()
+        middle = Query.from_(subquery).select(subquery.foo, subquery.fiz)
+        q = Query.from_(middle).select(middle.foo)
+
+        self.assertEqual(
+            'SELECT "sq1"."foo" FROM (SELECT "sq0"."foo" FROM (SELECT "foo" FROM "abc") "sq0") "sq1"',
+            str(prune_columns(q)),
+        )
+
+    def test_star_keeps_all_columns(self):
+        subquery = self.subquery()
+        for q in (Query.from_(subquery).select("*"), Query.from_(subquery).select(subquery.star)):
+            with self.subTest(str(q)):
+                self.assertEqual(str(q), str(prune_columns(q)))
+
+    def test_count_star(self):
+        subquery = self.subquery()
+        q = Query.from_(subquery).select(fn.Count("*"))
+
+        self.assertEqual('SELECT COUNT(*) FROM (SELECT "foo" FROM "abc") "sq0"', str(prune_columns(q)))
+
+    def test_distinct_keeps_all_columns(self):
+        subquery = self.subquery().distinct()
+        q = Query.from_(subquery).select(subquery.foo)
+
+        self.assertEqual(str(q), str(prune_columns(q)))
+
+    def test_group_by(self):
+        subquery = (
+            Query.from_(self.table_abc)
+            .select(self.table_abc.foo, self.table_abc.bar, fn.Sum(self.table_abc.buz).as_("total"))
+            .groupby(self.table_abc.foo, self.table_abc.bar)
+        )
+        q = Query.from_(subquery).select(subquery.total)
+
+        self.assertEqual(
+            'SELECT "sq0"."total" FROM (SELECT SUM("buz") "total" FROM "abc" GROUP BY "foo","bar") "sq0"',
+            str(prune_columns(q)),
+        )
+
+    def test_positional_group_by_keeps_all_columns(self):
+        subquery = Query.from_(self.table_abc).select(self.table_abc.foo, self.table_abc.bar).groupby(1, 2)
+        q = Query.from_(subquery).select(subquery.foo)
+
+        self.assertEqual(str(q), str(prune_columns(q)))
+
+    def test_aggregate_without_group_by_is_kept(self):
+        subquery = Query.from_(self.table_abc).select(
+            fn.Max(self.table_abc.foo).as_("high"), fn.Min(self.table_abc.foo).as_("low")
+        )
+        q = Query.from_(subquery).select(fn.Count("*"))
+
+        self.assertEqual('SELECT COUNT(*) FROM (SELECT MAX("foo") "high" FROM "abc") "sq0"', str(prune_columns(q)))
+
+    def test_aliases_used_by_the_subquery_are_kept(self):
+        subquery = (
+            Query.from_(self.table_abc)
+            .select(self.table_abc.foo, (self.table_abc.bar * 2).as_("double"), self.table_abc.buz)
+            .orderby(Field("double"))
+            .limit(10)
+        )
+        q = Query.from_(subquery).select(subquery.foo)
+
+        self.assertEqual(
+            'SELECT "sq0"."foo" FROM (SELECT "foo","bar"*2 "double" FROM "abc" ORDER BY "double" LIMIT 10) "sq0"',
+            str(prune_columns(q)),
+        )
+
+    def test_row_generating_functions_are_kept(self):
+        subquery = Query.from_(self.table_abc).select(self.table_abc.foo, fn.Function("unnest", self.table_abc.tags))
+        q = Query.from_(subquery).select(subquery.foo)
+
+        self.assertEqual(str(q), str(prune_columns(q)))
+
+    def test_union_all(self):
+        union = (
+            Query.from_(self.table_abc)
+            .select(self.table_abc.foo, self.table_abc.bar)
+            .union_all(Query.from_(self.table_efg).select(self.table_efg.fiz, self.table_efg.buz))
+        )
+        q = Query.from_(union).select(union.bar)
+
+        self.assertEqual(
+            'SELECT "sq0"."bar" FROM ((SELECT "bar" FROM "abc") UNION ALL (SELECT "buz" FROM "efg")) "sq0"',
+            str(prune_columns(q)),
+        )
+
+    def test_union_keeps_all_columns(self):
+        union = (
+            Query.from_(self.table_abc)
+            .select(self.table_abc.foo, self.table_abc.bar)
+            .union(Query.from_(self.table_efg).select(self.table_efg.fiz, self.table_efg.buz))
+        )
+        q = Query.from_(union).select(union.bar)
+
+        self.assertEqual(str(q), str(prune_columns(q)))
+
+    def test_top_level_selects_are_kept(self):
+        q = Query.from_(self.table_abc).select(self.table_abc.foo, self.table_abc.bar)
+
+        self.assertEqual(str(q), str(prune_columns(q)))
+
+    def test_cte_read_as_table_keeps_all_columns(self):
+        cte = Table("cte")
+        q = Query.with_(self.subquery(), "cte").from_(cte).select(cte.baz)
+
+        self.assertEqual(str(q), str(prune_columns(q)))
+        self.assertEqual(str(q), str(q.optimize()))
+
+    def test_cte_read_as_table_and_aliased_query_keeps_all_columns(self):
+        cte = AliasedQuery("cte")
+        other = Query.from_(Table("cte")).select("baz")
+        q = Query.with_(self.subquery(), "cte").from_(cte).select(cte.foo).where(cte.foo.isin(other))
+
+        self.assertEqual(str(q), str(prune_columns(q)))
+
+    def test_unreferenced_cte_keeps_all_columns(self):
+        q = Query.with_(self.subquery(), "cte").from_(self.table_efg).select(self.table_efg.foo)
+
+        self.assertEqual(str(q), str(prune_columns(q)))
+
+    def test_update_set_values_are_kept(self):
+        subquery = Query.from_(self.table_efg).select(self.table_efg.id, self.table_efg.foo, self.table_efg.bar)
+        q = (
+            PostgreSQLQuery.update(self.table_abc)
+            .from_(subquery)
+            .set(self.table_abc.foo, subquery.foo)
+            .where(self.table_abc.id == subquery.id)
+        )
+
+        self.assertEqual(
+            'UPDATE "abc" SET "foo"="sq0"."foo" FROM (SELECT "id","foo" FROM "efg") "sq0" WHERE "abc"."id"="sq0"."id"',
+            str(prune_columns(q)),
+        )
+
+    def test_returning_terms_are_kept(self):
+        subquery = Query.from_(self.table_efg).select(self.table_efg.id, self.table_efg.foo, self.table_efg.bar)
+        q = (
+            PostgreSQLQuery.update(self.table_abc)
+            .from_(subquery)
+            .set(self.table_abc.foo, 1)
+            .where(self.table_abc.id == subquery.id)
+            .returning(subquery.bar)
+        )
+
+        self.assertEqual(
+            'UPDATE "abc" SET "foo"=1 FROM (SELECT "id","bar" FROM "efg") "sq0" WHERE "abc"."id"="sq0"."id" '
+            'RETURNING "sq0"."bar"',
+            str(prune_columns(q)),
+        )
+
+
+class OptimizeResultTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute('CREATE TABLE "abc" ("foo" INTEGER, "bar" INTEGER)')
+        self.connection.executemany('INSERT INTO "abc" VALUES (?,?)', [(i % 3, i) for i in range(12)])
+
+    def tearDown(self):
+        self.connection.close()
+
+    def fetch(self, query):
+        return sorted(self.connection.execute(str(query)).fetchall())
+
+    def test_same_results(self):
+        grouped = (
+            SQLLiteQuery.from_(self.table_abc)
+            .select(self.table_abc.foo, fn.Sum(self.table_abc.bar).as_("total"))
+            .groupby(self.table_abc.foo)
+        )
+        windowed = SQLLiteQuery.from_(self.table_abc).select(
+            self.table_abc.foo,
+            self.table_abc.bar,
+            an.RowNumber().over(self.table_abc.foo).orderby(self.table_abc.bar).as_("rn"),
+        )
+        for q in (
+            SQLLiteQuery.from_(grouped).select("*").where((grouped.foo > 0) & (grouped.total > 15)),
+            SQLLiteQuery.from_(windowed).select("*").where((windowed.foo == 1) & (windowed.rn < 3)),
+            SQLLiteQuery.from_(windowed).select("*").where(windowed.bar > 4),
+            SQLLiteQuery.from_(grouped).select(grouped.total).where(grouped.foo < 2),
+            SQLLiteQuery.from_(windowed).select(windowed.bar, fn.Count("*")).groupby(windowed.bar),
+        ):
+            with self.subTest(str(q)):
+                self.assertEqual(self.fetch(q), self.fetch(q.optimize()))
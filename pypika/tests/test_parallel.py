@@ -0,0 +1,58 @@
+import sqlite3
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pypika import Table
+from pypika.dialects import SQLLiteQuery
+from pypika.parallel import run_partitions
+
+
+class RunPartitionsTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def setUp(self):
+        # A shared in-memory database, each thread opening its own connection
+        self.uri = "file:test_parallel?mode=memory&cache=shared"
+        self.connection = sqlite3.connect(self.uri, uri=True)
+        self.connection.execute('CREATE TABLE "abc" ("id" INTEGER PRIMARY KEY)')
+        self.connection.executemany('INSERT INTO "abc" VALUES (?)', [(i,) for i in range(100)])
+        self.connection.commit()
+
+    def tearDown(self):
+        self.connection.close()
+
+    def execute(self, query):
+        connection = sqlite3.connect(self.uri, uri=True, check_same_thread=False)
+        try:
+            return [row[0] for row in connection.execute(str(query))]
+        finally:
+            connection.close()
+
+    def test_run_partitions(self):
+        queries = SQLLiteQuery.from_(self.table_abc).select("id").partition_by_range("id", [None, 10, 50, None])
+
+        results = run_partitions(queries, self.execute, max_workers=2)
+
+        self.assertEqual([list(range(10)), list(range(10, 50)), list(range(50, 100))], results)
+
+    def test_run_partitions_on_executor(self):
+        threads = set()
+
+        def execute(query):
+            threads.add(threading.current_thread().name)
+            return str(query)
+
+        queries = SQLLiteQuery.from_(self.table_abc).select("id").partition_by_range("id", [0, 10, 20])
+        with ThreadPoolExecutor(thread_name_prefix="partitions") as executor:
+            results = run_partitions(queries, execute, executor=executor)
+
+        self.assertEqual([str(query) for query in queries], results)
+        self.assertTrue(all(name.startswith("partitions") for name in threads))
+
+    def test_exception_is_raised(self):
+        def execute(query):
+            raise ValueError(str(query))
+
+        with self.assertRaises(ValueError):
+            run_partitions(SQLLiteQuery.from_(self.table_abc).select("id").partition_by_range("id", [0, 10]), execute)
@@ -0,0 +1,72 @@
+import sqlite3
+import unittest
+
+from pypika import Table
+from pypika.dialects import SQLLiteQuery
+from pypika.plans import parse_sqlite_plan
+
+
+class SQLitePlanTests(unittest.TestCase):
+    def test_parse_plan(self):
+        plan = parse_sqlite_plan(
+            [
+                (2, 0, 0, "CO-ROUTINE s"),
+                (5, 2, 0, "SCAN TABLE t USING COVERING INDEX ix_a"),
+                (13, 0, 0, "SCAN s"),
+                (20, 0, 0, "SEARCH u USING INDEX ix_t_id (t_id=?)"),
+                (25, 0, 0, "USE TEMP B-TREE FOR ORDER BY"),
+            ]
+        )
+
+        self.assertEqual(
+            "CO-ROUTINE s\n"
+            "  SCAN TABLE t USING COVERING INDEX ix_a\n"
+            "SCAN s\n"
+            "SEARCH u USING INDEX ix_t_id (t_id=?)\n"
+            "USE TEMP B-TREE FOR ORDER BY",
+            str(plan),
+        )
+        self.assertEqual([("t", "ix_a")], [(node.table, node.index) for node in plan.full_scans()])
+        self.assertEqual({"t", "s", "u"}, plan.tables())
+        self.assertEqual(["CO-ROUTINE", "SCAN", "SCAN", "SEARCH", "USE"], [node.operation for node in plan.walk()])
+
+    def test_constant_row_is_not_a_full_scan(self):
+        plan = parse_sqlite_plan([(1, 0, 0, "SCAN CONSTANT ROW")])
+
+        self.assertEqual([], plan.full_scans())
+        self.assertEqual(set(), plan.tables())
+
+
+class SQLiteExplainTests(unittest.TestCase):
+    table_abc, table_efg = Table("abc"), Table("efg")
+
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.executescript(
+            "CREATE TABLE abc (id INTEGER PRIMARY KEY, foo INTEGER, bar INTEGER);"
+            "CREATE INDEX ix_foo ON abc (foo);"
+            "CREATE TABLE efg (id INTEGER PRIMARY KEY, abc_id INTEGER);"
+        )
+
+    def tearDown(self):
+        self.connection.close()
+
+    def _plan(self, query):
+        return parse_sqlite_plan(self.connection.execute(str(query.explain())).fetchall())
+
+    def test_search_by_index(self):
+        plan = self._plan(SQLLiteQuery.from_(self.table_abc).select("bar").where(self.table_abc.foo == 1))
+
+        self.assertEqual([], plan.full_scans())
+        self.assertEqual({"abc"}, plan.tables())
+
+    def test_full_scan(self):
+        q = (
+            SQLLiteQuery.from_(self.table_abc)
+            .join(self.table_efg)
+            .on(self.table_efg.abc_id == self.table_abc.id)
+            .select(self.table_abc.bar)
+            .where(self.table_abc.id == 3)
+        )
+
+        self.assertEqual(["efg"], [node.table for node in self._plan(q).full_scans()])
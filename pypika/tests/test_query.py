@@ -1,6 +1,6 @@
 import unittest
 
-from pypika import Case, Field, Query, Tables, Tuple, functions
+from pypika import Case, DialectNotSupported, Field, Hint, Query, QueryException, Tables, Tuple, functions
 from pypika.dialects import (
     ClickHouseQuery,
     ClickHouseQueryBuilder,
@@ -205,6 +205,12 @@ class QueryBuilderTests(unittest.TestCase):
         with self.subTest('OracleQueryBuilder'):
             self.assertEqual(OracleQuery, OracleQueryBuilder.QUERY_CLS)
 
+    def test_export_to_unsupported_dialect_raises_exception(self):
+        for query_cls in (Query, MSSQLQuery, OracleQuery, SQLLiteQuery):
+            with self.subTest(query_cls.__name__):
+                with self.assertRaises(DialectNotSupported):
+                    query_cls.from_("abc").select("foo").export_to("/tmp/abc.csv")
+
     def test_pipe(self) -> None:
         base_query = Query.from_("test")
 
@@ -240,3 +246,109 @@ class QueryBuilderTests(unittest.TestCase):
             result_str,
             'SELECT "test1","test2" FROM "test" WHERE "date">NOW()-1',
         )
+
+
+class HintTests(unittest.TestCase):
+    table_abc = Tables("abc")[0]
+
+    def test_hints_not_supported(self):
+        with self.assertRaises(DialectNotSupported):
+            Query.from_(self.table_abc).select("foo").hint(Hint("FULL", self.table_abc))
+
+    def test_hint_sql(self):
+        aliased = self.table_abc.as_("a")
+
+        self.assertEqual("INDEX(a ix_foo)", str(Hint("INDEX", aliased, "ix_foo")))
+        self.assertEqual("INDEX(abc ix_foo)", str(Hint("INDEX", self.table_abc, "ix_foo")))
+        self.assertEqual("APPEND", str(Hint("APPEND")))
+
+    def test_hint_on_subquery_requires_alias(self):
+        with self.assertRaises(QueryException):
+            str(Hint("NO_MERGE", Query.from_(self.table_abc).select("foo")))
+
+
+class TimeoutTests(unittest.TestCase):
+    table_abc = Tables("abc")[0]
+
+    def test_timeout_statements(self):
+        q = PostgreSQLQuery.from_(self.table_abc).select("foo")
+
+        # The timeout only applies to the current transaction
+        self.assertEqual(["SET LOCAL statement_timeout=1500", str(q)], q.timeout(1500).get_statements())
+        self.assertEqual(str(q), str(q.timeout(1500)))
+
+    def test_session_timeout_is_reset(self):
+        for query_cls, statement, reset in (
+            (RedshiftQuery, "SET statement_timeout TO 1500", "RESET statement_timeout"),
+            (
+                SnowflakeQuery,
+                "ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS=2",
+                "ALTER SESSION UNSET STATEMENT_TIMEOUT_IN_SECONDS",
+            ),
+            (VerticaQuery, "SET SESSION RUNTIMECAP '1500 milliseconds'", "SET SESSION RUNTIMECAP DEFAULT"),
+        ):
+            with self.subTest(query_cls.__name__):
+                q = query_cls.from_(self.table_abc).select("foo")
+
+                self.assertEqual([statement, str(q), reset], q.timeout(1500).get_statements())
+                self.assertEqual(str(q), str(q.timeout(1500)))
+
+    def test_no_timeout(self):
+        q = PostgreSQLQuery.from_(self.table_abc).select("foo")
+
+        self.assertEqual(['SELECT "foo" FROM "abc"'], q.get_statements())
+
+    def test_timeout_not_supported(self):
+        for query_cls in (Query, MSSQLQuery, OracleQuery, SQLLiteQuery):
+            with self.subTest(query_cls.__name__):
+                with self.assertRaises(DialectNotSupported):
+                    query_cls.from_(self.table_abc).select("foo").timeout(1000)
+
+    def test_invalid_timeout(self):
+        for milliseconds in (0, -1, 1.5, True):
+            with self.subTest(milliseconds):
+                with self.assertRaises(QueryException):
+                    PostgreSQLQuery.from_(self.table_abc).select("foo").timeout(milliseconds)
+
+
+class ExplainTests(unittest.TestCase):
+    table_abc = Tables("abc")[0]
+
+    def test_explain(self):
+        for query_cls in (RedshiftQuery, VerticaQuery):
+            with self.subTest(query_cls.__name__):
+                q = query_cls.from_(self.table_abc).select("foo")
+
+                self.assertEqual('EXPLAIN SELECT "foo" FROM "abc"', str(q.explain()))
+
+    def test_explain_not_supported(self):
+        for query_cls in (Query, MSSQLQuery):
+            with self.subTest(query_cls.__name__):
+                with self.assertRaises(DialectNotSupported):
+                    query_cls.from_(self.table_abc).select("foo").explain()
+
+    def test_explain_analyze_not_supported(self):
+        with self.assertRaises(DialectNotSupported):
+            RedshiftQuery.from_(self.table_abc).select("foo").explain(analyze=True)
+
+    def test_explain_format_not_supported(self):
+        for query_cls in (RedshiftQuery, VerticaQuery):
+            with self.subTest(query_cls.__name__):
+                with self.assertRaises(DialectNotSupported):
+                    query_cls.from_(self.table_abc).select("foo").explain(format="text")
+
+
+class EstimateTests(unittest.TestCase):
+    table_abc = Tables("abc")[0]
+
+    def test_estimate_count_not_supported(self):
+        for query_cls in (Query, SQLLiteQuery, RedshiftQuery):
+            with self.subTest(query_cls.__name__):
+                with self.assertRaises(DialectNotSupported):
+                    query_cls.estimate_count(self.table_abc)
+
+    def test_estimate_not_supported(self):
+        for query_cls in (Query, OracleQuery, SQLLiteQuery):
+            with self.subTest(query_cls.__name__):
+                with self.assertRaises(DialectNotSupported):
+                    query_cls.from_(self.table_abc).select("foo").estimate()
@@ -1,3 +1,4 @@
+import sqlite3
 import unittest
 from datetime import date
 from enum import Enum
@@ -7,6 +8,7 @@ from pypika import (
     AliasedQuery,
     Case,
     ClickHouseQuery,
+    DialectNotSupported,
     EmptyCriterion,
     Index,
     MSSQLQuery,
@@ -14,6 +16,7 @@ from pypika import (
     NullValue,
     OracleQuery,
     Order,
+    Parameter,
     PostgreSQLQuery,
     Query,
     QueryException,
@@ -1393,3 +1396,355 @@ class QuoteTests(unittest.TestCase):
             "SELECT t1.value FROM table1 t1 " "JOIN table2 t2 ON t1.Value " "BETWEEN t2.start AND t2.end",
             query.get_sql(quote_char=None),
         )
+
+
+class KeysetPaginationTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_first_page(self):
+        paginator = Query.from_(self.table_abc).select("id", "foo").keyset_paginate(["foo", "id"], 100)
+
+        self.assertEqual(
+            'SELECT "id","foo" FROM "abc" ORDER BY "foo" ASC,"id" ASC LIMIT 100', str(paginator.first_page())
+        )
+
+    def test_next_page_row_value_comparison(self):
+        paginator = (
+            Query.from_(self.table_abc)
+            .select("id", "foo")
+            .where(self.table_abc.bar == 1)
+            .keyset_paginate([self.table_abc.foo, self.table_abc.id], 100)
+        )
+
+        self.assertEqual(
+            'SELECT "id","foo" FROM "abc" WHERE "bar"=1 AND ("foo","id")>(?,?) ORDER BY "foo" ASC,"id" ASC LIMIT 100',
+            str(paginator.next_page([Parameter("?"), Parameter("?")])),
+        )
+
+    def test_next_page_descending(self):
+        paginator = (
+            Query.from_(self.table_abc).select("id").keyset_paginate([("foo", Order.desc), ("id", Order.desc)], 10)
+        )
+
+        self.assertEqual(
+            'SELECT "id" FROM "abc" WHERE ("foo","id")<(\'x\',3) ORDER BY "foo" DESC,"id" DESC LIMIT 10',
+            str(paginator.next_page(["x", 3])),
+        )
+
+    def test_next_page_mixed_directions(self):
+        paginator = Query.from_(self.table_abc).select("id").keyset_paginate([("foo", Order.desc), "bar", "id"], 10)
+
+        self.assertEqual(
+            'SELECT "id" FROM "abc" WHERE "foo"<1 OR ("foo"=1 AND "bar">2) OR ("foo"=1 AND "bar"=2 AND "id">3) '
+            'ORDER BY "foo" DESC,"bar" ASC,"id" ASC LIMIT 10',
+            str(paginator.next_page([1, 2, 3])),
+        )
+
+    def test_next_page_single_field(self):
+        paginator = Query.from_(self.table_abc).select("id").keyset_paginate(["id"], 10)
+
+        self.assertEqual(
+            'SELECT "id" FROM "abc" WHERE "id">3 ORDER BY "id" ASC LIMIT 10', str(paginator.next_page([3]))
+        )
+
+    def test_next_page_without_row_values(self):
+        paginator = OracleQuery.from_(self.table_abc).select("id").keyset_paginate(["foo", "id"], 10)
+
+        self.assertEqual(
+            'SELECT id FROM abc WHERE foo>1 OR (foo=1 AND id>2) ORDER BY foo ASC,id ASC FETCH NEXT 10 ROWS ONLY',
+            str(paginator.next_page([1, 2])),
+        )
+
+    def test_pages(self):
+        connection = sqlite3.connect(":memory:")
+        connection.execute('CREATE TABLE "abc" ("id" INTEGER PRIMARY KEY, "foo" INTEGER)')
+        connection.executemany('INSERT INTO "abc" VALUES (?,?)', [(i, i % 2) for i in range(7)])
+        queries = []
+
+        def fetch(query):
+            queries.append(str(query))
+            return connection.execute(str(query)).fetchall()
+
+        paginator = SQLLiteQuery.from_(self.table_abc).select("id", "foo").keyset_paginate(["foo", "id"], 3)
+
+        self.assertEqual(
+            [[(0, 0), (2, 0), (4, 0)], [(6, 0), (1, 1), (3, 1)], [(5, 1)]],
+            list(paginator.pages(fetch)),
+        )
+        self.assertEqual(
+            'SELECT "id","foo" FROM "abc" WHERE ("foo","id")>(1,3) ORDER BY "foo" ASC,"id" ASC LIMIT 3', queries[-1]
+        )
+        connection.close()
+
+    def test_key(self):
+        paginator = (
+            Query.from_(self.table_abc).select("foo", self.table_abc.bar.as_("b")).keyset_paginate(["b", "foo"], 3)
+        )
+
+        self.assertEqual((2, 1), paginator.key((1, 2)))
+        self.assertEqual((2, 1), paginator.key({"foo": 1, "b": 2}))
+
+        with self.assertRaises(QueryException):
+            Query.from_(self.table_abc).select("foo").keyset_paginate(["id"], 3).key((1,))
+
+    def test_next_page_select_alias(self):
+        paginator = (
+            Query.from_(self.table_abc).select("foo", self.table_abc.bar.as_("b")).keyset_paginate(["b", "foo"], 3)
+        )
+
+        self.assertEqual(
+            'SELECT "foo","bar" "b" FROM "abc" WHERE ("bar","foo")>(2,1) ORDER BY "b" ASC,"foo" ASC LIMIT 3',
+            str(paginator.next_page(paginator.key((1, 2)))),
+        )
+
+    def test_unresolved_order_field_raises_exception(self):
+        table_efg = Table("efg")
+        q = Query.from_(self.table_abc).join(table_efg).on(self.table_abc.efg_id == table_efg.id).select("id")
+
+        with self.assertRaises(QueryException):
+            q.keyset_paginate(["id"], 10)
+
+    def test_invalid_pagination(self):
+        with self.assertRaises(QueryException):
+            Query.from_(self.table_abc).select("id").orderby("id").keyset_paginate(["id"], 10)
+
+        with self.assertRaises(QueryException):
+            Query.from_(self.table_abc).select("id").keyset_paginate(["id"], 0)
+
+        with self.assertRaises(QueryException):
+            Query.from_(self.table_abc).select("id").keyset_paginate(["foo", "id"], 10).next_page([1])
+
+
+class PartitionTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_partition_by_range(self):
+        queries = (
+            Query.from_(self.table_abc)
+            .select("foo")
+            .where(self.table_abc.bar == 1)
+            .partition_by_range("id", [None, 100, 200, None])
+        )
+
+        self.assertEqual(
+            [
+                'SELECT "foo" FROM "abc" WHERE "bar"=1 AND "id"<100',
+                'SELECT "foo" FROM "abc" WHERE "bar"=1 AND "id">=100 AND "id"<200',
+                'SELECT "foo" FROM "abc" WHERE "bar"=1 AND "id">=200',
+            ],
+            [str(query) for query in queries],
+        )
+
+    def test_partition_by_range_requires_two_bounds(self):
+        with self.assertRaises(QueryException):
+            Query.from_(self.table_abc).select("foo").partition_by_range("id", [100])
+
+    def test_partition_by_hash(self):
+        for query_cls, bucket in (
+            (MySQLQuery, "MOD(CRC32(`id`),3)=2"),
+            (PostgreSQLQuery, 'ABS(MOD(hashtext(CAST("id" AS TEXT)),3))=2'),
+            (RedshiftQuery, 'ABS(MOD(FNV_HASH("id"),3))=2'),
+            (ClickHouseQuery, 'MOD(cityHash64("id"),3)=2'),
+            (MSSQLQuery, 'ABS((CHECKSUM("id")%3))=2'),
+            (OracleQuery, "ORA_HASH(id,2)=2"),
+            (VerticaQuery, 'ABS(MOD(HASH("id"),3))=2'),
+        ):
+            with self.subTest(query_cls.__name__):
+                queries = query_cls.from_(self.table_abc).select("foo").partition_by_hash(self.table_abc.id, 3)
+
+                self.assertEqual(3, len(queries))
+                self.assertTrue(str(queries[2]).endswith(" WHERE " + bucket), str(queries[2]))
+
+    def test_partition_by_hash_not_supported(self):
+        with self.assertRaises(DialectNotSupported):
+            SQLLiteQuery.from_(self.table_abc).select("foo").partition_by_hash("id", 3)
+
+    def test_partitions_of_mutable_query(self):
+        query = Query.from_(self.table_abc, immutable=False).select("foo")
+
+        queries = query.partition_by_range("id", [0, 10, 20])
+
+        self.assertEqual('SELECT "foo" FROM "abc"', str(query))
+        self.assertEqual('SELECT "foo" FROM "abc" WHERE "id">=10 AND "id"<20', str(queries[1]))
+
+
+class CountQueryTests(unittest.TestCase):
+    table_abc, table_efg = Tables("abc", "efg")
+
+    def test_drops_ordering_and_pagination(self):
+        q = (
+            Query.from_(self.table_abc)
+            .select("foo", "bar")
+            .where(self.table_abc.foo == 1)
+            .orderby("bar")
+            .limit(10)
+            .offset(20)
+        )
+
+        self.assertEqual('SELECT COUNT(*) FROM "abc" WHERE "foo"=1', str(q.count_query()))
+        self.assertEqual('SELECT "foo","bar" FROM "abc" WHERE "foo"=1 ORDER BY "bar" LIMIT 10 OFFSET 20', str(q))
+
+    def test_select_star(self):
+        q = Query.from_(self.table_abc).select("*")
+
+        self.assertEqual('SELECT COUNT(*) FROM "abc"', str(q.count_query()))
+
+    def test_keeps_left_joins_which_may_repeat_rows(self):
+        q = (
+            Query.from_(self.table_abc)
+            .left_join(self.table_efg)
+            .on(self.table_abc.efg_id == self.table_efg.id)
+            .select(self.table_abc.foo, self.table_efg.bar)
+        )
+
+        self.assertEqual(
+            'SELECT COUNT(*) FROM "abc" LEFT JOIN "efg" ON "abc"."efg_id"="efg"."id"', str(q.count_query())
+        )
+        self.assertEqual('SELECT COUNT(*) FROM "abc"', str(q.count_query(unique_left_joins=True)))
+
+    def test_keeps_filtering_joins(self):
+        q = (
+            Query.from_(self.table_abc)
+            .left_join(self.table_efg)
+            .on(self.table_abc.efg_id == self.table_efg.id)
+            .select(self.table_abc.foo)
+            .where(self.table_efg.bar.isnull())
+        )
+
+        self.assertEqual(
+            'SELECT COUNT(*) FROM "abc" LEFT JOIN "efg" ON "abc"."efg_id"="efg"."id" WHERE "efg"."bar" IS NULL',
+            str(q.count_query(unique_left_joins=True)),
+        )
+
+        q = Query.from_(self.table_abc).join(self.table_efg).on(self.table_abc.efg_id == self.table_efg.id).select("*")
+
+        self.assertEqual(
+            'SELECT COUNT(*) FROM "abc" JOIN "efg" ON "abc"."efg_id"="efg"."id"',
+            str(q.count_query(unique_left_joins=True)),
+        )
+
+    def test_distinct(self):
+        q = (
+            Query.from_(self.table_abc)
+            .left_join(self.table_efg)
+            .on(self.table_abc.efg_id == self.table_efg.id)
+            .select(self.table_abc.foo)
+            .distinct()
+            .orderby(self.table_abc.foo)
+        )
+
+        self.assertEqual('SELECT COUNT(*) FROM (SELECT DISTINCT "foo" FROM "abc") "sq0"', str(q.count_query()))
+
+    def test_distinct_keeps_left_joins_used_by_subqueries(self):
+        table_hij = Table("hij")
+        subquery = Query.from_(table_hij).select(table_hij.id).where(table_hij.foo == self.table_efg.bar)
+        q = (
+            Query.from_(self.table_abc)
+            .left_join(self.table_efg)
+            .on(self.table_abc.efg_id == self.table_efg.id)
+            .select(self.table_abc.foo)
+            .where(self.table_abc.id.isin(subquery))
+            .distinct()
+        )
+
+        self.assertEqual(
+            'SELECT COUNT(*) FROM (SELECT DISTINCT "abc"."foo" FROM "abc" '
+            'LEFT JOIN "efg" ON "abc"."efg_id"="efg"."id" '
+            'WHERE "abc"."id" IN (SELECT "hij"."id" FROM "hij" WHERE "hij"."foo"="efg"."bar")) "sq0"',
+            str(q.count_query()),
+        )
+
+    def test_group_by(self):
+        q = (
+            Query.from_(self.table_abc)
+            .left_join(self.table_efg)
+            .on(self.table_abc.efg_id == self.table_efg.id)
+            .select(self.table_abc.foo, fn.Sum(self.table_efg.bar))
+            .groupby(self.table_abc.foo)
+        )
+
+        self.assertEqual('SELECT COUNT(*) FROM (SELECT 1 "one" FROM "abc" GROUP BY "foo") "sq0"', str(q.count_query()))
+
+    def test_group_by_having(self):
+        q = (
+            Query.from_(self.table_abc)
+            .select(self.table_abc.foo, fn.Count("*").as_("n"))
+            .groupby(self.table_abc.foo)
+            .having(fn.Count("*") > 1)
+        )
+
+        self.assertEqual(
+            'SELECT COUNT(*) FROM (SELECT 1 "one" FROM "abc" GROUP BY "foo" HAVING COUNT(*)>1) "sq0"',
+            str(q.count_query()),
+        )
+
+    def test_group_by_having_keeps_left_joins(self):
+        q = (
+            Query.from_(self.table_abc)
+            .left_join(self.table_efg)
+            .on(self.table_abc.efg_id == self.table_efg.id)
+            .select(self.table_abc.foo)
+            .groupby(self.table_abc.foo)
+            .having(fn.Count("*") > 1)
+        )
+
+        self.assertEqual(
+            'SELECT COUNT(*) FROM (SELECT 1 "one" FROM "abc" LEFT JOIN "efg" ON "abc"."efg_id"="efg"."id" '
+            'GROUP BY "abc"."foo" HAVING COUNT(*)>1) "sq0"',
+            str(q.count_query()),
+        )
+
+    def test_having_on_select_alias_keeps_selects(self):
+        q = (
+            Query.from_(self.table_abc)
+            .select(self.table_abc.foo, fn.Count("*").as_("n"))
+            .groupby(self.table_abc.foo)
+            .having(F("n") > 1)
+        )
+
+        self.assertEqual(
+            'SELECT COUNT(*) FROM (SELECT "foo",COUNT(*) "n" FROM "abc" GROUP BY "foo" HAVING "n">1) "sq0"',
+            str(q.count_query()),
+        )
+
+    def test_aggregate(self):
+        q = Query.from_(self.table_abc).select(fn.Max(self.table_abc.foo).as_("m"))
+
+        self.assertEqual('SELECT COUNT(*) FROM (SELECT MAX("foo") "m" FROM "abc") "sq0"', str(q.count_query()))
+
+    def test_with(self):
+        q = (
+            Query.with_(Query.from_(self.table_efg).select("foo"), "cte")
+            .from_(AliasedQuery("cte"))
+            .select("foo")
+            .distinct()
+        )
+
+        self.assertEqual(
+            'WITH cte AS (SELECT "foo" FROM "efg") SELECT COUNT(*) FROM (SELECT DISTINCT "cte"."foo" FROM cte) "sq0"',
+            str(q.count_query()),
+        )
+
+    def test_dialects(self):
+        with self.subTest("TOP"):
+            q = MSSQLQuery.from_(self.table_abc).select("foo").top(10)
+
+            self.assertEqual('SELECT COUNT(*) FROM "abc"', str(q.count_query()))
+
+        with self.subTest("DISTINCT ON"):
+            q = PostgreSQLQuery.from_(self.table_abc).distinct_on("foo").select("foo", "bar").orderby("foo")
+
+            self.assertEqual(
+                'SELECT COUNT(*) FROM (SELECT DISTINCT ON("foo") "foo","bar" FROM "abc") "sq0"', str(q.count_query())
+            )
+
+        with self.subTest("LIMIT BY"):
+            q = ClickHouseQuery.from_(self.table_abc).select("foo").limit_by(1, "foo")
+
+            self.assertEqual(
+                'SELECT COUNT(*) FROM (SELECT "foo" FROM "abc" LIMIT 1 BY ("foo")) AS "sq0"', str(q.count_query())
+            )
+
+    def test_only_select_queries(self):
+        with self.assertRaises(QueryException):
+            Query.from_(self.table_abc).delete().count_query()
@@ -1,6 +1,7 @@
+import sqlite3
 import unittest
 
-from pypika import SYSTEM_TIME, AliasedQuery, PostgreSQLQuery, Query, SQLLiteQuery, Table
+from pypika import SYSTEM_TIME, AliasedQuery, PostgreSQLQuery, Query, QueryException, SQLLiteQuery, Table
 from pypika.terms import Star
 
 __author__ = "Timothy Heys"
@@ -159,3 +160,107 @@ class SQLLiteUpdateTests(unittest.TestCase):
         q = SQLLiteQuery.update(self.table_abc).set(self.table_abc.foo, True)
 
         self.assertEqual('UPDATE "abc" SET "foo"=1', str(q))
+
+
+class UpdateFromValuesTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_update_from_values(self):
+        queries = Query.update_from_values(self.table_abc, ["id"], ["name", "age"], [(1, "a", 20), (2, "b", None)])
+
+        self.assertEqual(
+            [
+                'UPDATE "abc" SET "name"="v"."name","age"="v"."age" '
+                'FROM (VALUES (1,\'a\',20),(2,\'b\',null)) AS "v"("id","name","age") WHERE "abc"."id"="v"."id"'
+            ],
+            [str(q) for q in queries],
+        )
+
+    def test_composite_key(self):
+        q = Query.update(self.table_abc).set_from_values(["id", "day"], ["hits"], [(1, "2024-01-01", 3)], alias="n")
+
+        self.assertEqual(
+            'UPDATE "abc" SET "hits"="n"."hits" FROM (VALUES (1,\'2024-01-01\',3)) AS "n"("id","day","hits") '
+            'WHERE "abc"."id"="n"."id" AND "abc"."day"="n"."day"',
+            str(q),
+        )
+
+    def test_chunked_by_rows(self):
+        queries = Query.update_from_values(self.table_abc, ["id"], ["name"], [(i, "x") for i in range(5)], max_rows=2)
+
+        self.assertEqual(3, len(queries))
+        self.assertIn("(VALUES (4,'x'))", str(queries[-1]))
+
+    def test_chunked_by_size(self):
+        rows = [(i, "x" * 100) for i in range(10)]
+
+        queries = Query.update_from_values(self.table_abc, ["id"], ["name"], rows, max_size=250)
+
+        self.assertEqual(5, len(queries))
+
+    def test_sqlite_uses_union_all(self):
+        q = SQLLiteQuery.update(self.table_abc).set_from_values(["id"], ["name"], [(1, "a"), (2, "b")])
+
+        self.assertEqual(
+            'UPDATE "abc" SET "name"="v"."name" FROM (SELECT 1 AS "id",\'a\' AS "name" UNION ALL SELECT 2,\'b\') "v" '
+            'WHERE "abc"."id"="v"."id"',
+            str(q),
+        )
+
+    def test_invalid_rows_raise_exception(self):
+        with self.assertRaises(QueryException):
+            Query.update(self.table_abc).set_from_values(["id"], ["name"], [])
+        with self.assertRaises(QueryException):
+            Query.update(self.table_abc).set_from_values(["id"], ["name"], [(1,)])
+        with self.assertRaises(QueryException):
+            Query.from_(self.table_abc).set_from_values(["id"], ["name"], [(1, "a")])
+
+
+class ChunkedUpdateTests(unittest.TestCase):
+    table_abc = Table("abc")
+
+    def test_chunks(self):
+        chunks = Query.update(self.table_abc).set("bar", 2).where(self.table_abc.foo == 1).iter_chunks("id", 100)
+
+        self.assertEqual('SELECT "id" FROM "abc" WHERE "foo"=1 ORDER BY "id" LIMIT 1 OFFSET 99', str(chunks.boundary()))
+        self.assertEqual(
+            'SELECT "id" FROM "abc" WHERE "foo"=1 AND "id">7 ORDER BY "id" LIMIT 1 OFFSET 99', str(chunks.boundary(7))
+        )
+        self.assertEqual('UPDATE "abc" SET "bar"=2 WHERE "foo"=1 AND "id"<=7', str(chunks.chunk(upto=7)))
+        self.assertEqual('UPDATE "abc" SET "bar"=2 WHERE "foo"=1 AND "id">7 AND "id"<=9', str(chunks.chunk(7, 9)))
+        self.assertEqual('UPDATE "abc" SET "bar"=2 WHERE "foo"=1 AND "id">9', str(chunks.chunk(9)))
+
+    def test_updates_are_not_repeated(self):
+        with self.assertRaises(QueryException):
+            Query.update(self.table_abc).set("bar", 2).iter_chunks("id", 100).statement()
+
+    def test_run(self):
+        connection = sqlite3.connect(":memory:")
+        connection.execute('CREATE TABLE "abc" ("id" INTEGER PRIMARY KEY, "foo" INTEGER, "bar" INTEGER)')
+        connection.executemany('INSERT INTO "abc" VALUES (?,?,0)', [(i, i % 2) for i in range(25)])
+        statements = []
+
+        def execute(statement):
+            statements.append(str(statement))
+            return connection.execute(str(statement)).rowcount
+
+        chunks = SQLLiteQuery.update(self.table_abc).set("bar", 2).where(self.table_abc.foo == 1).iter_chunks("id", 5)
+        total = chunks.run(execute, fetch=lambda query: connection.execute(str(query)).fetchall())
+
+        self.assertEqual(12, total)
+        self.assertEqual(
+            [
+                'UPDATE "abc" SET "bar"=2 WHERE "foo"=1 AND "id"<=9',
+                'UPDATE "abc" SET "bar"=2 WHERE "foo"=1 AND "id">9 AND "id"<=19',
+                'UPDATE "abc" SET "bar"=2 WHERE "foo"=1 AND "id">19',
+            ],
+            statements,
+        )
+        self.assertEqual(12, connection.execute('SELECT COUNT(*) FROM "abc" WHERE "bar"=2').fetchone()[0])
+        connection.close()
+
+    def test_run_requires_fetch(self):
+        chunks = Query.update(self.table_abc).set("bar", 2).iter_chunks("id", 100)
+
+        with self.assertRaises(QueryException):
+            chunks.run(lambda statement: 0)